@@ -0,0 +1,110 @@
+"""
+Memory per state and update throughput of the array-backed Q-table against the previous
+dict-of-arrays layout, plus the throughput of batched updates and replay.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/q_table_benchmark.py --states 200000 --actions 4
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from agents.q_table import QTable
+from agents.reinforcement_learning_agent import ReinforcementLearningAgent
+
+
+class DictQAgent:
+    """The previous layout: one np.zeros(action_space) array per state in a dict."""
+
+    def __init__(self, action_space, learning_rate=0.1, discount_factor=0.9):
+        self.q_table = {}
+        self.action_space = action_space
+        self.learning_rate = learning_rate
+        self.discount_factor = discount_factor
+
+    def update_q_value(self, state, action, reward, next_state):
+        for s in (state, next_state):
+            if s not in self.q_table:
+                self.q_table[s] = np.zeros(self.action_space)
+        best_next_action = np.argmax(self.q_table[next_state])
+        td_target = reward + self.discount_factor * self.q_table[next_state][best_next_action]
+        self.q_table[state][action] += self.learning_rate * (td_target - self.q_table[state][action])
+
+
+def bytes_per_state(fill, n_states: int) -> float:
+    tracemalloc.start()
+    store = fill()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del store
+    return current / n_states
+
+
+def updates_per_second(agent, states, actions, rewards) -> float:
+    start = time.perf_counter()
+    for s, a, r in zip(states[:-1], actions, rewards):
+        agent.update_q_value(s, a, r, s + 1)
+    return len(actions) / (time.perf_counter() - start)
+
+
+def batch_updates_per_second(agent, states, actions, rewards, batch_size: int) -> float:
+    states, actions, rewards = np.asarray(states), np.asarray(actions), np.asarray(rewards)
+    start = time.perf_counter()
+    for i in range(0, len(actions), batch_size):
+        end = min(i + batch_size, len(actions))
+        agent.update_batch(states[i:end], actions[i:end], rewards[i:end], states[i + 1:end + 1])
+    return len(actions) / (time.perf_counter() - start)
+
+
+def replay_updates_per_second(agent, batch_size: int, batches: int) -> float:
+    start = time.perf_counter()
+    for _ in range(batches):
+        agent.replay(batch_size)
+    return batch_size * batches / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--states", type=int, default=200000)
+    parser.add_argument("--actions", type=int, default=4)
+    parser.add_argument("--updates", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    def fill_dict():
+        return {s: np.zeros(args.actions) for s in range(args.states)}
+
+    def fill_table(dtype):
+        table = QTable(args.actions, dtype=dtype)
+        for s in range(args.states):
+            table.intern(s)
+        return table
+
+    rng = np.random.default_rng(0)
+    states = rng.integers(0, args.states, args.updates + 1).tolist()
+    actions = rng.integers(0, args.actions, args.updates).tolist()
+    rewards = rng.normal(size=args.updates).tolist()
+
+    print(f"{args.states} states, {args.actions} actions, {args.updates} updates")
+    print(f"{'layout':<24}{'bytes/state':>14}{'updates/s':>14}")
+    rows = [
+        ("dict of arrays", fill_dict, DictQAgent(args.actions)),
+        ("QTable float64", lambda: fill_table(np.float64), ReinforcementLearningAgent(action_space=args.actions)),
+        ("QTable float32", lambda: fill_table(np.float32),
+         ReinforcementLearningAgent(action_space=args.actions, dtype=np.float32)),
+    ]
+    for label, fill, agent in rows:
+        size = bytes_per_state(fill, args.states)
+        rate = updates_per_second(agent, states, actions, rewards)
+        print(f"{label:<24}{size:>14.1f}{rate:>14.0f}")
+
+    agent = ReinforcementLearningAgent(action_space=args.actions, replay_capacity=args.updates)
+    rate = batch_updates_per_second(agent, states, actions, rewards, args.batch_size)
+    print(f"{'update_batch':<24}{'':>14}{rate:>14.0f}")
+    rate = replay_updates_per_second(agent, args.batch_size, max(args.updates // args.batch_size, 1))
+    print(f"{'replay':<24}{'':>14}{rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Bytes per circuit and encode/decode throughput of the binary wire format against pickle and QPY.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/wire_format_benchmark.py --qubits 8 --reps 3 --circuits 1000
+
+Qiskit is optional: without it, the Qiskit pickle and QPY rows are skipped.
+"""
+import argparse
+import io
+import pickle
+import time
+import numpy as np
+from quantum.circuit_ops import num_parameter_slots, ops_to_circuit, two_local_ops
+from quantum.wire_format import WireDecoder, decode, encode_ops, encode_parameters, template_id
+
+
+def bind(ops: list, row: np.ndarray) -> list:
+    """Fills the free slots of ``ops`` with ``row``."""
+    values = iter(row.tolist())
+    return [(name, qubits, tuple(next(values) if p is None else p for p in params)) for name, qubits, params in ops]
+
+
+def measure(label: str, encode, decode_one, count: int) -> None:
+    start = time.perf_counter()
+    messages = encode()
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    for message in messages:
+        decode_one(message)
+    decoded = time.perf_counter() - start
+    size = sum(len(m) for m in messages) / count
+    print(f"{label:<28}{size:>12.1f}{count / encoded:>16.0f}{count / decoded:>16.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--qubits", type=int, default=8)
+    parser.add_argument("--reps", type=int, default=3)
+    parser.add_argument("--circuits", type=int, default=1000)
+    args = parser.parse_args()
+
+    template = two_local_ops(args.qubits, args.reps)
+    template += [("measure", (q,), (q,)) for q in range(args.qubits)]
+    parameters = np.random.default_rng(0).uniform(-np.pi, np.pi, (args.circuits, num_parameter_slots(template)))
+    bound = [bind(template, row) for row in parameters]
+    count = args.circuits
+
+    print(f"{args.circuits} TwoLocal circuits, {args.qubits} qubits, reps={args.reps}, {len(template)} ops")
+    print(f"{'format':<28}{'bytes/circuit':>12}{'encodes/s':>16}{'decodes/s':>16}")
+    measure("pickle (ops)", lambda: [pickle.dumps(ops) for ops in bound], pickle.loads, count)
+    for dtype in (np.float64, np.float32):
+        name = np.dtype(dtype).name
+        measure(f"wire {name}", lambda: [encode_ops(ops, args.qubits, dtype=dtype) for ops in bound], decode, count)
+
+        identifier = template_id(template, args.qubits)
+        decoder = WireDecoder()
+        decoder.decode(encode_ops(template, args.qubits, dtype=dtype))
+        measure(f"wire {name} template", lambda: [encode_parameters(identifier, row, dtype) for row in parameters],
+                decoder.decode, count)
+        measure(f"wire {name} batch", lambda: [encode_ops(template, args.qubits, parameters, dtype)], decode, count)
+
+    try:
+        from qiskit import qpy
+        circuits = [ops_to_circuit(ops, args.qubits) for ops in bound]
+    except ImportError:
+        print("qiskit not installed: skipping QuantumCircuit pickle and QPY")
+        return
+
+    def qpy_dump(circuit):
+        buffer = io.BytesIO()
+        qpy.dump(circuit, buffer)
+        return buffer.getvalue()
+
+    measure("pickle (QuantumCircuit)", lambda: [pickle.dumps(c) for c in circuits], pickle.loads, count)
+    measure("qpy", lambda: [qpy_dump(c) for c in circuits], lambda m: qpy.load(io.BytesIO(m)), count)
+
+
+if __name__ == "__main__":
+    main()
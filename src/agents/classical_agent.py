@@ -1,9 +1,24 @@
+import numpy as np
 from ml.hybrid_models import ClassicalModel
 from agents.base_agent import BaseAgent
+from agents.micro_batcher import MicroBatcher
 
 class ClassicalAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, micro_batching: bool = False, max_batch_size: int = 64, max_latency_ms: float = 2.0):
+        """
+        :param micro_batching: Route concurrent ``make_decision`` calls through a MicroBatcher,
+                               so they share one vectorized ``predict``.
+        :param max_batch_size: Largest micro-batch.
+        :param max_latency_ms: Longest time a call waits for others to join its micro-batch.
+        """
         self.model = ClassicalModel()
+        self.batcher = MicroBatcher(self.make_decisions, max_batch_size, max_latency_ms) if micro_batching else None
+
+    def make_decisions(self, batch) -> np.ndarray:
+        """Makes one decision per row of an (n_rows, n_features) batch with a single model call."""
+        return np.asarray(self.model.predict(np.atleast_2d(np.asarray(batch, dtype=float))))
 
     def make_decision(self, input_data: list) -> float:
-        return self.model.predict(input_data)
\ No newline at end of file
+        if self.batcher is not None:
+            return self.batcher.predict(input_data)
+        return self.make_decisions(input_data)[0]
@@ -3,25 +3,41 @@ from solana.publickey import PublicKey
 from solana.transaction import Transaction
 from solana.system_program import TransferParams, transfer
 import logging
+from agents.dao_event_log import DAOEventLog
+from agents.vote_ledger import VoteLedger
 
 logger = logging.getLogger(__name__)
 
 class DAOAgent:
-    def __init__(self, rpc_url: str, dao_name: str, owner_key: str):
+    def __init__(self, rpc_url: str, dao_name: str, owner_key: str, quorum: float = 0.5, state_dir: str = None):
         """
         Initializes a DAOAgent with the given parameters.
 
         :param rpc_url: The RPC URL for the Solana cluster.
         :param dao_name: The name of the DAO.
         :param owner_key: The public key of the DAO owner.
+        :param quorum: Fraction of members that must vote for a proposal to reach quorum.
+        :param state_dir: Directory for the local event log and snapshots. When given, members,
+                          proposals and votes are restored from it and every change is persisted.
         """
         self.client = Client(rpc_url)
         self.dao_name = dao_name
         self.owner_key = owner_key
-        self.members = []
-        self.proposals = []
+        self.event_log = DAOEventLog(state_dir) if state_dir else None
+        # Members, proposals and votes
+        self.ledger = self.event_log.restore(quorum) if self.event_log else VoteLedger(quorum)
         logger.info("DAOAgent initialized for DAO: %s", dao_name)
 
+    @property
+    def members(self) -> tuple:
+        """Member public keys, in joining order (a snapshot; use ``add_member`` to change it)."""
+        return tuple(self.ledger.members.keys)
+
+    @property
+    def proposals(self) -> tuple:
+        """Proposal texts, in creation order (a snapshot; use ``propose`` to change it)."""
+        return tuple(self.ledger.proposals)
+
     def create_dao(self):
         """
         Creates a new DAO on the blockchain.
@@ -37,8 +53,7 @@ class DAOAgent:
 
         :param member_key: The public key of the member to add.
         """
-        if member_key not in self.members:
-            self.members.append(member_key)
+        if self.ledger.add_member(member_key):
             logger.info("Added member: %s to DAO: %s", member_key, self.dao_name)
 
     def propose(self, proposal: str):
@@ -46,9 +61,11 @@ class DAOAgent:
         Proposes a new action for the DAO.
 
         :param proposal: The proposal text.
+        :return: The index of the new proposal.
         """
-        self.proposals.append(proposal)
+        proposal_index = self.ledger.add_proposal(proposal)
         logger.info("New proposal added: %s", proposal)
+        return proposal_index
 
     def vote(self, proposal_index: int, member_key: str, vote: bool):
         """
@@ -58,11 +75,57 @@ class DAOAgent:
         :param member_key: The public key of the member voting.
         :param vote: True for 'yes', False for 'no'.
         """
-        if member_key in self.members:
-            # Logic to record the vote
+        if self.ledger.cast_vote(proposal_index, member_key, vote):
             logger.info("Member %s voted %s on proposal %d", member_key, "yes" if vote else "no", proposal_index)
         else:
             logger.warning("Member %s is not part of the DAO: %s", member_key, self.dao_name)
 
+    def ingest_votes(self, proposal_indices, member_keys, votes) -> int:
+        """
+        Records a batch of votes, e.g. read back from the chain.
+
+        :param proposal_indices: One proposal index per vote, or a single index for the whole batch.
+        :param member_keys: The public key of each voting member.
+        :param votes: True for 'yes', False for 'no', one per vote.
+        :return: The number of votes recorded.
+        """
+        return self.ledger.ingest_votes(proposal_indices, member_keys, votes)
+
+    def tally(self, proposal_index: int) -> tuple:
+        """
+        Gets the current vote counts of a proposal.
+
+        :param proposal_index: The index of the proposal.
+        :return: The (yes, no) vote counts.
+        """
+        return self.ledger.tally(proposal_index)
+
+    def has_quorum(self, proposal_index: int) -> bool:
+        """
+        Checks whether enough members have voted on a proposal.
+
+        :param proposal_index: The index of the proposal.
+        :return: True if the proposal has reached quorum.
+        """
+        return self.ledger.has_quorum(proposal_index)
+
+    def compact_state(self) -> str:
+        """
+        Snapshots the DAO state and truncates the event log, keeping restarts fast.
+
+        :return: The path of the new snapshot.
+        """
+        if self.event_log is None:
+            raise RuntimeError("compact_state requires a DAOAgent created with state_dir.")
+        return self.event_log.compact(self.ledger)
+
+    def close(self):
+        """
+        Closes the event log, if any. Later changes to a persisted DAO raise RuntimeError
+        instead of being applied without being logged.
+        """
+        if self.event_log is not None:
+            self.event_log.close()
+
     def mint_token(self, token_name: str, initial_supply: int):
         logger.info(f"Minting token {token_name} with supply {initial_supply}")
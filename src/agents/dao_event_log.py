@@ -0,0 +1,226 @@
+import json
+import logging
+import os
+import re
+import shutil
+import struct
+import zlib
+import numpy as np
+from agents.vote_ledger import VoteLedger
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length, CRC-32 of type and payload, event type
+RECORD = struct.Struct("<IIB")
+MEMBERS_ADDED, PROPOSAL_ADDED, VOTES_APPLIED = 1, 2, 3
+
+SNAPSHOT_PATTERN = re.compile(r"^snapshot-(\d+)$")
+
+
+def _log_name(generation: int) -> str:
+    return f"events-{generation}.log"
+
+
+def _snapshot_name(generation: int) -> str:
+    return f"snapshot-{generation}"
+
+
+def _checksum(event_type: int, payload) -> int:
+    return zlib.crc32(payload, zlib.crc32(bytes([event_type])))
+
+
+def encode_record(event_type: int, payload: bytes) -> bytes:
+    """Frames one event as a length-prefixed, checksummed record."""
+    return RECORD.pack(len(payload), _checksum(event_type, payload), event_type) + payload
+
+
+def encode_strings(strings: list) -> bytes:
+    """Payload of a member batch: each key as a length-prefixed UTF-8 string."""
+    return b"".join(struct.pack("<I", len(data)) + data for data in (string.encode("utf-8") for string in strings))
+
+
+def decode_strings(payload) -> list:
+    """Inverse of ``encode_strings``."""
+    payload, strings, offset = bytes(payload), [], 0
+    while offset < len(payload):
+        length = struct.unpack_from("<I", payload, offset)[0]
+        strings.append(payload[offset + 4:offset + 4 + length].decode("utf-8"))
+        offset += 4 + length
+    return strings
+
+
+def encode_votes(proposals: np.ndarray, members: np.ndarray, codes: np.ndarray) -> bytes:
+    """Payload of a vote batch: count, then proposal indices, member indices and vote codes."""
+    return (struct.pack("<I", len(members)) + np.asarray(proposals, dtype="<u4").tobytes()
+            + np.asarray(members, dtype="<u4").tobytes() + np.asarray(codes, dtype=np.int8).tobytes())
+
+
+def decode_votes(payload) -> tuple:
+    """Inverse of ``encode_votes``; the arrays are views of ``payload``."""
+    n = struct.unpack_from("<I", payload)[0]
+    proposals = np.frombuffer(payload, dtype="<u4", count=n, offset=4)
+    members = np.frombuffer(payload, dtype="<u4", count=n, offset=4 + 4 * n)
+    codes = np.frombuffer(payload, dtype=np.int8, count=n, offset=4 + 8 * n)
+    return proposals, members, codes
+
+
+def read_records(buffer, offset: int = 0):
+    """
+    Yields (event_type, payload, end_offset) for each complete, intact record of ``buffer``.
+    Stops at the first truncated or corrupt record (e.g. a write torn by a crash).
+    """
+    view = memoryview(buffer)
+    while offset + RECORD.size <= len(view):
+        length, checksum, event_type = RECORD.unpack_from(view, offset)
+        end = offset + RECORD.size + length
+        if end > len(view):
+            return
+        payload = view[offset + RECORD.size:end]
+        if _checksum(event_type, payload) != checksum:
+            logger.warning("Corrupt DAO event record at offset %d; ignoring the rest of the log.", offset)
+            return
+        yield event_type, payload, end
+        offset = end
+
+
+def _write_strings(path: str, strings: list) -> None:
+    """Stores strings as one UTF-8 blob plus an offsets array (``path``.bin / ``path``.npy)."""
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    with open(path + ".bin", "wb") as file:
+        file.write(b"".join(encoded))
+    np.save(path + ".npy", offsets)
+
+
+def _read_strings(path: str) -> list:
+    offsets = np.load(path + ".npy").tolist()
+    with open(path + ".bin", "rb") as file:
+        blob = file.read()
+    return [blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+
+class DAOEventLog:
+    def __init__(self, directory: str, sync: bool = False):
+        """
+        Append-only event log and compacted snapshots of a DAO's members, proposals and votes.
+
+        Every change is appended to ``events-<generation>.log`` as a length-prefixed, checksummed
+        record. ``compact`` writes the whole ledger to ``snapshot-<generation + 1>/`` (names,
+        an int8 vote matrix and the tallies as .npy files) and starts a new, empty log. ``restore``
+        memory-maps the latest snapshot and replays only the log written after it.
+        :param directory: Directory holding the log and snapshots (created if missing).
+        :param sync: fsync after every record; otherwise records are flushed to the OS only.
+        """
+        self.directory = directory
+        self.sync = sync
+        self.generation = 0
+        self._file = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _latest_snapshot(self) -> int:
+        """Highest complete snapshot generation, or 0 when there is none."""
+        generations = [int(match.group(1)) for match in map(SNAPSHOT_PATTERN.match, os.listdir(self.directory))
+                       if match and os.path.exists(os.path.join(self.directory, match.group(0), "meta.json"))]
+        return max(generations, default=0)
+
+    def restore(self, quorum: float = 0.5) -> VoteLedger:
+        """
+        Rebuilds the ledger from the latest snapshot plus the log tail and attaches this log to it,
+        so later changes are appended. The vote matrix is mapped copy-on-write, so restore time does
+        not depend on the number of votes. A torn record at the end of the log is truncated.
+        :param quorum: Quorum of the returned ledger.
+        :return: The restored VoteLedger.
+        """
+        self.generation = self._latest_snapshot()
+        if self.generation:
+            path = os.path.join(self.directory, _snapshot_name(self.generation))
+            ledger = VoteLedger.from_arrays(quorum, _read_strings(os.path.join(path, "members")),
+                                            _read_strings(os.path.join(path, "proposals")),
+                                            np.load(os.path.join(path, "votes.npy"), mmap_mode="c"),
+                                            np.load(os.path.join(path, "tallies.npy")))
+        else:
+            ledger = VoteLedger(quorum)
+        log_path = os.path.join(self.directory, _log_name(self.generation))
+        end, replayed = 0, 0
+        if os.path.exists(log_path):
+            with open(log_path, "rb") as file:
+                data = file.read()  # Only the events since the last compaction
+            for event_type, payload, end in read_records(data):
+                self._replay(ledger, event_type, payload)
+                replayed += 1
+            if end < len(data):
+                logger.warning("Truncating %d bytes of incomplete DAO events.", len(data) - end)
+                os.truncate(log_path, end)
+        self._file = open(log_path, "ab")
+        ledger.journal = self
+        logger.info("Restored DAO state (generation %d, %d members, %d proposals, %d events replayed).",
+                    self.generation, len(ledger.members), len(ledger.proposals), replayed)
+        return ledger
+
+    @staticmethod
+    def _replay(ledger: VoteLedger, event_type: int, payload) -> None:
+        if event_type == MEMBERS_ADDED:
+            ledger.add_members(decode_strings(payload))
+        elif event_type == PROPOSAL_ADDED:
+            ledger.add_proposal(bytes(payload).decode("utf-8"))
+        elif event_type == VOTES_APPLIED:
+            proposals, members, codes = decode_votes(payload)
+            ledger.apply_votes(proposals.astype(np.int64), members.astype(np.int64), codes)
+        else:
+            raise ValueError(f"Unknown DAO event type {event_type}.")
+
+    def _append(self, event_type: int, payload: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("DAOEventLog is not open; call restore before events are appended.")
+        self._file.write(encode_record(event_type, payload))
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+
+    # Journal interface called by VoteLedger
+    def members_added(self, member_keys: list) -> None:
+        self._append(MEMBERS_ADDED, encode_strings(member_keys))
+
+    def proposal_added(self, proposal: str) -> None:
+        self._append(PROPOSAL_ADDED, proposal.encode("utf-8"))
+
+    def votes_applied(self, proposals: np.ndarray, members: np.ndarray, codes: np.ndarray) -> None:
+        self._append(VOTES_APPLIED, encode_votes(proposals, members, codes))
+
+    def compact(self, ledger: VoteLedger) -> str:
+        """
+        Writes a snapshot of ``ledger`` and starts a new, empty log; older snapshots and logs are removed.
+
+        The snapshot is written under a temporary name and renamed into place, so a crash leaves
+        either the previous generation (snapshot plus full log) or the new one intact.
+        :return: Path of the new snapshot.
+        """
+        generation = self.generation + 1
+        path = os.path.join(self.directory, _snapshot_name(generation))
+        staging = path + ".tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        _write_strings(os.path.join(staging, "members"), ledger.members.keys)
+        _write_strings(os.path.join(staging, "proposals"), ledger.proposals)
+        np.save(os.path.join(staging, "votes.npy"), ledger.vote_matrix())
+        np.save(os.path.join(staging, "tallies.npy"), ledger.tallies())
+        with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as file:
+            json.dump({"generation": generation, "members": len(ledger.members),
+                       "proposals": len(ledger.proposals)}, file)
+        os.rename(staging, path)
+        if self._file is not None:
+            self._file.close()
+        self._file = open(os.path.join(self.directory, _log_name(generation)), "ab")
+        for old in range(self.generation, -1, -1):
+            shutil.rmtree(os.path.join(self.directory, _snapshot_name(old)), ignore_errors=True)
+            if os.path.exists(os.path.join(self.directory, _log_name(old))):
+                os.remove(os.path.join(self.directory, _log_name(old)))
+        self.generation = generation
+        logger.info("Compacted DAO state into %s.", path)
+        return path
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,19 +1,52 @@
 import numpy as np
 from sklearn.neural_network import MLPClassifier
-from agents.solana_agent import SolanaAgent
 from agents.base_agent import BaseAgent
+from agents.micro_batcher import MicroBatcher
+from ml.model_artifacts import model_registry
 from typing import List
 
 class HybridAgent(BaseAgent):
-    def __init__(self, circuit_size: int, rpc_url: str, hidden_layer_sizes=(10,), max_iter=1000):
+    def __init__(self, circuit_size: int, rpc_url: str, hidden_layer_sizes=(10,), max_iter=1000,
+                 model_path: str = None, model_version: str = None,
+                 micro_batching: bool = False, max_batch_size: int = 64, max_latency_ms: float = 2.0):
         """
         Initializes a HybridAgent with quantum and Solana capabilities.
 
         :param circuit_size: Size of the quantum circuit.
-        :param rpc_url: The RPC URL for the Solana cluster.
+        :param rpc_url: The RPC URL for the Solana cluster (the client is created on first use).
+        :param model_path: Directory of versioned model artifacts (see ``ml.model_artifacts``). The
+                           fitted model is memory-mapped and shared by all agents in the process.
+                           Without it, a fresh untrained MLPClassifier is created.
+        :param model_version: Artifact version to load; the latest when None.
+        :param micro_batching: Route concurrent ``make_decision`` calls through a MicroBatcher,
+                               so they share one vectorized ``predict``.
+        :param max_batch_size: Largest micro-batch.
+        :param max_latency_ms: Longest time a call waits for others to join its micro-batch.
         """
-        self.model = MLPClassifier(hidden_layer_sizes=hidden_layer_sizes, max_iter=max_iter)
-        self.solana_agent = SolanaAgent(rpc_url)
+        if model_path is not None:
+            self.model = model_registry.get(model_path, model_version)
+        else:
+            self.model = MLPClassifier(hidden_layer_sizes=hidden_layer_sizes, max_iter=max_iter)
+        self.rpc_url = rpc_url
+        self._solana_agent = None
+        self.batcher = MicroBatcher(self.make_decisions, max_batch_size, max_latency_ms) if micro_batching else None
+
+    @property
+    def solana_agent(self):
+        """The Solana RPC client, created on first use."""
+        if self._solana_agent is None:
+            from agents.solana_agent import SolanaAgent
+            self._solana_agent = SolanaAgent(self.rpc_url)
+        return self._solana_agent
+
+    def make_decisions(self, batch) -> np.ndarray:
+        """
+        Makes one decision per row with a single vectorized model call.
+
+        :param batch: Array-like of shape (n_rows, n_features).
+        :return: Array of shape (n_rows,) with the decisions.
+        """
+        return self.model.predict(np.atleast_2d(np.asarray(batch, dtype=float)))
 
     def make_decision(self, input_data: List[float]) -> float:
         """
@@ -22,7 +55,9 @@ class HybridAgent(BaseAgent):
         :param input_data: Input data for the classical model.
         :return: The decision made by the hybrid agent.
         """
-        return self.model.predict([input_data])[0]
+        if self.batcher is not None:
+            return self.batcher.predict(input_data)
+        return self.make_decisions([input_data])[0]
 
     def get_balance(self, public_key: str) -> float:
         """
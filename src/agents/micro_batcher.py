@@ -0,0 +1,110 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Queue marker that stops the batching thread
+_CLOSE = object()
+
+
+class MicroBatcher:
+    def __init__(self, predict_batch, max_batch_size: int = 64, max_latency_ms: float = 2.0):
+        """
+        Collects concurrent single-row requests into batches for one vectorized prediction.
+
+        A batch is dispatched once it holds ``max_batch_size`` rows, or ``max_latency_ms`` after its
+        first row arrived, whichever comes first. Under light load a request waits at most
+        ``max_latency_ms``; under heavy load batches fill up and throughput scales with load.
+        :param predict_batch: Callable mapping an (n, n_features) array to n predictions.
+        :param max_batch_size: Largest batch passed to ``predict_batch``.
+        :param max_latency_ms: Longest time a request waits for others to join its batch.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.batches = 0
+        self.items = 0
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()  # Guards the counters and the closed flag
+        self._thread = threading.Thread(target=self._serve, name="MicroBatcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, row) -> Future:
+        """
+        Queues one input row.
+        :return: Future of its prediction.
+        """
+        future = Future()
+        with self._lock:
+            # Checked under the lock so no request can be queued behind the close marker
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed.")
+            self._queue.put((row, future))
+        return future
+
+    def predict(self, row, timeout: float = None):
+        """Queues one input row and waits for its prediction."""
+        return self.submit(row).result(timeout)
+
+    def _collect(self, first) -> list:
+        """Gathers requests behind ``first`` until the batch is full or its deadline passes."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                self._queue.put(_CLOSE)  # Stop after dispatching this batch
+                break
+            batch.append(item)
+        return batch
+
+    def _serve(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _CLOSE:
+                return
+            batch = [item for item in self._collect(first) if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                predictions = self.predict_batch(np.asarray([row for row, _ in batch]))
+                if np.ndim(predictions) == 0 or len(predictions) != len(batch):
+                    # Resolve nothing rather than leave the unmatched callers waiting forever
+                    raise ValueError(f"predict_batch returned {np.shape(predictions)} predictions "
+                                     f"for a batch of {len(batch)} rows.")
+                for (_, future), prediction in zip(batch, predictions):
+                    future.set_result(prediction)
+            except Exception as error:
+                logger.error(f"Batched prediction failed for {len(batch)} requests: {error}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            with self._lock:
+                self.batches += 1
+                self.items += len(batch)
+
+    def stats(self) -> dict:
+        """Number of dispatched batches, rows served and mean batch size."""
+        with self._lock:
+            batches, items = self.batches, self.items
+        return {"batches": batches, "items": items, "mean_batch_size": items / batches if batches else 0.0}
+
+    def close(self) -> None:
+        """Serves the requests already queued, then stops the batching thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import pickle
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint directory layout (see QTable.checkpoint)
+VALUES_FILE = "values.npy"
+STATES_FILE = "states.pkl"
+META_FILE = "meta.json"
+
+
+class QTable:
+    def __init__(self, action_space: int, dtype=np.float64, initial_capacity: int = 1024):
+        """
+        Q-value store backed by one contiguous (states, actions) matrix.
+
+        States are interned: each distinct state is assigned the next integer row on first sight,
+        and the matrix doubles its capacity when full. Compared with a dict holding one small
+        array per state, this removes the per-state array object and keeps the values contiguous.
+        :param action_space: Number of actions (columns).
+        :param dtype: np.float32 halves memory; np.float64 matches the previous behavior.
+        :param initial_capacity: Rows allocated up front.
+        """
+        self.action_space = action_space
+        self.values = np.zeros((max(initial_capacity, 1), action_space), dtype=dtype)
+        self.states = []  # Row -> state
+        self._index = {}  # State -> row
+        self._dirty = np.zeros(len(self.values), dtype=bool)  # Rows changed since the last checkpoint
+        self._checkpoint_path = None
+        self._saved_states = 0  # States already appended to the checkpoint's state file
+        self._states_bytes = 0  # Length of the state file up to the last saved state
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, state) -> bool:
+        return state in self._index
+
+    def __iter__(self):
+        return iter(self.states)
+
+    def __getitem__(self, state) -> np.ndarray:
+        """
+        Returns the Q-values of a known state as a read-only view into the matrix (KeyError if unseen).
+        The view is only valid until the table next grows; do not hold on to it. Write through
+        ``table[state] = q_values``, or to ``values`` followed by ``mark_dirty``, so checkpoints see the change.
+        """
+        view = self.values[self._index[state]]
+        view.flags.writeable = False
+        return view
+
+    def __setitem__(self, state, q_values) -> None:
+        row = self.intern(state)
+        self.values[row] = q_values
+        self._dirty[row] = True
+
+    def keys(self) -> list:
+        return list(self.states)
+
+    def get_row(self, state) -> int:
+        """Returns the row of ``state``, or None if it has not been seen."""
+        return self._index.get(state)
+
+    def _grow(self, rows: int) -> None:
+        capacity = len(self.values)
+        while capacity < rows:
+            capacity *= 2
+        if capacity != len(self.values):
+            values = np.zeros((capacity, self.action_space), dtype=self.values.dtype)
+            values[:len(self.states)] = self.values[:len(self.states)]
+            self.values = values
+            dirty = np.zeros(capacity, dtype=bool)
+            dirty[:len(self._dirty)] = self._dirty
+            self._dirty = dirty
+
+    def intern(self, state) -> int:
+        """Returns the row of ``state``, adding a zero-initialized row on first sight."""
+        row = self._index.get(state)
+        if row is None:
+            row = len(self.states)
+            self._grow(row + 1)
+            self._index[state] = row
+            self.states.append(state)
+            self._dirty[row] = True
+        return row
+
+    def intern_many(self, states) -> np.ndarray:
+        """Interns every state of ``states`` and returns their rows as an integer array."""
+        if isinstance(states, np.ndarray):
+            states = states.tolist()  # Python scalars hash faster and match states interned one by one
+        rows = list(map(self._index.get, states))  # Fast path: known states resolve without a Python loop
+        if None in rows:
+            rows = [self.intern(state) if row is None else row for state, row in zip(states, rows)]
+        return np.array(rows, dtype=np.int64)
+
+    def nbytes(self) -> int:
+        """Bytes used by the value rows in use (excluding the state index)."""
+        return len(self.states) * self.action_space * self.values.itemsize
+
+    def mark_dirty(self, rows) -> None:
+        """Records rows changed by writing to ``values`` directly, so the next checkpoint saves them."""
+        self._dirty[rows] = True
+
+    def _maps(self, values_path: str, modes=("r+",)) -> bool:
+        """Whether ``values`` is a mapping of ``values_path`` opened in one of ``modes`` (writable by default)."""
+        return (isinstance(self.values, np.memmap) and self.values.mode in modes
+                and os.path.realpath(self.values.filename) == os.path.realpath(values_path))
+
+    def checkpoint(self, path: str) -> int:
+        """
+        Saves the table to the directory ``path``, writing only what changed since the last checkpoint.
+
+        The values matrix is stored as ``values.npy`` so it can be memory-mapped, and the states are
+        appended to ``states.pkl`` in row order. The first checkpoint to a directory, or one after the
+        table outgrew the file, rewrites the matrix and the states under temporary names and renames
+        them into place, so processes mapping the old file are not disturbed; if ``values`` mapped the
+        old file it is remapped onto the new one. Later checkpoints write the dirty rows in place.
+        ``meta.json`` is replaced last and records how many states are valid; states written by an
+        interrupted checkpoint are ignored on load and overwritten by the next checkpoint.
+        :param path: Checkpoint directory.
+        :return: Number of value rows written.
+        """
+        os.makedirs(path, exist_ok=True)
+        path = os.path.realpath(path)
+        values_path = os.path.join(path, VALUES_FILE)
+        states_path = os.path.join(path, STATES_FILE)
+        n = len(self.states)
+        target = None
+        if path == self._checkpoint_path and os.path.exists(values_path):
+            target = np.load(values_path, mmap_mode="r+")
+            if target.shape[0] < n or target.shape[1] != self.action_space or target.dtype != self.values.dtype:
+                target = None
+        if target is None:
+            mapped_mode = self.values.mode if self._maps(values_path, modes=("r", "r+", "c")) else None
+            staging = values_path + ".tmp"
+            target = np.lib.format.open_memmap(staging, mode="w+", dtype=self.values.dtype,
+                                               shape=self.values.shape)
+            target[:n] = self.values[:n]
+            target.flush()
+            del target
+            with open(states_path + ".tmp", "wb") as file:
+                pickle.dump(self.states[:n], file, protocol=pickle.HIGHEST_PROTOCOL)
+                self._states_bytes = file.tell()
+            os.replace(staging, values_path)
+            os.replace(states_path + ".tmp", states_path)
+            if mapped_mode is not None:
+                # The old mapping now refers to an unlinked file; writes to it would be lost
+                self.values = np.load(values_path, mmap_mode=mapped_mode)
+            written = n
+        else:
+            rows = np.flatnonzero(self._dirty[:n])
+            if self._maps(values_path):
+                self.values.flush()  # The rows were written through the mapping
+            else:
+                target[rows] = self.values[rows]
+                target.flush()
+            del target
+            written = len(rows)
+            if n > self._saved_states:
+                with open(states_path, "r+b") as file:
+                    file.seek(self._states_bytes)
+                    file.truncate()  # Drop a torn append left by an interrupted checkpoint
+                    pickle.dump(self.states[self._saved_states:n], file, protocol=pickle.HIGHEST_PROTOCOL)
+                    self._states_bytes = file.tell()
+        meta = {"action_space": self.action_space, "dtype": self.values.dtype.str, "num_states": n}
+        with open(os.path.join(path, META_FILE + ".tmp"), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        os.replace(os.path.join(path, META_FILE + ".tmp"), os.path.join(path, META_FILE))
+        self._dirty[:] = False
+        self._checkpoint_path = path
+        self._saved_states = n
+        logger.info("Checkpointed Q-table to %s: %d states, %d rows written", path, n, written)
+        return written
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = "r") -> "QTable":
+        """
+        Loads a table saved with ``checkpoint``.
+        :param path: Checkpoint directory.
+        :param mmap_mode: "r" maps the values read-only, so any number of inference processes share
+                          one copy of the pages; "r+" maps them writable, so a training process
+                          restarts without reading the matrix and later checkpoints only flush it;
+                          None reads the matrix into memory. States seen for the first time get
+                          zero rows locally; the table is copied into memory only if it outgrows
+                          the file.
+        Restart time is O(states): every state is unpickled and the state index rebuilt, while the
+        values matrix itself is only mapped.
+        :return: The table.
+        """
+        path = os.path.realpath(path)
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        table = cls(meta["action_space"], dtype=np.dtype(meta["dtype"]), initial_capacity=1)
+        table.values = np.load(os.path.join(path, VALUES_FILE), mmap_mode=mmap_mode)
+        states = []
+        with open(os.path.join(path, STATES_FILE), "rb") as file:
+            # One pickled list per checkpoint; anything past the last committed state is ignored
+            while len(states) < meta["num_states"]:
+                states.extend(pickle.load(file))
+            table._states_bytes = file.tell()
+        table.states = states[:meta["num_states"]]
+        table._index = {state: row for row, state in enumerate(table.states)}
+        table._dirty = np.zeros(len(table.values), dtype=bool)
+        # A checkpoint interrupted after renaming a rewritten state file leaves more states than the
+        # metadata covers; the next checkpoint then rewrites the files instead of appending
+        complete = len(states) == meta["num_states"]
+        table._checkpoint_path = path if mmap_mode != "r" and complete else None
+        table._saved_states = len(table.states)
+        return table
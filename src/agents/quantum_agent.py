@@ -1,27 +1,47 @@
 import numpy as np
-from qiskit import Aer, transpile, assemble, execute, IBMQ
-from qiskit.circuit import QuantumCircuit
-from qiskit.aqua.algorithms import QAOA, VQE
-from qiskit.aqua.operators import Z, I, WeightedPauliOperator
-from qiskit.providers.aer import AerSimulator
-from qiskit.optimizers import COBYLA
-from qiskit.aqua.components.initial_states import Custom
-from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 import logging
 import random
 import json
 import os
+from agents.base_agent import BaseAgent
+from quantum.transpile_cache import cached_transpile
+from quantum.statevector_backend import NumpyStatevectorBackend
+from quantum.diagonal_qaoa import DiagonalQAOASimulator
+from quantum.adaptive_sampling import AdaptiveSamplingResult, sequential_sample
+from quantum.execution_service import CircuitExecutionService, chain_future
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 class QuantumAgent(BaseAgent):
-    def __init__(self, circuit_size: int, backend: str = "qiskit"):
+    # Parameterized decision circuits, shared by all agents with the same circuit size
+    _templates = {}
+
+    def __init__(self, circuit_size: int, backend: str = "qiskit",
+                 execution_service: CircuitExecutionService = None):
+        """
+        Initializes a QuantumAgent.
+
+        :param circuit_size: Number of qubits in the decision circuit.
+        :param backend: "qiskit" for Aer (and IBMQ hardware when available), or "numpy"
+                        for the lightweight statevector backend.
+        :param execution_service: Optional process-pool service (e.g. ``shared_execution_service()``)
+                                  that runs numpy-backend decision circuits off this process.
+        """
         self.circuit_size = circuit_size
         self.backend = backend
+        self._optimizer = None
+        self.execution_service = execution_service
+
+        if backend == "numpy":
+            self.simulator = NumpyStatevectorBackend()
+            self.real_backend = None
+            return
+
+        # Qiskit is imported lazily so numpy-backed agents run without it
+        from qiskit import IBMQ
+        from qiskit.providers.aer import AerSimulator
         self.simulator = AerSimulator()
-        self.optimizer = COBYLA()
-        
         # Load IBM Quantum backend if available
         try:
             IBMQ.load_account()  # Load IBMQ account if you have access
@@ -30,42 +50,199 @@ class QuantumAgent(BaseAgent):
             logger.warning("IBMQ backend not available, using simulator.")
             self.real_backend = None
 
+    @property
+    def optimizer(self):
+        """The classical optimizer used by QAOA and VQE, created on first use."""
+        if self._optimizer is None:
+            from qiskit.optimizers import COBYLA
+            self._optimizer = COBYLA()
+        return self._optimizer
+
+    @optimizer.setter
+    def optimizer(self, optimizer):
+        self._optimizer = optimizer
+
     def build_quantum_circuit(self, input_data):
         """Builds a quantum circuit based on input data."""
+        from qiskit import QuantumCircuit
         qc = QuantumCircuit(self.circuit_size)
         for i, val in enumerate(input_data):
             if val > 0.5:
                 qc.x(i)  # Apply X gate if input data is greater than 0.5
         return qc
 
-    def make_decision(self, input_data: list) -> float:
-        """Makes a quantum decision based on the input data."""
-        circuit = self.build_quantum_circuit(input_data)
-        transpiled_circuit = transpile(circuit, self.simulator)
-        qobj = assemble(transpiled_circuit)
-        
+    def build_template_circuit(self):
+        """
+        Returns the parameterized decision circuit for this circuit size.
+
+        Each qubit gets an ``rx(pi * theta_i)`` rotation, so binding ``theta_i = 1``
+        is equivalent to the X gate applied by ``build_quantum_circuit``.
+
+        :return: The template circuit and its ordered parameters.
+        """
+        if self.circuit_size not in QuantumAgent._templates:
+            from qiskit.circuit import QuantumCircuit, ParameterVector
+            theta = ParameterVector("theta", self.circuit_size)
+            template = QuantumCircuit(self.circuit_size)
+            for i in range(self.circuit_size):
+                template.rx(np.pi * theta[i], i)
+            template.measure_all()
+            QuantumAgent._templates[self.circuit_size] = (template, list(theta))
+        return QuantumAgent._templates[self.circuit_size]
+
+    def encode_batch(self, batch) -> np.ndarray:
+        """
+        Converts a batch of input vectors into template parameters.
+
+        :param batch: Array-like of shape (n_rows, n_features), n_features <= circuit_size.
+        :return: Array of shape (n_rows, circuit_size) holding 0/1 rotation parameters.
+        """
+        batch = np.atleast_2d(np.asarray(batch, dtype=float))
+        if batch.shape[1] > self.circuit_size:
+            raise ValueError(
+                f"Input has {batch.shape[1]} features but the circuit only has {self.circuit_size} qubits."
+            )
+        params = np.zeros((batch.shape[0], self.circuit_size))
+        params[:, :batch.shape[1]] = batch > 0.5  # Rotate by pi if input data is greater than 0.5
+        return params
+
+    @staticmethod
+    def _ones_per_shot(counts: dict) -> float:
+        """
+        Sums, over all shots, the fraction of measured qubits that read 1.
+
+        :param counts: Counts keyed by measured bitstring; registers may be separated by spaces.
+        :return: The sum (between 0 and the number of shots).
+        """
+        total = 0.0
+        for key, count in counts.items():
+            bits = key.replace(" ", "")
+            total += count * bits.count("1") / len(bits)
+        return total
+
+    @staticmethod
+    def _decision_from_counts(counts: dict) -> float:
+        """
+        The decision is the mean fraction of qubits measured as 1, i.e. the average marginal
+        probability of '1' over the qubits. With a single qubit this is the fraction of shots
+        that measured '1'.
+        """
+        shots = sum(counts.values())
+        return QuantumAgent._ones_per_shot(counts) / shots if shots else 0.0
+
+    def _decision_ops(self) -> list:
+        """The decision circuit as ops, with one free rotation angle per qubit."""
+        ops = [("rx", (i,), (None,)) for i in range(self.circuit_size)]
+        return ops + [("measure", (i,), (i,)) for i in range(self.circuit_size)]
+
+    def _sample_counts(self, params: np.ndarray, shots: int) -> list:
+        """Runs the decision circuit once per row of template parameters and returns the counts of each."""
+        if self.backend == "numpy":
+            if self.execution_service is not None:
+                return self._submit_counts(params, shots).result()
+            logger.info("Executing %d circuits on numpy statevector backend.", len(params))
+            return self.simulator.sample_counts(self._decision_ops(), self.circuit_size, shots, np.pi * params)
+
         # Execute on real quantum hardware or simulator
+        backend = self.real_backend or self.simulator
+        template, theta = self.build_template_circuit()
+        transpiled = cached_transpile(template, backend)
+        circuits = [transpiled.assign_parameters(dict(zip(theta, row))) for row in params]
+
         if self.real_backend:
-            logger.info("Executing on real quantum hardware.")
-            result = execute(circuit, self.real_backend).result()
+            logger.info("Executing %d circuits on real quantum hardware.", len(circuits))
         else:
-            logger.info("Executing on quantum simulator.")
-            result = execute(circuit, self.simulator).result()
-        
-        counts = result.get_counts()
-        
-        # The decision can be based on the measurement results (e.g., a majority vote)
-        decision = 0
-        if '1' in counts:
-            decision = counts['1'] / sum(counts.values())
-        
+            logger.info("Executing %d circuits on quantum simulator.", len(circuits))
+        result = backend.run(circuits, shots=shots).result()
+        return [result.get_counts(i) for i in range(len(circuits))]
+
+    def _submit_counts(self, params: np.ndarray, shots: int):
+        logger.info("Submitting %d circuits to the execution service.", len(params))
+        return self.execution_service.submit_counts(self._decision_ops(), self.circuit_size, shots, np.pi * params)
+
+    def submit_decisions(self, batch, shots: int = 1024):
+        """
+        Submits a batch of decisions to the execution service without waiting for them.
+
+        :param batch: Array-like of shape (n_rows, n_features).
+        :param shots: Number of shots per decision.
+        :return: Future of an array of shape (n_rows,) with the decisions.
+        """
+        if self.backend != "numpy" or self.execution_service is None:
+            raise RuntimeError("submit_decisions requires the numpy backend and an execution service.")
+        counts = self._submit_counts(self.encode_batch(batch), shots)
+        return chain_future(counts, lambda rows: np.array([self._decision_from_counts(c) for c in rows]))
+
+    def make_decisions(self, batch, shots: int = 1024) -> np.ndarray:
+        """
+        Makes one quantum decision per row of ``batch`` using a single backend job.
+
+        :param batch: Array-like of shape (n_rows, n_features).
+        :param shots: Number of shots per decision.
+        :return: Array of shape (n_rows,) with the decisions.
+        """
+        params = self.encode_batch(batch)
+        if len(params) == 0:
+            return np.zeros(0)
+        decisions = np.array([self._decision_from_counts(c) for c in self._sample_counts(params, shots)])
+        logger.info(f"Quantum decisions made for batch of {len(decisions)}")
+        return decisions
+
+    def make_decision(self, input_data: list) -> float:
+        """Makes a quantum decision based on the input data."""
+        decision = float(self.make_decisions([input_data])[0])
         logger.info(f"Quantum decision made: {decision}")
         return decision
 
+    def make_adaptive_decisions(self, batch, threshold: float = 0.5, confidence: float = 0.99,
+                                bound: str = "wilson", initial_shots: int = 64,
+                                max_shots: int = 4096) -> AdaptiveSamplingResult:
+        """
+        Makes quantum decisions with as few shots as the confidence bound allows.
+
+        Shots are drawn in doubling rounds (one backend job per round for the rows still
+        undecided) until each row's Wilson or Hoeffding interval clears ``threshold`` or
+        ``max_shots`` is reached.
+
+        :param batch: Array-like of shape (n_rows, n_features).
+        :param threshold: Decision threshold on the decision value (see ``_decision_from_counts``).
+        :param confidence: Confidence level of the stopping bound.
+        :param bound: "wilson" or "hoeffding".
+        :param initial_shots: Shots in the first round.
+        :param max_shots: Shot budget per decision.
+        :return: Result with per-row estimates, shots used and whether the bound was cleared.
+        """
+        params = self.encode_batch(batch)
+
+        def sample(rows, shots):
+            return [self._ones_per_shot(counts) for counts in self._sample_counts(params[rows], shots)]
+
+        result = sequential_sample(sample, len(params), threshold, confidence, bound, initial_shots, max_shots)
+        logger.info(f"Adaptive quantum decisions made for batch of {len(params)} using {result.total_shots} shots")
+        return result
+
+    def make_adaptive_decision(self, input_data: list, **options) -> tuple:
+        """
+        Makes a single adaptive quantum decision (see ``make_adaptive_decisions``).
+
+        :return: The decision and the number of shots it used.
+        """
+        result = self.make_adaptive_decisions([input_data], **options)
+        decision, shots = float(result.estimates[0]), int(result.shots[0])
+        logger.info(f"Quantum decision made: {decision} ({shots} shots)")
+        return decision, shots
+
     def optimize_qaoa(self, problem: dict):
         """Optimize a problem using the QAOA algorithm."""
         # Define a Hamiltonian for QAOA, which is just a simple Z operator
         n = problem["parameters"]["problem_size"]
+        if self.backend == "numpy":
+            # The Hamiltonian is Z-only, so it is simulated exactly without Qiskit
+            result = DiagonalQAOASimulator([("ZII", 1.0), ("IZI", -1.0), ("IIZ", 1.0)]).minimize()
+            logger.info(f"QAOA optimization result: {result}")
+            return result
+        from qiskit.aqua.algorithms import QAOA
+        from qiskit.aqua.operators import Z, I, WeightedPauliOperator
         operator = WeightedPauliOperator.from_list([(1.0, Z ^ I ^ I), (-1.0, I ^ Z ^ I), (1.0, I ^ I ^ Z)])
         
         # Set up the QAOA algorithm
@@ -81,6 +258,7 @@ class QuantumAgent(BaseAgent):
 
     def optimize_vqe(self, hamiltonian):
         """Optimize using VQE."""
+        from qiskit.aqua.algorithms import VQE
         vqe = VQE(hamiltonian, self.optimizer)
         if self.real_backend:
             logger.info("Executing VQE on real quantum hardware.")
@@ -101,8 +279,13 @@ class QuantumAgent(BaseAgent):
         """Runs the QuantumAgent for decision-making and optimization tasks."""
         # Simulate input data for quantum decision-making
         input_data = self.load_data_from_external_source()
-        decision = self.make_decision(input_data)
-        logger.info(f"Decision made by QuantumAgent: {decision}")
+        if self.backend == "numpy" and self.execution_service is not None:
+            # The decision runs in the execution service while QAOA and VQE run here
+            pending_decision = self.submit_decisions([input_data])
+        else:
+            decision = self.make_decision(input_data)
+            logger.info(f"Decision made by QuantumAgent: {decision}")
+            pending_decision = None
         
         # Optimization task (QAOA example)
         optimization_problem = {
@@ -113,10 +296,15 @@ class QuantumAgent(BaseAgent):
         logger.info(f"Optimization result (QAOA): {optimization_result}")
         
         # Alternatively, use VQE (if you have a Hamiltonian or optimization problem to solve)
+        from qiskit.aqua.operators import Z, I, WeightedPauliOperator
         hamiltonian = WeightedPauliOperator.from_list([(1.0, Z), (-1.0, I)])
         vqe_result = self.optimize_vqe(hamiltonian)
         logger.info(f"Optimization result (VQE): {vqe_result}")
 
+        if pending_decision is not None:
+            decision = float(pending_decision.result()[0])
+            logger.info(f"Decision made by QuantumAgent: {decision}")
+
 
 # Example usage of the QuantumAgent
 if __name__ == "__main__":
@@ -8,13 +8,13 @@ from dotenv import load_dotenv
 from loguru import logger
 import schedule
 from agents.base_agent import BaseAgent
-from qiskit import Aer, transpile, assemble
-from qiskit.circuit import QuantumCircuit
-from qiskit.providers.aer import AerSimulator
+from quantum.entropy_pool import AerBitSampler, shared_entropy_pool
 
 class QuantumTwitterAgent(BaseAgent):
-    def __init__(self, profile_path="agent_profile.json"):
+    def __init__(self, profile_path="agent_profile.json", entropy_pool=None):
         super().__init__(name="QuantumTwitterBot")
+        # Coin flips are served from pre-sampled Aer bits instead of one simulator job per decision
+        self.entropy_pool = entropy_pool or shared_entropy_pool(AerBitSampler())
         load_dotenv()
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.twitter_api_key = os.getenv("TWITTER_API_KEY")
@@ -73,20 +73,8 @@ class QuantumTwitterAgent(BaseAgent):
 
     def quantum_decision(self) -> bool:
         """Make a quantum-based decision (e.g., whether to post a tweet or not)."""
-        # Create a simple quantum circuit that simulates a coin flip to decide whether to tweet
-        circuit = QuantumCircuit(1, 1)
-        circuit.h(0)  # Hadamard gate to create superposition
-        circuit.measure(0, 0)  # Measure the qubit to collapse the state
-        
-        # Use Qiskit’s AerSimulator to simulate the quantum circuit
-        simulator = AerSimulator()
-        transpiled_circuit = transpile(circuit, simulator)
-        qobj = assemble(transpiled_circuit)
-        result = simulator.run(qobj).result()
-        counts = result.get_counts()
-        
-        # If the result is 1, decide to post a tweet (true), else don't post (false)
-        if '1' in counts:
+        # If the measured bit is 1, decide to post a tweet (true), else don't post (false)
+        if self.entropy_pool.coin_flip():
             logger.info("Quantum decision: Tweeting!")
             return True
         else:
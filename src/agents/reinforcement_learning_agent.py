@@ -1,26 +1,94 @@
 import numpy as np
 import random
+from agents.q_table import QTable
+from agents.replay_memory import ReplayMemory
 
 class ReinforcementLearningAgent:
-    def __init__(self, learning_rate=0.1, discount_factor=0.9, action_space=2, epsilon=0.1):
-        self.q_table = {}
+    def __init__(self, learning_rate=0.1, discount_factor=0.9, action_space=2, epsilon=0.1, dtype=np.float64,
+                 replay_capacity=None, seed=None):
+        # Q-values live in one contiguous matrix; states are interned to rows on first sight
+        self.q_table = QTable(action_space, dtype=dtype)
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.action_space = action_space
         self.epsilon = epsilon  # Exploration rate
+        self.rng = np.random.default_rng(seed)  # Used by the batch methods
+        self.memory = ReplayMemory(replay_capacity, seed) if replay_capacity else None
+
+    @classmethod
+    def from_checkpoint(cls, path, mmap_mode="r", **options):
+        """
+        Creates an agent whose Q-table is loaded from a checkpoint (see ``QTable.load``).
+        With the default read-only mapping, inference processes share the checkpoint's pages.
+        :param options: Other constructor arguments (learning_rate, epsilon, ...).
+        """
+        q_table = QTable.load(path, mmap_mode)
+        agent = cls(action_space=q_table.action_space, dtype=q_table.values.dtype, **options)
+        agent.q_table = q_table
+        return agent
 
     def choose_action(self, state):
-        if state not in self.q_table:
-            self.q_table[state] = np.zeros(self.action_space)
-        
+        row = self.q_table.intern(state)
+
         # Epsilon-greedy action selection
         if random.random() < self.epsilon:
             return random.randint(0, self.action_space - 1)  # Explore
-        return np.argmax(self.q_table[state])  # Exploit
+        return np.argmax(self.q_table.values[row])  # Exploit
 
     def update_q_value(self, state, action, reward, next_state):
-        if state not in self.q_table:
-            self.q_table[state] = np.zeros(self.action_space)
-        best_next_action = np.argmax(self.q_table[next_state])
-        td_target = reward + self.discount_factor * self.q_table[next_state][best_next_action]
-        self.q_table[state][action] += self.learning_rate * (td_target - self.q_table[state][action])
\ No newline at end of file
+        row = self.q_table.intern(state)
+        next_row = self.q_table.intern(next_state)  # Unseen states start at zero
+        values = self.q_table.values
+        td_target = reward + self.discount_factor * values[next_row].max()
+        values[row, action] += self.learning_rate * (td_target - values[row, action])
+        self.q_table.mark_dirty(row)
+
+    def choose_actions(self, states):
+        """
+        Epsilon-greedy actions for a batch of states.
+        :param states: Sequence of (hashable) states.
+        :return: Integer array of actions.
+        """
+        rows = self.q_table.intern_many(states)
+        actions = np.argmax(self.q_table.values[rows], axis=1)
+        explore = self.rng.random(len(rows)) < self.epsilon
+        actions[explore] = self.rng.integers(0, self.action_space, int(explore.sum()))
+        return actions
+
+    def _update_rows(self, rows, actions, rewards, next_rows):
+        """
+        Q-learning update for a batch of transitions given as Q-table rows.
+
+        TD targets are computed from the table before the update. A state-action pair that occurs
+        several times in the batch moves once, towards the mean of its targets, so the result does
+        not depend on the order of duplicates.
+        """
+        values = self.q_table.values
+        targets = np.asarray(rewards, dtype=np.float64) + self.discount_factor * values[next_rows].max(axis=1)
+        keys, inverse = np.unique(rows * self.action_space + np.asarray(actions, dtype=np.int64),
+                                  return_inverse=True)
+        mean_targets = np.bincount(inverse, weights=targets) / np.bincount(inverse)
+        flat = values.reshape(-1)  # Row-major view, so key = row * action_space + action
+        flat[keys] += self.learning_rate * (mean_targets - flat[keys])
+        self.q_table.mark_dirty(keys // self.action_space)
+
+    def update_batch(self, states, actions, rewards, next_states):
+        """
+        Applies a batch of transitions with array operations (see ``_update_rows``).
+        Transitions are also stored in the replay memory when one is configured.
+        """
+        rows = self.q_table.intern_many(states)
+        next_rows = self.q_table.intern_many(next_states)
+        self._update_rows(rows, actions, rewards, next_rows)
+        if self.memory is not None:
+            self.memory.add_batch(rows, actions, rewards, next_rows)
+
+    def replay(self, batch_size=256):
+        """Learns from a batch of transitions sampled from the replay memory."""
+        if self.memory is None:
+            raise RuntimeError("Replay requires an agent created with replay_capacity.")
+        self._update_rows(*self.memory.sample(batch_size))
+
+    def save_checkpoint(self, path):
+        """Saves the Q-table, writing only the rows changed since the last checkpoint (see ``QTable.checkpoint``)."""
+        return self.q_table.checkpoint(path)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import numpy as np
+
+
+class ReplayMemory:
+    def __init__(self, capacity: int, seed: int = None):
+        """
+        Bounded experience-replay buffer in preallocated arrays, overwriting the oldest transitions.
+
+        States are stored as Q-table rows (see ``QTable.intern``), so sampled batches can be
+        applied to the table without hashing states again.
+        :param capacity: Maximum number of transitions kept.
+        :param seed: Seed for sampling.
+        """
+        if capacity < 1:
+            raise ValueError("Replay memory capacity must be positive.")
+        self.capacity = capacity
+        self.state_rows = np.zeros(capacity, dtype=np.int64)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.next_state_rows = np.zeros(capacity, dtype=np.int64)
+        self.rng = np.random.default_rng(seed)
+        self._position = 0  # Next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_batch(self, state_rows, actions, rewards, next_state_rows) -> None:
+        """Appends transitions, wrapping around and overwriting the oldest ones when full."""
+        state_rows = np.asarray(state_rows, dtype=np.int64)
+        n = len(state_rows)
+        if n > self.capacity:  # Only the newest ``capacity`` transitions would survive
+            skip = n - self.capacity
+            state_rows, actions, rewards, next_state_rows = (np.asarray(a)[skip:] for a in
+                                                             (state_rows, actions, rewards, next_state_rows))
+            n = self.capacity
+        slots = (self._position + np.arange(n)) % self.capacity
+        self.state_rows[slots] = state_rows
+        self.actions[slots] = actions
+        self.rewards[slots] = rewards
+        self.next_state_rows[slots] = next_state_rows
+        self._position = (self._position + n) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def add(self, state_row: int, action: int, reward: float, next_state_row: int) -> None:
+        self.add_batch([state_row], [action], [reward], [next_state_row])
+
+    def sample(self, batch_size: int) -> tuple:
+        """
+        Samples transitions uniformly with replacement.
+        :return: (state_rows, actions, rewards, next_state_rows) arrays.
+        """
+        if self._size == 0:
+            raise ValueError("Cannot sample from an empty replay memory.")
+        index = self.rng.integers(0, self._size, batch_size)
+        return self.state_rows[index], self.actions[index], self.rewards[index], self.next_state_rows[index]
@@ -0,0 +1,214 @@
+import itertools
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Vote codes stored in the per-proposal arrays
+NO_VOTE, YES, NO = 0, 1, -1
+
+
+class MemberRegistry:
+    def __init__(self, keys: list = None):
+        """
+        Hash-indexed member registry assigning each member key a dense integer index.
+        :param keys: Initial members, in index order.
+        """
+        self.keys = list(keys or [])  # Index -> member key
+        self._index = {key: index for index, key in enumerate(self.keys)}  # Member key -> index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def index(self, key) -> int:
+        """Returns the index of ``key``, or None if it is not a member."""
+        return self._index.get(key)
+
+    def add(self, key) -> bool:
+        """Adds ``key``; returns False if it was already a member."""
+        if key in self._index:
+            return False
+        self._index[key] = len(self.keys)
+        self.keys.append(key)
+        return True
+
+    def indices(self, keys) -> np.ndarray:
+        """Indices of ``keys`` as an integer array, with -1 for non-members."""
+        return np.array(list(map(self._index.get, keys, itertools.repeat(-1, len(keys)))), dtype=np.int64)
+
+
+class VoteLedger:
+    def __init__(self, quorum: float = 0.5, journal=None):
+        """
+        Records DAO members, proposals and votes with constant-time tallies.
+
+        Each proposal keeps one int8 per member (0 no vote, 1 yes, -1 no) plus running yes/no
+        counts that are adjusted whenever a vote is cast or changed, so tallies and quorum checks
+        never scan the votes.
+        :param quorum: Fraction of members that must vote for a proposal to reach quorum.
+        :param journal: Optional object notified of every change through ``members_added(keys)``,
+                        ``proposal_added(text)`` and ``votes_applied(proposals, members, codes)``
+                        (see ``agents.dao_event_log``). It is called before the change is applied,
+                        so a change the journal rejects is not applied either.
+        """
+        if not 0.0 <= quorum <= 1.0:
+            raise ValueError("quorum must be between 0 and 1.")
+        self.quorum = quorum
+        self.journal = journal
+        self.members = MemberRegistry()
+        self.proposals = []
+        self._votes = []  # One int8 array per proposal, indexed by member
+        self._yes = []
+        self._no = []
+
+    @classmethod
+    def from_arrays(cls, quorum: float, member_keys: list, proposals: list, votes: np.ndarray,
+                    tallies: np.ndarray) -> "VoteLedger":
+        """
+        Rebuilds a ledger from the arrays returned by ``vote_matrix`` and ``tallies``.
+        The rows of ``votes`` are used without copying, so a copy-on-write memory map works.
+        """
+        ledger = cls(quorum)
+        ledger.members = MemberRegistry(member_keys)
+        ledger.proposals = list(proposals)
+        ledger._votes = list(votes)
+        ledger._yes = tallies[:, 0].tolist()
+        ledger._no = tallies[:, 1].tolist()
+        return ledger
+
+    def add_member(self, member_key) -> bool:
+        """Adds a member; returns False if it already was one."""
+        return self.add_members([member_key]) == 1
+
+    def add_members(self, member_keys) -> int:
+        """Adds several members; returns how many were new."""
+        added = list(dict.fromkeys(key for key in member_keys if key not in self.members))
+        if not added:
+            return 0
+        if self.journal is not None:
+            self.journal.members_added(added)
+        for key in added:
+            self.members.add(key)
+        return len(added)
+
+    def add_proposal(self, proposal: str) -> int:
+        """Adds a proposal and returns its index."""
+        if self.journal is not None:
+            self.journal.proposal_added(proposal)
+        self.proposals.append(proposal)
+        self._votes.append(np.zeros(max(len(self.members), 16), dtype=np.int8))
+        self._yes.append(0)
+        self._no.append(0)
+        return len(self.proposals) - 1
+
+    def _proposal_votes(self, proposal_index: int, size: int) -> np.ndarray:
+        """Returns the vote array of a proposal, grown to hold at least ``size`` members."""
+        if not 0 <= proposal_index < len(self.proposals):
+            raise ValueError(f"Unknown proposal index {proposal_index}.")
+        votes = self._votes[proposal_index]
+        if len(votes) < size:  # Members joined after the proposal was created
+            grown = np.zeros(max(size, 2 * len(votes)), dtype=np.int8)
+            grown[:len(votes)] = votes
+            self._votes[proposal_index] = votes = grown
+        return votes
+
+    def cast_vote(self, proposal_index: int, member_key, vote: bool) -> bool:
+        """
+        Records (or changes) a member's vote.
+        :return: False if ``member_key`` is not a member, in which case nothing is recorded.
+        """
+        member = self.members.index(member_key)
+        if member is None:
+            return False
+        self.apply_votes(np.array([proposal_index]), np.array([member]), np.array([YES if vote else NO], dtype=np.int8))
+        return True
+
+    def _apply(self, proposal_index: int, votes: np.ndarray, members: np.ndarray, codes: np.ndarray) -> None:
+        # ``members`` must be unique here; tallies move by the difference between new and old codes
+        previous = votes[members]
+        self._yes[proposal_index] += int(np.count_nonzero(codes == YES)) - int(np.count_nonzero(previous == YES))
+        self._no[proposal_index] += int(np.count_nonzero(codes == NO)) - int(np.count_nonzero(previous == NO))
+        votes[members] = codes
+
+    def ingest_votes(self, proposal_indices, member_keys, votes) -> int:
+        """
+        Applies a batch of votes with array operations.
+
+        When a member votes more than once on a proposal within the batch, the last vote counts.
+        Votes from non-members are skipped.
+        :param proposal_indices: One proposal index per vote, or a single index for the whole batch.
+        :param member_keys: Member key of each vote.
+        :param votes: Truthy for yes, falsy for no, one per vote.
+        :return: Number of votes recorded.
+        """
+        members = self.members.indices(member_keys)
+        codes = np.where(np.asarray(votes, dtype=bool), YES, NO).astype(np.int8)
+        proposals = np.broadcast_to(np.asarray(proposal_indices, dtype=np.int64), members.shape)
+        valid = members >= 0
+        if not valid.all():
+            logger.warning("Skipped %d votes from non-members.", int((~valid).sum()))
+        self.apply_votes(proposals[valid], members[valid], codes[valid])
+        return int(valid.sum())
+
+    def apply_votes(self, proposals: np.ndarray, members: np.ndarray, codes: np.ndarray) -> None:
+        """
+        Applies votes given by member index and vote code (YES or NO); the last vote of a member
+        on a proposal wins. This is the form in which votes are journaled and replayed.
+        """
+        if len(members) == 0:
+            return
+        # Validate the whole batch first so a bad index cannot leave it partly applied
+        if proposals.min() < 0 or proposals.max() >= len(self.proposals):
+            raise ValueError(f"Unknown proposal index in {np.unique(proposals).tolist()}.")
+        if members.min() < 0 or members.max() >= len(self.members):
+            raise ValueError(f"Unknown member index in {np.unique(members).tolist()}.")
+        # Keep the last vote of each (proposal, member) pair
+        keys = proposals.astype(np.int64) * len(self.members) + members
+        _, last = np.unique(keys[::-1], return_index=True)
+        keep = np.sort(len(keys) - 1 - last)
+        proposals, members, codes = proposals[keep], members[keep], codes[keep]
+        if self.journal is not None:
+            self.journal.votes_applied(proposals, members, codes)
+        for proposal_index in np.unique(proposals).tolist():
+            selected = proposals == proposal_index
+            group = members[selected]
+            votes_array = self._proposal_votes(proposal_index, int(group.max()) + 1)
+            self._apply(proposal_index, votes_array, group, codes[selected])
+
+    def vote_of(self, proposal_index: int, member_key):
+        """Returns True/False for a member's vote on a proposal, or None if they have not voted."""
+        member = self.members.index(member_key)
+        votes = self._proposal_votes(proposal_index, 0)
+        if member is None or member >= len(votes) or votes[member] == NO_VOTE:
+            return None
+        return bool(votes[member] == YES)
+
+    def tally(self, proposal_index: int) -> tuple:
+        """Returns the (yes, no) vote counts of a proposal."""
+        self._proposal_votes(proposal_index, 0)
+        return self._yes[proposal_index], self._no[proposal_index]
+
+    def tallies(self) -> np.ndarray:
+        """Returns the (yes, no) counts of every proposal as an (n_proposals, 2) array."""
+        return np.array([self._yes, self._no], dtype=np.int64).T.reshape(len(self.proposals), 2)
+
+    def vote_matrix(self) -> np.ndarray:
+        """Returns all votes as an int8 (n_proposals, n_members) array."""
+        matrix = np.zeros((len(self.proposals), len(self.members)), dtype=np.int8)
+        for row, votes in zip(matrix, self._votes):
+            size = min(len(votes), len(self.members))
+            row[:size] = votes[:size]
+        return matrix
+
+    def has_quorum(self, proposal_index: int) -> bool:
+        """Whether at least ``quorum`` of the current members have voted on the proposal."""
+        yes, no = self.tally(proposal_index)
+        return len(self.members) > 0 and yes + no >= self.quorum * len(self.members)
+
+    def passed(self, proposal_index: int) -> bool:
+        """Whether the proposal has quorum and more yes than no votes."""
+        yes, no = self.tally(proposal_index)
+        return self.has_quorum(proposal_index) and yes > no
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import threading
+import time
+import joblib
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE = "model.joblib"
+METADATA_FILE = "metadata.json"
+
+
+def _version_key(version: str) -> tuple:
+    """Sorts versions numerically where possible, so that "10" comes after "9" and "1.10" after "1.9"."""
+    return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in version.split("."))
+
+
+def list_versions(model_dir: str) -> list:
+    """Returns the versions stored under ``model_dir``, oldest first."""
+    if not os.path.isdir(model_dir):
+        return []
+    versions = [v for v in os.listdir(model_dir) if os.path.isfile(os.path.join(model_dir, v, MODEL_FILE))]
+    return sorted(versions, key=_version_key)
+
+
+def resolve_version(model_dir: str, version: str = None) -> str:
+    """Returns ``version``, or the latest version under ``model_dir`` when it is None."""
+    versions = list_versions(model_dir)
+    if version is None:
+        if not versions:
+            raise FileNotFoundError(f"No model artifacts found in {model_dir}.")
+        return versions[-1]
+    if version not in versions:
+        raise FileNotFoundError(f"Model version '{version}' not found in {model_dir} (available: {versions}).")
+    return version
+
+
+def save_model(model, model_dir: str, version: str, metadata: dict = None) -> str:
+    """
+    Stores a fitted model as ``<model_dir>/<version>/model.joblib`` plus a metadata file.
+
+    The model is written uncompressed so its NumPy arrays can be memory-mapped on load. The
+    version directory is filled under a temporary name and renamed into place, so readers
+    never see a partially written artifact.
+    :param model: Fitted model (e.g. a scikit-learn estimator).
+    :param model_dir: Directory holding all versions of this model.
+    :param version: Version label, e.g. "3" or "1.2.0".
+    :param metadata: Extra JSON-serializable information to store with the artifact.
+    :return: Path of the version directory.
+    """
+    target = os.path.join(model_dir, version)
+    if os.path.exists(target):
+        raise FileExistsError(f"Model version '{version}' already exists in {model_dir}.")
+    staging = os.path.join(model_dir, f".{version}.tmp-{os.getpid()}")
+    os.makedirs(staging)
+    joblib.dump(model, os.path.join(staging, MODEL_FILE))
+    info = {"version": version, "model_class": type(model).__name__, "created": time.time()}
+    info.update(metadata or {})
+    with open(os.path.join(staging, METADATA_FILE), "w", encoding="utf-8") as file:
+        json.dump(info, file, indent=2)
+    os.rename(staging, target)
+    logger.info("Saved model artifact %s", target)
+    return target
+
+
+def load_metadata(model_dir: str, version: str = None) -> dict:
+    """Returns the metadata stored with a model version (the latest when ``version`` is None)."""
+    path = os.path.join(model_dir, resolve_version(model_dir, version), METADATA_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def load_model(model_dir: str, version: str = None, mmap: bool = True):
+    """
+    Loads a model artifact.
+    :param model_dir: Directory holding all versions of this model.
+    :param version: Version to load; the latest when None.
+    :param mmap: Memory-map the model's NumPy arrays read-only instead of reading them into memory,
+                 so processes loading the same artifact share the pages.
+    :return: The fitted model.
+    """
+    path = os.path.join(model_dir, resolve_version(model_dir, version), MODEL_FILE)
+    return joblib.load(path, mmap_mode="r" if mmap else None)
+
+
+class ModelRegistry:
+    def __init__(self):
+        """Process-wide cache of loaded models, so agent instances share one copy of each artifact."""
+        self._models = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def get(self, model_dir: str, version: str = None, mmap: bool = True):
+        """
+        Returns the model for ``model_dir``/``version``, loading it on first use.
+        ``version=None`` is resolved to the latest version at call time.
+        """
+        version = resolve_version(model_dir, version)
+        key = (os.path.realpath(model_dir), version, mmap)
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = load_model(model_dir, version, mmap)
+                self.loads += 1
+                logger.info("Loaded model %s version %s", model_dir, version)
+            return self._models[key]
+
+    def clear(self) -> None:
+        """Drops all cached models."""
+        with self._lock:
+            self._models.clear()
+
+
+# Registry shared by every agent in the process
+model_registry = ModelRegistry()
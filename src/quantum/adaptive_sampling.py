@@ -0,0 +1,114 @@
+import logging
+import numpy as np
+from scipy.stats import norm
+
+logger = logging.getLogger(__name__)
+
+BOUNDS = ("wilson", "hoeffding")
+
+
+def wilson_interval(successes, trials, alpha: float) -> tuple:
+    """
+    Two-sided Wilson score interval for a binomial proportion (vectorized).
+
+    It also applies to the mean of outcomes bounded in [0, 1]: their variance is at most
+    p (1 - p), so the interval is conservative for them.
+    :param successes: Number of successes (sum of outcomes) per row.
+    :param trials: Number of trials per row.
+    :param alpha: Error probability of the interval.
+    :return: (lower, upper) arrays.
+    """
+    successes, trials = np.asarray(successes, dtype=float), np.asarray(trials, dtype=float)
+    z = norm.ppf(1 - alpha / 2)
+    p = successes / trials
+    denominator = 1 + z ** 2 / trials
+    center = (p + z ** 2 / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    return center - half_width, center + half_width
+
+
+def hoeffding_interval(successes, trials, alpha: float) -> tuple:
+    """Two-sided Hoeffding interval p +- sqrt(log(2 / alpha) / (2 n)), valid for any sample size."""
+    successes, trials = np.asarray(successes, dtype=float), np.asarray(trials, dtype=float)
+    p = successes / trials
+    half_width = np.sqrt(np.log(2 / alpha) / (2 * trials))
+    return np.clip(p - half_width, 0, 1), np.clip(p + half_width, 0, 1)
+
+
+def shot_schedule(initial_shots: int, max_shots: int) -> list:
+    """Cumulative shot totals at which the bound is checked: doubling from ``initial_shots`` up to ``max_shots``."""
+    if initial_shots < 1 or max_shots < initial_shots:
+        raise ValueError("Shot budget must satisfy 1 <= initial_shots <= max_shots.")
+    totals = [initial_shots]
+    while totals[-1] < max_shots:
+        totals.append(min(2 * totals[-1], max_shots))
+    return totals
+
+
+class AdaptiveSamplingResult:
+    def __init__(self, estimates: np.ndarray, shots: np.ndarray, decided: np.ndarray, above: np.ndarray):
+        """
+        Outcome of sequential sampling for a batch of decisions.
+        :param estimates: Estimated mean outcome (e.g. probability of measuring '1') per row.
+        :param shots: Shots actually used per row.
+        :param decided: True where the confidence bound cleared the threshold before the budget ran out.
+        :param above: True where the estimate lies above the threshold.
+        """
+        self.estimates = estimates
+        self.shots = shots
+        self.decided = decided
+        self.above = above
+
+    @property
+    def total_shots(self) -> int:
+        return int(self.shots.sum())
+
+    def __repr__(self):
+        return (f"AdaptiveSamplingResult(rows={len(self.estimates)}, total_shots={self.total_shots}, "
+                f"decided={int(self.decided.sum())})")
+
+
+def sequential_sample(sample, n_rows: int, threshold: float = 0.5, confidence: float = 0.99, bound: str = "wilson",
+                      initial_shots: int = 64, max_shots: int = 4096) -> AdaptiveSamplingResult:
+    """
+    Samples a batch of decisions in rounds, stopping each row once its confidence interval lies
+    entirely above or below ``threshold``. Each shot yields an outcome in [0, 1]: 0/1 for a
+    Bernoulli decision, or e.g. the fraction of qubits measured as 1.
+
+    Shot totals double every round, so at most log2(max_shots / initial_shots) + 1 looks are taken;
+    the error budget 1 - confidence is split evenly across them, keeping the overall error of every
+    stopped decision below 1 - confidence despite the repeated looks.
+    :param sample: Callable (row_indices, shots) -> sum of the shot outcomes for each of those rows.
+    :param n_rows: Number of decisions in the batch.
+    :param threshold: Decision threshold on the mean outcome.
+    :param confidence: Confidence level of the bound.
+    :param bound: "wilson" (tighter) or "hoeffding" (distribution-free).
+    :param initial_shots: Shots in the first round.
+    :param max_shots: Shot budget per row.
+    :return: The sampling result.
+    """
+    if bound not in BOUNDS:
+        raise ValueError(f"Unknown bound '{bound}', expected one of {BOUNDS}.")
+    interval = wilson_interval if bound == "wilson" else hoeffding_interval
+    schedule = shot_schedule(initial_shots, max_shots)
+    alpha = (1 - confidence) / len(schedule)
+
+    successes = np.zeros(n_rows, dtype=np.float64)
+    shots = np.zeros(n_rows, dtype=np.int64)
+    decided = np.zeros(n_rows, dtype=bool)
+    active = np.arange(n_rows)
+    for total in schedule:
+        if not len(active):
+            break
+        increment = total - shots[active[0]]
+        successes[active] += np.asarray(sample(active, int(increment)), dtype=np.float64)
+        shots[active] = total
+        lower, upper = interval(successes[active], shots[active], alpha)
+        stopped = (lower > threshold) | (upper < threshold)
+        decided[active[stopped]] = True
+        active = active[~stopped]
+
+    estimates = successes / np.maximum(shots, 1)
+    logger.info("Sequential sampling used %d shots for %d decisions (%d undecided at the budget).",
+                int(shots.sum()), n_rows, len(active))
+    return AdaptiveSamplingResult(estimates, shots, decided, estimates > threshold)
@@ -0,0 +1,83 @@
+"""
+Lightweight gate-list representation of quantum circuits.
+
+An op is a ``(name, qubits, params)`` tuple, e.g. ``("rx", (0,), (0.5,))`` or
+``("cx", (0, 1), ())``. A ``None`` parameter marks a free slot that is filled from a
+parameter matrix at execution time. Measurements are written ``("measure", (qubit,), (clbit,))``.
+"""
+
+
+def circuit_to_ops(circuit) -> list:
+    """
+    Converts a Qiskit circuit into a list of ops.
+    :param circuit: A Qiskit QuantumCircuit.
+    :return: The circuit's ops, in order. Barriers are dropped.
+    """
+    ops = []
+    for operation, qargs, cargs in circuit.data:
+        qubits = tuple(circuit.find_bit(q).index for q in qargs)
+        if operation.name == "barrier":
+            continue
+        if operation.name == "measure":
+            ops.append(("measure", qubits, (circuit.find_bit(cargs[0]).index,)))
+            continue
+        params = []
+        for param in operation.params:
+            try:
+                params.append(float(param))
+            except TypeError:
+                raise ValueError(f"Circuit has unbound parameter {param}; bind it before conversion.")
+        ops.append((operation.name, qubits, tuple(params)))
+    return ops
+
+
+def num_parameter_slots(ops: list) -> int:
+    """Returns the number of free (``None``) parameters in ``ops``."""
+    return sum(1 for _, _, params in ops for p in params if p is None)
+
+
+def measurement_map(ops: list, num_qubits: int) -> tuple:
+    """
+    Returns the ``(qubit, clbit)`` pairs measured by ``ops`` and the number of clbits.
+    Circuits without measurements are treated as measuring every qubit into the same-index clbit.
+    """
+    measurements = [(qubits[0], params[0]) for name, qubits, params in ops if name == "measure"]
+    if not measurements:
+        measurements = [(q, q) for q in range(num_qubits)]
+    return measurements, max(clbit for _, clbit in measurements) + 1
+
+
+def two_local_ops(num_qubits: int, reps: int = 3) -> list:
+    """
+    Ops of Qiskit's ``TwoLocal(rotation_blocks=['ry', 'rz'], entanglement_blocks='cz')`` ansatz with
+    full entanglement, using free parameter slots in the same order as the Qiskit circuit.
+    It has 2 * num_qubits * (reps + 1) parameters.
+    """
+    ops = []
+    for rep in range(reps + 1):
+        ops += [("ry", (q,), (None,)) for q in range(num_qubits)]
+        ops += [("rz", (q,), (None,)) for q in range(num_qubits)]
+        if rep < reps:
+            ops += [("cz", (i, j), ()) for i in range(num_qubits) for j in range(i + 1, num_qubits)]
+    return ops
+
+
+def ops_to_circuit(ops: list, num_qubits: int):
+    """
+    Converts ops back into a Qiskit circuit.
+    :param ops: Ops with bound parameters (no ``None`` slots).
+    :param num_qubits: Number of qubits.
+    :return: A Qiskit QuantumCircuit, with a classical register when ``ops`` contain measurements.
+    """
+    from qiskit import QuantumCircuit
+
+    clbits = [params[0] for name, _, params in ops if name == "measure"]
+    circuit = QuantumCircuit(num_qubits, max(clbits) + 1) if clbits else QuantumCircuit(num_qubits)
+    for name, qubits, params in ops:
+        if name == "measure":
+            circuit.measure(qubits[0], params[0])
+        elif any(p is None for p in params):
+            raise ValueError(f"Op {name} on {qubits} has a free parameter slot; bind it before conversion.")
+        else:
+            getattr(circuit, name)(*params, *qubits)
+    return circuit
@@ -0,0 +1,141 @@
+import logging
+import math
+from quantum.gate_matrices import ROTATION_GATES
+
+logger = logging.getLogger(__name__)
+
+# Pairs of gates whose product is the identity when applied back to back on the same qubits
+INVERSE_PAIRS = {
+    "x": "x", "y": "y", "z": "z", "h": "h", "cx": "cx", "cz": "cz", "swap": "swap",
+    "s": "sdg", "sdg": "s", "t": "tdg", "tdg": "t",
+}
+# Two-qubit gates that act the same with their qubits swapped
+SYMMETRIC_GATES = ("cz", "swap")
+
+
+def _is_zero_angle(angle, tolerance: float) -> bool:
+    return angle is not None and abs(math.remainder(angle, 2 * math.pi)) < tolerance
+
+
+def _same_qubits(name: str, a: tuple, b: tuple) -> bool:
+    return a == b or (name in SYMMETRIC_GATES and set(a) == set(b))
+
+
+def ops_depth(ops: list, num_qubits: int) -> int:
+    """Returns the circuit depth of ``ops`` (longest chain of ops sharing qubits, measurements included)."""
+    levels = [0] * num_qubits
+    for _, qubits, _ in ops:
+        level = max(levels[q] for q in qubits) + 1
+        for q in qubits:
+            levels[q] = level
+    return max(levels, default=0)
+
+
+def gate_count(ops: list) -> int:
+    """Returns the number of gates in ``ops``, not counting measurements."""
+    return sum(1 for name, _, _ in ops if name != "measure")
+
+
+def fuse_and_cancel(ops: list, num_qubits: int, tolerance: float = 1e-10) -> list:
+    """
+    Peephole pass over ``ops``:
+
+    - consecutive rotations of the same kind on a qubit are merged by adding their angles,
+    - rotations by a multiple of 2 pi and identity gates are dropped,
+    - adjacent self-inverse (or mutually inverse) gates on the same qubits cancel.
+
+    Removing an op exposes the op before it, so cancellations cascade (e.g. H X X H vanishes).
+    Rotations with free parameter slots are kept as they are, and measurements block fusion.
+    :return: The reduced ops, in order.
+    """
+    kept = []
+    # Per qubit, the positions in ``kept`` of the live ops touching it, most recent last
+    stacks = [[] for _ in range(num_qubits)]
+
+    def previous(qubits):
+        """The last live op on ``qubits`` if it is also the last op on each of them."""
+        heads = {stacks[q][-1] if stacks[q] else None for q in qubits}
+        return heads.pop() if len(heads) == 1 else None
+
+    def remove(position):
+        for q in kept[position][1]:
+            stacks[q].pop()
+        kept[position] = None
+
+    for name, qubits, params in ops:
+        if name == "id" or (name in ROTATION_GATES and _is_zero_angle(params[0], tolerance)):
+            continue
+        position = previous(qubits)
+        if position is not None:
+            prev_name, prev_qubits, prev_params = kept[position]
+            if name in ROTATION_GATES and prev_name == name and None not in params + prev_params:
+                angle = prev_params[0] + params[0]
+                if _is_zero_angle(angle, tolerance):
+                    remove(position)
+                else:
+                    kept[position] = (name, qubits, (angle,))
+                continue
+            if INVERSE_PAIRS.get(name) == prev_name and _same_qubits(name, qubits, prev_qubits):
+                remove(position)
+                continue
+        for q in qubits:
+            stacks[q].append(len(kept))
+        kept.append((name, qubits, params))
+    return [op for op in kept if op is not None]
+
+
+def remove_idle_qubits(ops: list, num_qubits: int) -> tuple:
+    """
+    Drops qubits that no op touches and renumbers the rest, keeping their order.
+    :return: (remapped ops, list of the original indices of the kept qubits).
+    """
+    used = sorted({q for _, qubits, _ in ops for q in qubits})
+    index = {q: i for i, q in enumerate(used)}
+    return [(name, tuple(index[q] for q in qubits), params) for name, qubits, params in ops], used
+
+
+class CircuitReduction:
+    def __init__(self, ops: list, num_qubits: int, qubit_map: list, original_gates: int, original_depth: int,
+                 original_qubits: int):
+        """
+        Outcome of ``reduce_ops``.
+        :param ops: Reduced ops on the renumbered qubits.
+        :param num_qubits: Number of qubits left.
+        :param qubit_map: Original index of every remaining qubit.
+        """
+        self.ops = ops
+        self.num_qubits = num_qubits
+        self.qubit_map = qubit_map
+        self.original_gates = original_gates
+        self.original_depth = original_depth
+        self.original_qubits = original_qubits
+        self.gates = gate_count(ops)
+        self.depth = ops_depth(ops, num_qubits)
+
+    @property
+    def gate_reduction(self) -> int:
+        return self.original_gates - self.gates
+
+    @property
+    def depth_reduction(self) -> int:
+        return self.original_depth - self.depth
+
+    def __repr__(self):
+        return (f"CircuitReduction(gates={self.original_gates}->{self.gates}, "
+                f"depth={self.original_depth}->{self.depth}, qubits={self.original_qubits}->{self.num_qubits})")
+
+
+def reduce_ops(ops: list, num_qubits: int, tolerance: float = 1e-10) -> CircuitReduction:
+    """
+    Fuses and cancels gates (see ``fuse_and_cancel``), then removes qubits no op touches.
+    :param ops: Circuit ops (see ``quantum.circuit_ops``).
+    :param num_qubits: Number of qubits.
+    :param tolerance: Angles within this distance of a multiple of 2 pi count as zero.
+    :return: The reduced circuit together with its gate-count and depth reduction.
+    """
+    reduced = fuse_and_cancel(ops, num_qubits, tolerance)
+    reduced, qubit_map = remove_idle_qubits(reduced, num_qubits)
+    result = CircuitReduction(reduced, len(qubit_map), qubit_map, gate_count(ops), ops_depth(ops, num_qubits),
+                              num_qubits)
+    logger.debug("Reduced circuit: %s", result)
+    return result
@@ -1,5 +1,7 @@
 from qiskit import QuantumCircuit
 from qiskit.visualization import plot_histogram
+from quantum.transpile_cache import cached_transpile
+from quantum.statevector_backend import NumpyStatevectorBackend
 
 class QuantumCircuitBuilder:
     def __init__(self, circuit_size: int, backend: str):
@@ -10,17 +12,39 @@ class QuantumCircuitBuilder:
         """
         self.circuit_size = circuit_size
         self.backend = backend
+        self._target = None
 
-    def build(self, input_data: list) -> str:
+    def get_target(self):
+        """
+        Returns the backend instance circuits are transpiled for.
+        "numpy" resolves to the statevector backend; any other backend name, such as
+        "qiskit", resolves to a (lazily created) Aer simulator.
+        """
+        if self._target is None:
+            if self.backend == "numpy":
+                self._target = NumpyStatevectorBackend()
+            elif isinstance(self.backend, str):
+                from qiskit.providers.aer import AerSimulator
+                self._target = AerSimulator()
+            else:
+                self._target = self.backend
+        return self._target
+
+    def build(self, input_data: list) -> QuantumCircuit:
         """
         Builds the quantum circuit.
         :param input_data: Input data for quantum circuit.
-        :return: A string representation of the quantum circuit.
+        :return: The quantum circuit, transpiled for the builder's backend. Each call returns a
+                 new circuit that the caller may modify.
         """
         circuit = QuantumCircuit(self.circuit_size)
         # Logic to build the circuit based on input_data
-        return circuit
+        target = self.get_target()
+        if isinstance(target, NumpyStatevectorBackend):
+            return circuit  # Runs natively, no transpilation needed
+        # The cached result is shared with other callers, so hand out a copy
+        return cached_transpile(circuit, target).copy()
 
     def visualize(self, circuit: QuantumCircuit):
         circuit.draw('mpl') 
-        plot_histogram(circuit)
\ No newline at end of file
+        plot_histogram(circuit)
@@ -0,0 +1,167 @@
+import logging
+import threading
+import numpy as np
+from quantum.product_state import ProductStateEvaluator
+
+logger = logging.getLogger(__name__)
+
+
+class NumpyBitSampler:
+    def __init__(self, width: int = 32, seed: int = None):
+        """
+        Draws fair bits from a ``width``-qubit Hadamard circuit on the product-state evaluator.
+        :param width: Qubits per shot; each shot yields ``width`` bits.
+        :param seed: Seed for measurement sampling.
+        """
+        self.width = width
+        self.evaluator = ProductStateEvaluator(rng=np.random.default_rng(seed))
+        ops = [("h", (q,), ()) for q in range(width)]
+        self._marginals = self.evaluator.marginals(ops, width)
+
+    def __call__(self, n_bits: int) -> np.ndarray:
+        shots = -(-n_bits // self.width)
+        bits = self.evaluator.sample_bits(self._marginals, shots)
+        return bits.reshape(-1)[:n_bits].astype(np.uint8)
+
+
+class AerBitSampler:
+    def __init__(self, width: int = 32, backend=None):
+        """
+        Draws fair bits from a ``width``-qubit Hadamard circuit on Aer, one shot-memory job per call.
+        :param width: Qubits per shot; each shot yields ``width`` bits.
+        :param backend: Backend to run on; an AerSimulator is created on first use when omitted.
+        """
+        self.width = width
+        self.backend = backend
+        self._circuit = None
+
+    def __call__(self, n_bits: int) -> np.ndarray:
+        from quantum.transpile_cache import cached_transpile
+        if self.backend is None:
+            from qiskit.providers.aer import AerSimulator
+            self.backend = AerSimulator()
+        if self._circuit is None:
+            from qiskit.circuit import QuantumCircuit
+            circuit = QuantumCircuit(self.width)
+            circuit.h(range(self.width))
+            circuit.measure_all()
+            self._circuit = cached_transpile(circuit, self.backend)
+        shots = -(-n_bits // self.width)
+        memory = self.backend.run(self._circuit, shots=shots, memory=True).result().get_memory()
+        bits = np.frombuffer("".join(memory).encode("ascii"), dtype=np.uint8) - ord("0")
+        return bits[:n_bits]
+
+
+class QuantumEntropyPool:
+    def __init__(self, sampler=None, capacity: int = 1 << 16, low_water: float = 0.25, background: bool = True):
+        """
+        Buffer of pre-sampled quantum random bits.
+
+        Bits from one large-shot job are stored packed (eight per byte) and served from the buffer.
+        When the unread bits fall below the low-water mark, a background thread runs the next job,
+        so callers only block when the pool runs dry.
+        :param sampler: Callable n_bits -> uint8 array of 0/1 bits (defaults to NumpyBitSampler).
+        :param capacity: Bits held after a refill.
+        :param low_water: Fraction of ``capacity`` at which a background refill starts.
+        :param background: Refill in a background thread (otherwise refills happen on demand).
+        """
+        if capacity < 1 or not 0 <= low_water < 1:
+            raise ValueError("Pool capacity must be positive and low_water must lie in [0, 1).")
+        self.sampler = sampler or NumpyBitSampler()
+        self.capacity = capacity
+        self.low_water = int(capacity * low_water)
+        self.background = background
+        self.refills = 0
+        self.bits_served = 0
+        self._buffer = np.zeros(0, dtype=np.uint8)  # Packed bits
+        self._start = 0  # Next unread bit
+        self._end = 0  # One past the last valid bit
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()  # At most one sampler job at a time
+        self._refill_thread = None
+
+    def available(self) -> int:
+        """Number of unread bits in the buffer."""
+        with self._lock:
+            return self._end - self._start
+
+    def refill(self, min_bits: int = 0) -> None:
+        """Runs one sampler job, topping the buffer up to ``capacity`` (or ``min_bits``, if larger)."""
+        with self._refill_lock:
+            needed = max(self.capacity, min_bits) - self.available()
+            if needed <= 0:
+                return
+            bits = np.asarray(self.sampler(needed), dtype=np.uint8)
+            with self._lock:
+                remaining = np.unpackbits(self._buffer)[self._start:self._end]
+                merged = np.concatenate([remaining, bits])
+                self._buffer = np.packbits(merged)
+                self._start, self._end = 0, len(merged)
+                self.refills += 1
+        logger.debug("Entropy pool refilled with %d bits.", len(bits))
+
+    def _background_refill(self) -> None:
+        try:
+            self.refill()
+        except Exception:
+            logger.exception("Background entropy pool refill failed.")
+
+    def _schedule_refill(self) -> None:
+        if not self.background:
+            return
+        with self._lock:
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(target=self._background_refill, daemon=True)
+            self._refill_thread.start()
+
+    def take_bits(self, n_bits: int) -> np.ndarray:
+        """
+        Removes ``n_bits`` bits from the pool.
+        :return: uint8 array of 0/1 bits.
+        """
+        while True:
+            with self._lock:
+                if self._end - self._start >= n_bits:
+                    start = self._start
+                    offset = start & 7
+                    packed = self._buffer[start >> 3:(start + n_bits + 7) >> 3]
+                    bits = np.unpackbits(packed)[offset:offset + n_bits]
+                    self._start += n_bits
+                    self.bits_served += n_bits
+                    low = self._end - self._start < self.low_water
+                    break
+            self.refill(n_bits)  # Pool ran dry: refill synchronously
+        if low:
+            self._schedule_refill()
+        return bits
+
+    def coin_flip(self) -> bool:
+        """Returns one fair quantum coin flip."""
+        return bool(self.take_bits(1)[0])
+
+    def random_integers(self, n_bits: int, size: int) -> np.ndarray:
+        """Returns ``size`` uniform integers in [0, 2 ** n_bits), built from pool bits (n_bits <= 63)."""
+        bits = self.take_bits(n_bits * size).reshape(size, n_bits).astype(np.int64)
+        return bits @ (1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64))
+
+
+# Process-wide pools shared by all agents that need quantum coin flips, one per sampler type
+_shared_pools = {}
+_shared_pool_lock = threading.Lock()
+
+
+def shared_entropy_pool(sampler=None, **options) -> QuantumEntropyPool:
+    """
+    Returns the process-wide entropy pool for the type of ``sampler``, creating it on first use.
+
+    Pools are keyed by sampler type, so asking for an ``AerBitSampler`` never returns a pool
+    filled by ``NumpyBitSampler`` (the default when ``sampler`` is None). The ``sampler``
+    instance and ``options`` (see QuantumEntropyPool) only apply to the call that creates the pool.
+    """
+    key = NumpyBitSampler if sampler is None else type(sampler)
+    with _shared_pool_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = _shared_pools[key] = QuantumEntropyPool(sampler, **options)
+        return pool
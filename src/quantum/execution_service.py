@@ -0,0 +1,173 @@
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+import numpy as np
+from quantum.circuit_ops import measurement_map
+from quantum.statevector_backend import NumpyStatevectorBackend, counts_to_dicts
+from quantum.wire_format import decode, encode_ops
+
+logger = logging.getLogger(__name__)
+
+JOB_KINDS = ("statevectors", "probabilities", "counts")
+
+# Per-worker simulator, created once by _init_worker when the pool starts
+_WORKER = {}
+
+
+def _init_worker():
+    """Keeps one warm simulator per worker process for all jobs it runs."""
+    _WORKER["backend"] = NumpyStatevectorBackend()
+
+
+def _to_shared(array: np.ndarray) -> tuple:
+    """Copies ``array`` into a new shared-memory block and returns a handle the parent can attach to."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    handle = (shm.name, array.shape, array.dtype.str)
+    shm.close()  # The parent unlinks the block once it has read it
+    return handle
+
+
+def _from_shared(handle: tuple) -> np.ndarray:
+    """Reads and releases a shared-memory block written by ``_to_shared``."""
+    name, shape, dtype = handle
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _execute(kind: str, message: bytes, shots: int) -> tuple:
+    """Runs one job inside a worker; the request arrives in the binary wire format."""
+    circuit = decode(message)
+    ops, n = circuit.ops(), circuit.num_qubits
+    parameters = circuit.parameters if circuit.parameters.shape[0] else None
+    backend = _WORKER["backend"]
+    if kind == "statevectors":
+        result = backend.statevectors(ops, n, parameters)
+    elif kind == "probabilities":
+        result = backend.probabilities(ops, n, parameters)
+    else:
+        result = backend.sample_count_arrays(ops, n, shots, parameters)
+    return _to_shared(result)
+
+
+def chain_future(future: Future, transform) -> Future:
+    """Returns a future resolving to ``transform(future.result())``, propagating errors."""
+    chained = Future()
+
+    def done(source):
+        if not chained.set_running_or_notify_cancel():
+            return
+        try:
+            chained.set_result(transform(source.result()))
+        except BaseException as error:
+            chained.set_exception(error)
+    future.add_done_callback(done)
+    return chained
+
+
+class CircuitExecutionService:
+    def __init__(self, max_workers: int = None):
+        """
+        Local circuit execution service backed by a process pool.
+
+        Each worker holds a warm NumpyStatevectorBackend. Requests travel to the workers in the
+        binary wire format and results (statevectors, probabilities, dense count arrays) come back
+        through ``multiprocessing.shared_memory`` instead of being pickled. Every submission returns
+        a future, so agents sharing one service keep all cores busy.
+        :param max_workers: Number of worker processes (defaults to the CPU count).
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Workers must share the parent's resource tracker: blocks they create are unlinked by the
+        # parent, and a per-worker tracker would report them as leaked when the worker exits
+        resource_tracker.ensure_running()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _finish(self, outer: Future, inner: Future) -> None:
+        # Always read the result so its shared-memory block is released, even if nobody waits for it
+        result, error = None, None
+        try:
+            result = _from_shared(inner.result())
+        except BaseException as exc:
+            error = exc
+        with self._lock:
+            self.completed += 1
+            self.failed += error is not None
+        if outer.set_running_or_notify_cancel():
+            if error is None:
+                outer.set_result(result)
+            else:
+                outer.set_exception(error)
+
+    def submit(self, kind: str, ops: list, num_qubits: int, parameters=None, shots: int = 1024) -> Future:
+        """
+        Submits a batch of circuits sharing the structure ``ops``.
+        :param kind: "statevectors", "probabilities" or "counts".
+        :param ops: Circuit ops; ``None`` parameters are free slots (see ``quantum.circuit_ops``).
+        :param num_qubits: Number of qubits.
+        :param parameters: Array of shape (batch, n_free_slots), one row per circuit.
+        :param shots: Shots per circuit for "counts".
+        :return: Future of a (batch, ...) array: complex amplitudes, probabilities, or integer counts
+                 indexed by classical register value.
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind '{kind}', expected one of {JOB_KINDS}.")
+        message = encode_ops(ops, num_qubits, parameters)
+        outer = Future()
+        with self._lock:
+            self.submitted += 1
+        inner = self._executor.submit(_execute, kind, message, shots)
+        inner.add_done_callback(lambda done: self._finish(outer, done))
+        return outer
+
+    def submit_statevectors(self, ops: list, num_qubits: int, parameters=None) -> Future:
+        return self.submit("statevectors", ops, num_qubits, parameters)
+
+    def submit_probabilities(self, ops: list, num_qubits: int, parameters=None) -> Future:
+        return self.submit("probabilities", ops, num_qubits, parameters)
+
+    def submit_counts(self, ops: list, num_qubits: int, shots: int = 1024, parameters=None) -> Future:
+        """Like ``submit`` with kind "counts", resolving to Qiskit-style counts dictionaries."""
+        _, num_clbits = measurement_map(ops, num_qubits)
+        arrays = self.submit("counts", ops, num_qubits, parameters, shots)
+        return chain_future(arrays, lambda counts: counts_to_dicts(counts, num_clbits))
+
+    def metrics(self) -> dict:
+        """Pool size, queue depth (submitted but not yet finished jobs) and job totals."""
+        with self._lock:
+            return {"pool_size": self.max_workers, "queue_depth": self.submitted - self.completed,
+                    "submitted": self.submitted, "completed": self.completed, "failed": self.failed}
+
+    def close(self) -> None:
+        """Waits for pending jobs and shuts the pool down."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Process-wide service shared by all agents on this host
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+def shared_execution_service(max_workers: int = None) -> CircuitExecutionService:
+    """Returns the process-wide execution service, creating it on first use (``max_workers`` applies then)."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = CircuitExecutionService(max_workers)
+            logger.info("Started circuit execution service with %d workers.", _shared_service.max_workers)
+        return _shared_service
@@ -0,0 +1,46 @@
+import numpy as np
+
+_SQRT_HALF = np.sqrt(0.5)
+
+# Fixed single-qubit gates
+FIXED_GATES = {
+    "id": np.eye(2, dtype=complex),
+    "x": np.array([[0, 1], [1, 0]], dtype=complex),
+    "y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "z": np.array([[1, 0], [0, -1]], dtype=complex),
+    "h": np.array([[1, 1], [1, -1]], dtype=complex) * _SQRT_HALF,
+    "s": np.array([[1, 0], [0, 1j]], dtype=complex),
+    "sdg": np.array([[1, 0], [0, -1j]], dtype=complex),
+    "t": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+    "tdg": np.array([[1, 0], [0, np.exp(-1j * np.pi / 4)]], dtype=complex),
+    "sx": np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]], dtype=complex) / 2,
+}
+
+# Parameterized single-qubit gates
+ROTATION_GATES = ("rx", "ry", "rz", "p", "u1")
+
+
+def rotation_matrices(name: str, theta: np.ndarray) -> np.ndarray:
+    """Returns a (batch, 2, 2) stack of rotation matrices for angles ``theta``."""
+    cos = np.cos(theta / 2)
+    sin = np.sin(theta / 2)
+    matrices = np.zeros((len(theta), 2, 2), dtype=complex)
+    if name == "rx":
+        matrices[:, 0, 0] = cos
+        matrices[:, 1, 1] = cos
+        matrices[:, 0, 1] = -1j * sin
+        matrices[:, 1, 0] = -1j * sin
+    elif name == "ry":
+        matrices[:, 0, 0] = cos
+        matrices[:, 1, 1] = cos
+        matrices[:, 0, 1] = -sin
+        matrices[:, 1, 0] = sin
+    elif name == "rz":
+        matrices[:, 0, 0] = np.exp(-0.5j * theta)
+        matrices[:, 1, 1] = np.exp(0.5j * theta)
+    elif name in ("p", "u1"):
+        matrices[:, 0, 0] = 1
+        matrices[:, 1, 1] = np.exp(1j * theta)
+    else:
+        raise ValueError(f"Unsupported rotation gate: {name}")
+    return matrices
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+def pauli_terms(hamiltonian) -> list:
+    """
+    Normalizes a Hamiltonian into a list of ``(label, coefficient)`` pairs.
+    :param hamiltonian: A list of (label, coefficient) pairs as accepted by ``PauliSumOp.from_list``,
+                        a ``PauliSumOp`` or a ``SparsePauliOp``.
+    :return: List of (Pauli label, complex coefficient) pairs.
+    """
+    if hasattr(hamiltonian, "primitive"):  # PauliSumOp wraps a SparsePauliOp
+        hamiltonian = hamiltonian.primitive * hamiltonian.coeff
+    if hasattr(hamiltonian, "to_list"):
+        hamiltonian = hamiltonian.to_list()
+    return [(str(label), complex(coeff)) for label, coeff in hamiltonian]
+
+
+def canonical_terms(hamiltonian, decimals: int = 10) -> list:
+    """
+    Returns the terms of a Hamiltonian in canonical form: duplicate labels merged,
+    coefficients rounded, zero terms dropped and labels sorted.
+    """
+    merged = {}
+    for label, coeff in pauli_terms(hamiltonian):
+        merged[label] = merged.get(label, 0) + coeff
+    terms = []
+    for label in sorted(merged):
+        coeff = complex(round(merged[label].real, decimals), round(merged[label].imag, decimals))
+        if coeff != 0:
+            terms.append((label, coeff))
+    return terms
+
+
+def canonical_sparse_terms(hamiltonian, decimals: int = 10) -> list:
+    """
+    Returns the terms of a Hamiltonian in canonical sparse form: ``(key, coefficient)`` pairs where the
+    key lists the non-identity Paulis with their qubit, e.g. "Z0 Z3" (the identity term has key "").
+    Duplicates are merged, coefficients rounded, zero terms dropped and keys sorted.
+
+    Problems that expose ``sparse_terms`` (e.g. ``IsingProblem``) are read in O(terms), without
+    building dense n-character labels; other Hamiltonians go through ``pauli_terms``.
+    """
+    if hasattr(hamiltonian, "sparse_terms"):
+        sparse = hamiltonian.sparse_terms()
+    else:
+        sparse = []
+        for label, coeff in pauli_terms(hamiltonian):
+            n = len(label)
+            positions = [pos for pos, char in enumerate(label) if char != "I"]
+            sparse.append(("".join(label[pos] for pos in positions), [n - 1 - pos for pos in positions], coeff))
+    merged = {}
+    for paulis, qubits, coeff in sparse:
+        key = " ".join(f"{pauli}{q}" for q, pauli in sorted(zip(qubits, paulis)) if pauli != "I")
+        merged[key] = merged.get(key, 0) + complex(coeff)
+    terms = []
+    for key in sorted(merged):
+        coeff = complex(round(merged[key].real, decimals), round(merged[key].imag, decimals))
+        if coeff != 0:
+            terms.append((key, coeff))
+    return terms
+
+
+def real_coefficients(terms: list) -> np.ndarray:
+    """Returns the real parts of the coefficients of ``terms`` (Hermitian Hamiltonians have real coefficients)."""
+    return np.array([coeff.real for _, coeff in terms], dtype=float)
+
+
+def num_qubits(hamiltonian) -> int:
+    """Returns the number of qubits a Hamiltonian acts on."""
+    if isinstance(getattr(hamiltonian, "num_qubits", None), int):
+        return hamiltonian.num_qubits
+    terms = pauli_terms(hamiltonian)
+    return len(terms[0][0]) if terms else 0
+
+
+def is_diagonal(hamiltonian) -> bool:
+    """Returns True when every Pauli string is made of I and Z only."""
+    if hasattr(hamiltonian, "cost_vector"):  # Problems that build their own diagonal, e.g. IsingProblem
+        return True
+    return all(set(label) <= {"I", "Z"} for label, _ in pauli_terms(hamiltonian))
+
+
+def diagonal_cost_vector(hamiltonian, dtype=np.float64) -> np.ndarray:
+    """
+    Returns the diagonal of a Z-only Hamiltonian as a vector over the 2 ** n basis states.
+
+    Labels follow Qiskit's convention: the rightmost character acts on qubit 0, which is bit 0
+    of the basis-state index. Each term costs O(k * 2 ** n) for a k-local Pauli string.
+    Problems that build their own diagonal (e.g. ``IsingProblem``) are asked for it directly.
+    """
+    if hasattr(hamiltonian, "cost_vector"):
+        return hamiltonian.cost_vector().astype(dtype, copy=False)
+    terms = pauli_terms(hamiltonian)
+    if not terms:
+        raise ValueError("Hamiltonian has no terms.")
+    if not is_diagonal(terms):
+        raise ValueError("Hamiltonian contains X or Y terms and is not diagonal.")
+    n = len(terms[0][0])
+    index = np.arange(2 ** n, dtype=np.uint64)
+    cost = np.zeros(2 ** n, dtype=dtype)
+    parity = np.empty_like(index)
+    for label, coeff in terms:
+        qubits = [n - 1 - pos for pos, char in enumerate(label) if char == "Z"]
+        if not qubits:
+            cost += coeff.real
+            continue
+        parity.fill(0)
+        for q in qubits:
+            parity ^= (index >> np.uint64(q)) & np.uint64(1)
+        # (-1) ** parity as coeff * (1 - 2 * parity)
+        cost += coeff.real * (1.0 - 2.0 * parity.astype(dtype))
+    return cost
+
+
+def pauli_masks(hamiltonian) -> tuple:
+    """
+    Compiles a Hamiltonian into bit masks for fast statevector expectation values.
+    :return: (x_masks, z_masks, coefficients). Bit q of a mask refers to qubit q; Y counts in both
+             masks and its factor of i is folded into the coefficient.
+    """
+    terms = pauli_terms(hamiltonian)
+    x_masks = np.zeros(len(terms), dtype=np.uint64)
+    z_masks = np.zeros(len(terms), dtype=np.uint64)
+    coefficients = np.zeros(len(terms), dtype=complex)
+    for k, (label, coeff) in enumerate(terms):
+        n = len(label)
+        for pos, char in enumerate(label):
+            bit = np.uint64(1 << (n - 1 - pos))
+            if char in "XY":
+                x_masks[k] |= bit
+            if char in "ZY":
+                z_masks[k] |= bit
+        coefficients[k] = coeff * 1j ** label.count("Y")
+    return x_masks, z_masks, coefficients
+
+
+def pauli_expectation(state: np.ndarray, masks: tuple) -> float:
+    """
+    Returns <state|H|state> for a Hamiltonian compiled with ``pauli_masks``.
+    Uses P|b> = i^nY (-1)^popcount(b & z) |b ^ x>, at O(2 ** n) per term.
+    """
+    index = np.arange(len(state), dtype=np.uint64)
+    total = 0.0
+    for x_mask, z_mask, coeff in zip(*masks):
+        parity = np.zeros_like(index)
+        bits = int(z_mask)
+        while bits:
+            low = bits & -bits
+            parity ^= (index >> np.uint64(low.bit_length() - 1)) & np.uint64(1)
+            bits ^= low
+        signs = 1.0 - 2.0 * parity
+        total += (coeff * np.vdot(state[index ^ x_mask], signs * state)).real
+    return float(total)
@@ -1,33 +1,113 @@
+import logging
+import numpy as np
 from qiskit import Aer, execute
 from qiskit.circuit.library import TwoLocal
 from qiskit.algorithms.optimizers import COBYLA
 from qiskit.algorithms import QAOA, VQE
 from qiskit.opflow import I, Z, X, PauliSumOp
+from quantum.warm_start import WarmStartStore
+from quantum.hamiltonians import is_diagonal, num_qubits
+from quantum.diagonal_qaoa import DiagonalQAOASimulator
+from quantum.parameter_sweep import ParameterSweep, sweep_tasks
+from quantum.pauli_grouping import GroupedExpectationEstimator, GroupedVQEResult
+from quantum.problem_builder import IsingProblem
+
+logger = logging.getLogger(__name__)
+
+# Largest diagonal problem simulated exactly on the fast path (the statevector holds 2 ** n amplitudes)
+MAX_DIAGONAL_QUBITS = 24
 
 class QuantumOptimizer:
-    def __init__(self, backend: str = "qasm_simulator"):
+    def __init__(self, backend: str = "qasm_simulator", warm_start: WarmStartStore = None):
+        """
+        :param backend: Name of the Aer backend.
+        :param warm_start: Optional store that seeds initial parameters from previously solved,
+                           identical or similar Hamiltonians and records new optima.
+        """
         self.backend = Aer.get_backend(backend)
+        self.warm_start = warm_start
 
-    def optimize_qaoa(self, problem: dict, p: int = 2):
+    def optimize_qaoa(self, problem: dict, p: int = 2, fast_path: bool = True):
         """
         Solves a combinatorial optimization problem using QAOA.
-        :param problem: A dictionary defining the problem Hamiltonian.
+        :param problem: A dictionary defining the problem, either as a 'hamiltonian' term list or as an
+                        'ising' IsingProblem built from sparse QUBO/Ising coefficients.
         :param p: The depth of the QAOA circuit.
+        :param fast_path: Simulate Z-only Hamiltonians (up to MAX_DIAGONAL_QUBITS) exactly with
+                          DiagonalQAOASimulator instead of the Qiskit QAOA primitive.
         :return: Optimal parameters and results.
         """
-        hamiltonian = PauliSumOp.from_list(problem['hamiltonian'])
-        qaoa = QAOA(optimizer=COBYLA(maxiter=200), reps=p)
-        result = qaoa.compute_minimum_eigenvalue(operator=hamiltonian)
+        hamiltonian = self._problem_hamiltonian(problem)
+        initial_point = self.warm_start.lookup(hamiltonian, "qaoa", p) if self.warm_start else None
+        if fast_path and is_diagonal(hamiltonian) and num_qubits(hamiltonian) <= MAX_DIAGONAL_QUBITS:
+            result = DiagonalQAOASimulator(hamiltonian).minimize(p, initial_point, maxiter=200)
+        else:
+            if isinstance(hamiltonian, IsingProblem):
+                operator = PauliSumOp(hamiltonian.to_sparse_pauli_op())
+            else:
+                operator = PauliSumOp.from_list(hamiltonian)
+            qaoa = QAOA(optimizer=COBYLA(maxiter=200), reps=p, initial_point=initial_point)
+            result = qaoa.compute_minimum_eigenvalue(operator=operator)
+        if self.warm_start:
+            self.warm_start.record(hamiltonian, result.optimal_point, result.eigenvalue.real, "qaoa", p)
         return result
 
-    def optimize_vqe(self, hamiltonian, ansatz: str = "TwoLocal"):
+    @staticmethod
+    def _problem_hamiltonian(problem: dict):
+        """Returns the problem's IsingProblem when present, otherwise its 'hamiltonian' term list."""
+        return problem['ising'] if 'ising' in problem else problem['hamiltonian']
+
+    def optimize_vqe(self, hamiltonian, ansatz: str = "TwoLocal", grouping: bool = False, shots: int = 1024):
         """
         Solves a quantum chemistry or optimization problem using VQE.
         :param hamiltonian: The problem Hamiltonian.
         :param ansatz: Ansatz circuit type, default is "TwoLocal".
+        :param grouping: Measure qubit-wise-commuting groups of Pauli terms with one circuit each
+                         (all groups in a single job per iteration) instead of term by term.
+        :param shots: Shots per group circuit when grouping.
         :return: Ground state energy and parameters.
         """
         ansatz_circuit = TwoLocal(rotation_blocks=['ry', 'rz'], entanglement_blocks='cz') if ansatz == "TwoLocal" else None
-        vqe = VQE(ansatz=ansatz_circuit, optimizer=COBYLA(maxiter=200), quantum_instance=self.backend)
-        result = vqe.compute_minimum_eigenvalue(operator=hamiltonian)
+        initial_point = self.warm_start.lookup(hamiltonian, ansatz) if self.warm_start else None
+        if grouping:
+            result = self._optimize_vqe_grouped(hamiltonian, initial_point, shots)
+        else:
+            vqe = VQE(ansatz=ansatz_circuit, optimizer=COBYLA(maxiter=200), initial_point=initial_point,
+                      quantum_instance=self.backend)
+            result = vqe.compute_minimum_eigenvalue(operator=hamiltonian)
+        if self.warm_start:
+            self.warm_start.record(hamiltonian, result.optimal_point, result.eigenvalue.real, ansatz)
         return result
+
+    def _optimize_vqe_grouped(self, hamiltonian, initial_point, shots: int) -> GroupedVQEResult:
+        """VQE loop whose energy evaluations use cached qubit-wise-commuting measurement groups."""
+        ansatz_circuit = TwoLocal(num_qubits(hamiltonian), rotation_blocks=['ry', 'rz'], entanglement_blocks='cz')
+        estimator = GroupedExpectationEstimator(self.backend, shots=shots)
+        if initial_point is None:
+            initial_point = np.random.uniform(-np.pi, np.pi, ansatz_circuit.num_parameters)
+        result = COBYLA(maxiter=200).minimize(lambda x: estimator.estimate(ansatz_circuit, x, hamiltonian), initial_point)
+
+        groups = estimator.groups(hamiltonian)
+        circuits_per_iteration = sum(1 for g in groups if g["basis"] is not None)
+        ungrouped = sum(len(g["terms"]) for g in groups if g["basis"] is not None)
+        logger.info("Grouped VQE executed %d circuits per iteration instead of %d (%d circuits in total).",
+                    circuits_per_iteration, ungrouped, estimator.circuits_executed)
+        return GroupedVQEResult(result.x, float(result.fun), result.nfev, circuits_per_iteration, ungrouped)
+
+    def sweep(self, problem: dict, depths=(1, 2, 3), ansatzes=("qaoa",), seeds=range(4), initial_points=(None,),
+              max_workers: int = None, target_energy: float = None) -> dict:
+        """
+        Runs QAOA/VQE restarts for every (depth, ansatz, seed, initial point) combination in parallel.
+        :param problem: A dictionary defining the problem Hamiltonian.
+        :param depths: QAOA depths p (or TwoLocal reps).
+        :param ansatzes: "qaoa" (diagonal Hamiltonians only) and/or "TwoLocal".
+        :param seeds: Seeds for random initial points.
+        :param initial_points: Explicit initial points; None draws one from the seed.
+        :param max_workers: Number of worker processes.
+        :param target_energy: Stop the sweep as soon as a run reaches this energy.
+        :return: The lowest-energy result (dict with 'task', 'energy', 'point' and 'evaluations').
+        """
+        tasks = sweep_tasks(depths, ansatzes, seeds, initial_points)
+        with ParameterSweep(self._problem_hamiltonian(problem), max_workers=max_workers) as parameter_sweep:
+            return parameter_sweep.best(tasks, target_energy)
+
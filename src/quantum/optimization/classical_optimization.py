@@ -1,22 +1,47 @@
 import numpy as np
+from optimization.gradient_engine import GradientDescentEngine
+from optimization.gradient_estimators import make_gradient
 
 class ClassicalOptimizer:
-    def gradient_descent(self, func, grad_func, initial_guess, learning_rate=0.01, max_iter=100):
+    def gradient_descent(self, func, grad_func, initial_guess, learning_rate=0.01, max_iter=100, gradient_method="fd"):
         """
         Performs gradient descent optimization.
         :param func: Objective function.
-        :param grad_func: Gradient of the function.
+        :param grad_func: Gradient of the function, or None to estimate it from func.
         :param initial_guess: Initial point.
         :param learning_rate: Step size.
         :param max_iter: Maximum number of iterations.
+        :param gradient_method: Estimator used when grad_func is None: "fd" (central finite
+                                differences) or "spsa" (two evaluations per step).
         :return: Optimal point and value.
         """
-        x = initial_guess
+        if grad_func is None:
+            grad_func = make_gradient(func, gradient_method)
+        x = np.array(initial_guess, dtype=float)  # Work on a copy so the caller's guess is left intact
         for _ in range(max_iter):
             grad = grad_func(x)
             x -= learning_rate * grad
         return x, func(x)
 
+    def multistart_gradient_descent(self, func, grad_func, initial_points, vectorized=True, n_jobs=None,
+                                    gradient_method="fd", **engine_options):
+        """
+        Runs convergence-aware gradient descent from many start points and keeps the best one.
+        :param func: Objective function.
+        :param grad_func: Gradient of the function, or None to estimate it from func.
+        :param initial_points: Array of start points, shape (starts, d).
+        :param vectorized: Whether func and grad_func accept a (starts, d) batch.
+        :param n_jobs: Number of worker processes for non-vectorized objectives.
+        :param gradient_method: Estimator used when grad_func is None ("fd" or "spsa").
+        :param engine_options: Options for GradientDescentEngine (step_rule, learning_rate, max_iter, grad_tol, ...).
+        :return: Optimal point and value.
+        """
+        if grad_func is None:
+            grad_func = make_gradient(func, gradient_method, vectorized=vectorized)
+        engine = GradientDescentEngine(**engine_options)
+        result = engine.minimize(func, grad_func, initial_points, vectorized=vectorized, n_jobs=n_jobs)
+        return result["x"], result["value"]
+
     def simulated_annealing(self, func, bounds, max_iter=1000, temp=1000):
         """
         Performs simulated annealing optimization.
@@ -27,15 +52,98 @@ class ClassicalOptimizer:
         :return: Optimal point and value.
         """
         x = np.random.uniform(bounds[:, 0], bounds[:, 1])
-        best_x = x
-        best_val = func(x)
+        current_val = func(x)
+        best_x, best_val = x, current_val
         for _ in range(max_iter):
             new_x = x + np.random.uniform(-1, 1, size=x.shape)
             new_x = np.clip(new_x, bounds[:, 0], bounds[:, 1])
-            delta = func(new_x) - func(x)
+            new_val = func(new_x)
+            delta = new_val - current_val
             if delta < 0 or np.exp(-delta / temp) > np.random.rand():
-                x = new_x
-                if func(x) < best_val:
-                    best_x, best_val = x, func(x)
+                x, current_val = new_x, new_val
+                if current_val < best_val:
+                    best_x, best_val = x, current_val
             temp *= 0.99  # Cooling
         return best_x, best_val
+
+    def simulated_annealing_chains(self, func, bounds, n_chains=8, max_iter=1000, temp=1000, vectorized=True,
+                                   swap_interval=None, min_temp_ratio=1e-2, seed=None):
+        """
+        Runs several simulated annealing chains at once on an (n_chains, d) array of states.
+        :param func: Objective function. With ``vectorized`` it maps an (n_chains, d) array to
+                     (n_chains,) values in one call; otherwise it is called once per chain.
+        :param bounds: Bounds for variables, shape (d, 2).
+        :param n_chains: Number of independent chains.
+        :param max_iter: Maximum number of iterations.
+        :param temp: Initial temperature (of the hottest chain when tempering).
+        :param vectorized: Whether ``func`` accepts a whole batch of points.
+        :param swap_interval: If set, run parallel tempering: chains sit on a geometric temperature
+                              ladder from ``temp`` down to ``temp * min_temp_ratio`` and neighbouring
+                              chains try to exchange states every ``swap_interval`` iterations.
+        :param min_temp_ratio: Coldest-to-hottest temperature ratio of the tempering ladder.
+        :param seed: Seed for the random generator.
+        :return: Best point, best value, and a dict of per-chain traces.
+        """
+        rng = np.random.default_rng(seed)
+        bounds = np.asarray(bounds, dtype=float)
+
+        def evaluate(points):
+            if vectorized:
+                return np.asarray(func(points), dtype=float)
+            return np.array([func(point) for point in points], dtype=float)
+
+        if swap_interval:
+            temps = np.geomspace(temp, temp * min_temp_ratio, n_chains)
+        else:
+            temps = np.full(n_chains, float(temp))
+
+        x = rng.uniform(bounds[:, 0], bounds[:, 1], size=(n_chains, len(bounds)))
+        energies = evaluate(x)  # Current energy of every chain, kept up to date instead of recomputed
+        best_x, best_vals = x.copy(), energies.copy()
+
+        energy_trace = np.empty((max_iter, n_chains))
+        best_trace = np.empty((max_iter, n_chains))
+        accepted = np.zeros(n_chains, dtype=int)
+        swaps_attempted = swaps_accepted = 0
+
+        for it in range(max_iter):
+            new_x = np.clip(x + rng.uniform(-1, 1, size=x.shape), bounds[:, 0], bounds[:, 1])
+            new_energies = evaluate(new_x)
+            delta = new_energies - energies
+            with np.errstate(over='ignore'):
+                accept = (delta < 0) | (np.exp(-delta / temps) > rng.random(n_chains))
+            x[accept] = new_x[accept]
+            energies[accept] = new_energies[accept]
+            accepted += accept
+
+            improved = energies < best_vals
+            best_x[improved] = x[improved]
+            best_vals[improved] = energies[improved]
+
+            if swap_interval and n_chains > 1 and (it + 1) % swap_interval == 0:
+                # Alternate between even and odd neighbour pairs so every pair gets a chance
+                i = np.arange((it // swap_interval) % 2, n_chains - 1, 2)
+                j = i + 1
+                with np.errstate(over='ignore'):
+                    log_ratio = (energies[i] - energies[j]) * (1 / temps[i] - 1 / temps[j])
+                    swap = (log_ratio >= 0) | (np.exp(log_ratio) > rng.random(len(i)))
+                a, b = i[swap], j[swap]
+                x[a], x[b] = x[b], x[a].copy()
+                energies[a], energies[b] = energies[b], energies[a].copy()
+                swaps_attempted += len(i)
+                swaps_accepted += int(swap.sum())
+
+            energy_trace[it] = energies
+            best_trace[it] = best_vals
+            temps = temps * 0.99  # Cooling
+
+        best = int(np.argmin(best_vals))
+        traces = {
+            "energies": energy_trace,
+            "best_values": best_trace,
+            "chain_best_x": best_x,
+            "chain_best_values": best_vals,
+            "acceptance_rate": accepted / max(max_iter, 1),
+            "swap_rate": swaps_accepted / swaps_attempted if swaps_attempted else 0.0,
+        }
+        return best_x[best], best_vals[best], traces
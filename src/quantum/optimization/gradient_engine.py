@@ -0,0 +1,117 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+STEP_RULES = ("sgd", "momentum", "adam", "bb")
+
+
+def _minimize_start(engine, func, grad_func, x0):
+    """Runs one start point in a worker process (module-level so it can be pickled)."""
+    return engine._run(func, grad_func, np.atleast_2d(x0), vectorized=False)
+
+
+class GradientDescentEngine:
+    def __init__(self, step_rule: str = "adam", learning_rate: float = 0.01, max_iter: int = 1000,
+                 grad_tol: float = 1e-6, rel_tol: float = 1e-9, momentum: float = 0.9, beta1: float = 0.9,
+                 beta2: float = 0.999, epsilon: float = 1e-8):
+        """
+        Multi-start gradient descent with convergence checks and adaptive step rules.
+        :param step_rule: "sgd", "momentum" (heavy ball), "adam", or "bb" (Barzilai-Borwein step sizes).
+        :param learning_rate: Base step size (initial step for "bb").
+        :param max_iter: Maximum number of iterations per start.
+        :param grad_tol: A start converges when its gradient norm drops to this value.
+        :param rel_tol: A start also converges when a step moves it by less than rel_tol * (|x| + rel_tol).
+        :param momentum: Momentum coefficient for "momentum".
+        :param beta1: First-moment decay for "adam".
+        :param beta2: Second-moment decay for "adam".
+        :param epsilon: Numerical guard for "adam" and "bb".
+        """
+        if step_rule not in STEP_RULES:
+            raise ValueError(f"Unknown step rule '{step_rule}', expected one of {STEP_RULES}.")
+        self.step_rule = step_rule
+        self.learning_rate = learning_rate
+        self.max_iter = max_iter
+        self.grad_tol = grad_tol
+        self.rel_tol = rel_tol
+        self.momentum = momentum
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def minimize(self, func, grad_func, initial_points, vectorized: bool = True, n_jobs: int = None) -> dict:
+        """
+        Minimizes ``func`` from every row of ``initial_points``.
+        :param func: Objective. With ``vectorized`` it maps (starts, d) to (starts,), otherwise (d,) to a float.
+        :param grad_func: Gradient, with the same calling convention as ``func``.
+        :param initial_points: Array of shape (starts, d) or (d,); it is never modified.
+        :param vectorized: Whether ``func`` and ``grad_func`` accept a whole batch of points.
+        :param n_jobs: For non-vectorized objectives, fan the starts out over this many processes.
+        :return: Dict with the best point ('x') and value ('value'), plus per-start 'points', 'values',
+                 'iterations' and 'converged'.
+        """
+        starts = np.atleast_2d(np.array(initial_points, dtype=float))
+        if not vectorized and n_jobs and n_jobs > 1 and len(starts) > 1:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                runs = list(executor.map(partial(_minimize_start, self, func, grad_func), starts))
+            result = {key: np.concatenate([run[key] for run in runs]) for key in ("points", "values", "iterations", "converged")}
+        else:
+            result = self._run(func, grad_func, starts, vectorized)
+        best = int(np.argmin(result["values"]))
+        result["x"] = result["points"][best]
+        result["value"] = float(result["values"][best])
+        return result
+
+    def _run(self, func, grad_func, x, vectorized: bool) -> dict:
+        if not vectorized:
+            row_func, row_grad = func, grad_func
+            func = lambda points: np.array([row_func(p) for p in points], dtype=float)
+            grad_func = lambda points: np.array([row_grad(p) for p in points], dtype=float)
+
+        n_starts = len(x)
+        active = np.ones(n_starts, dtype=bool)
+        iterations = np.zeros(n_starts, dtype=int)
+        velocity = np.zeros_like(x)
+        second_moment = np.zeros_like(x)
+        step_sizes = np.full(n_starts, self.learning_rate)
+        prev_x, prev_grad = None, None
+
+        for it in range(1, self.max_iter + 1):
+            idx = np.flatnonzero(active)
+            if not len(idx):
+                break
+            grad = np.asarray(grad_func(x[idx]), dtype=float).reshape(len(idx), -1)
+            converged = np.linalg.norm(grad, axis=1) <= self.grad_tol
+
+            if self.step_rule == "sgd":
+                step = self.learning_rate * grad
+            elif self.step_rule == "momentum":
+                velocity[idx] = self.momentum * velocity[idx] + grad
+                step = self.learning_rate * velocity[idx]
+            elif self.step_rule == "adam":
+                velocity[idx] = self.beta1 * velocity[idx] + (1 - self.beta1) * grad
+                second_moment[idx] = self.beta2 * second_moment[idx] + (1 - self.beta2) * grad ** 2
+                m_hat = velocity[idx] / (1 - self.beta1 ** it)
+                v_hat = second_moment[idx] / (1 - self.beta2 ** it)
+                step = self.learning_rate * m_hat / (np.sqrt(v_hat) + self.epsilon)
+            else:
+                if prev_grad is not None:
+                    # Barzilai-Borwein: alpha = s.s / s.y from the last step s and gradient change y
+                    s = x[idx] - prev_x[idx]
+                    y = grad - prev_grad[idx]
+                    sy = np.sum(s * y, axis=1)
+                    ok = sy > self.epsilon
+                    step_sizes[idx[ok]] = np.sum(s[ok] ** 2, axis=1) / sy[ok]
+                if prev_grad is None:
+                    prev_x, prev_grad = x.copy(), np.zeros_like(x)
+                prev_x[idx] = x[idx]
+                prev_grad[idx] = grad
+                step = step_sizes[idx, None] * grad
+
+            step[converged] = 0.0
+            x[idx] -= step
+            iterations[idx] = it
+            small_step = np.linalg.norm(step, axis=1) <= self.rel_tol * (np.linalg.norm(x[idx], axis=1) + self.rel_tol)
+            active[idx[converged | small_step]] = False
+
+        values = np.asarray(func(x), dtype=float).reshape(n_starts)
+        return {"points": x, "values": values, "iterations": iterations, "converged": ~active}
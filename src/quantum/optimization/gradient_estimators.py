@@ -0,0 +1,89 @@
+import numpy as np
+
+GRADIENT_METHODS = ("fd", "spsa")
+
+
+def _evaluate(func, points: np.ndarray, vectorized: bool) -> np.ndarray:
+    """Evaluates ``func`` on a (m, d) batch, in one call when the objective is vectorized."""
+    if vectorized:
+        return np.asarray(func(points), dtype=float).reshape(len(points))
+    return np.array([func(p) for p in points], dtype=float)
+
+
+class FiniteDifferenceGradient:
+    def __init__(self, func, epsilon: float = 1e-6, vectorized: bool = False):
+        """
+        Central finite-difference gradient of a black-box objective.
+
+        All 2d perturbed points of a d-dimensional gradient are evaluated in a single batched call
+        when the objective is vectorized.
+        :param func: Objective; maps (d,) to a float, or (m, d) to (m,) when ``vectorized``.
+        :param epsilon: Perturbation size.
+        :param vectorized: Whether ``func`` accepts a batch of points.
+        """
+        self.func = func
+        self.epsilon = epsilon
+        self.vectorized = vectorized
+        self.evaluations = 0
+
+    def __call__(self, x) -> np.ndarray:
+        """Returns the gradient at ``x`` of shape (d,), or at each row of a (m, d) batch."""
+        x = np.asarray(x, dtype=float)
+        points = np.atleast_2d(x)
+        m, d = points.shape
+        offsets = self.epsilon * np.eye(d)
+        # Rows are [x + e_0, ..., x + e_{d-1}, x - e_0, ..., x - e_{d-1}] for every point
+        perturbed = points[:, None, :] + np.concatenate([offsets, -offsets])[None, :, :]
+        values = _evaluate(self.func, perturbed.reshape(m * 2 * d, d), self.vectorized).reshape(m, 2, d)
+        self.evaluations += m * 2 * d
+        grad = (values[:, 0] - values[:, 1]) / (2 * self.epsilon)
+        return grad.reshape(x.shape)
+
+
+class SPSAGradient:
+    def __init__(self, func, c: float = 0.1, gamma: float = 0.101, vectorized: bool = False, seed: int = None):
+        """
+        Simultaneous-perturbation (SPSA) gradient estimate: two evaluations per step whatever the dimension.
+        :param func: Objective; maps (d,) to a float, or (m, d) to (m,) when ``vectorized``.
+        :param c: Initial perturbation size; it decays as c / (k + 1) ** gamma over successive calls.
+        :param gamma: Perturbation decay exponent.
+        :param vectorized: Whether ``func`` accepts a batch of points.
+        :param seed: Seed for the random perturbation directions.
+        """
+        self.func = func
+        self.c = c
+        self.gamma = gamma
+        self.vectorized = vectorized
+        self.rng = np.random.default_rng(seed)
+        self.calls = 0
+        self.evaluations = 0
+
+    def __call__(self, x) -> np.ndarray:
+        """Returns the gradient estimate at ``x`` of shape (d,), or at each row of a (m, d) batch."""
+        x = np.asarray(x, dtype=float)
+        points = np.atleast_2d(x)
+        m, d = points.shape
+        c_k = self.c / (self.calls + 1) ** self.gamma
+        self.calls += 1
+        delta = self.rng.choice([-1.0, 1.0], size=(m, d))
+        values = _evaluate(self.func, np.concatenate([points + c_k * delta, points - c_k * delta]), self.vectorized)
+        self.evaluations += 2 * m
+        # Rademacher directions satisfy 1 / delta == delta
+        grad = ((values[:m] - values[m:]) / (2 * c_k))[:, None] * delta
+        return grad.reshape(x.shape)
+
+
+def make_gradient(func, method: str = "fd", vectorized: bool = False, **options):
+    """
+    Builds a gradient estimator for an objective without an analytic gradient.
+    :param func: Objective function.
+    :param method: "fd" for central finite differences or "spsa".
+    :param vectorized: Whether ``func`` accepts a batch of points.
+    :param options: Estimator options (epsilon for "fd"; c, gamma, seed for "spsa").
+    :return: A callable mapping points to gradient estimates.
+    """
+    if method == "fd":
+        return FiniteDifferenceGradient(func, vectorized=vectorized, **options)
+    if method == "spsa":
+        return SPSAGradient(func, vectorized=vectorized, **options)
+    raise ValueError(f"Unknown gradient method '{method}', expected one of {GRADIENT_METHODS}.")
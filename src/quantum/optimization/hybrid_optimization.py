@@ -1,5 +1,6 @@
 from quantum.optimization import QuantumOptimizer
 from optimization.classical_optimization import ClassicalOptimizer
+from optimization.qubo_annealer import QUBOAnnealer
 
 class HybridOptimizer:
     def __init__(self):
@@ -9,7 +10,8 @@ class HybridOptimizer:
     def optimize(self, problem: dict, initial_guess: list):
         """
         Hybrid optimization combining QAOA and gradient descent.
-        :param problem: Optimization problem.
+        :param problem: Optimization problem. 'gradient' is optional; without it the gradient is
+                        estimated with problem['gradient_method'] ("fd" by default, or "spsa").
         :param initial_guess: Initial parameters for classical refinement.
         :return: Final optimized parameters and value.
         """
@@ -17,7 +19,26 @@ class HybridOptimizer:
         initial_params = quantum_result.optimal_parameters
         refined_result = self.classical_optimizer.gradient_descent(
             func=problem['objective'],
-            grad_func=problem['gradient'],
+            grad_func=problem.get('gradient'),
             initial_guess=initial_params,
+            gradient_method=problem.get('gradient_method', 'fd'),
         )
         return refined_result
+
+    def presolve_qubo(self, problem: dict, num_sweeps: int = 1000, num_reads: int = 1, seed: int = None):
+        """
+        Classical pre-solve of a combinatorial problem with the incremental QUBO annealer.
+        :param problem: Optimization problem with a 'qubo' entry (dense, scipy.sparse or {(i, j): value}),
+                        or an 'ising' IsingProblem shared with the QAOA side.
+        :param num_sweeps: Annealing sweeps per read.
+        :param num_reads: Independent annealing restarts.
+        :param seed: Seed for the random generator.
+        :return: Best bit assignment and its energy.
+        """
+        if 'qubo' in problem:
+            qubo, offset = problem['qubo'], 0.0
+        else:
+            qubo, offset = problem['ising'].to_qubo()
+        annealer = QUBOAnnealer(qubo)
+        x, energy = annealer.anneal(num_sweeps=num_sweeps, num_reads=num_reads, seed=seed)
+        return x, energy + offset
@@ -0,0 +1,173 @@
+import numpy as np
+import scipy.sparse
+from quantum.problem_builder import to_coo
+
+
+class QUBOAnnealer:
+    # Below this mean color-class size, sweeps fall back to flipping one variable at a time
+    MIN_CLASS_SIZE = 8
+
+    def __init__(self, qubo, num_variables: int = None):
+        """
+        Single-bit-flip simulated annealer for QUBO problems, minimizing E(x) = x^T Q x over x in {0, 1}^n.
+
+        Q is stored as a diagonal (linear) part plus a symmetric, zero-diagonal CSR coupling matrix,
+        so the energy change of a flip costs O(1) and refreshing the local fields costs O(degree).
+        Sweeps update one color class of the coupling graph at a time: variables of a class are
+        not coupled to each other, so all of them (in all reads) are proposed in one array step.
+        Requires scipy, both to read the input (``quantum.problem_builder.to_coo``) and for the
+        sparse coupling columns of the color classes.
+        :param qubo: Dense array, scipy.sparse matrix, or dict mapping (i, j) to coefficients.
+        :param num_variables: Number of variables (only needed for dicts with trailing unused variables).
+        """
+        rows, cols, values, n = to_coo(qubo, num_variables)
+        self.num_variables = n
+        self.linear = np.bincount(rows[rows == cols], weights=values[rows == cols], minlength=n)
+
+        # Symmetrize the off-diagonal part: W_ij = W_ji = Q_ij + Q_ji
+        off = rows != cols
+        sym_rows = np.concatenate([rows[off], cols[off]])
+        sym_cols = np.concatenate([cols[off], rows[off]])
+        sym_values = np.concatenate([values[off], values[off]])
+
+        # Sort into CSR order and merge duplicate entries
+        order = np.lexsort((sym_cols, sym_rows))
+        sym_rows, sym_cols, sym_values = sym_rows[order], sym_cols[order], sym_values[order]
+        keys = sym_rows * n + sym_cols
+        unique_keys, start = np.unique(keys, return_index=True)
+        self.data = np.add.reduceat(sym_values, start) if len(start) else np.zeros(0)
+        self.indices = (unique_keys % n).astype(np.int64)
+        row_of_entry = unique_keys // n
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(row_of_entry, minlength=n))]).astype(np.int64)
+        self._row_of_entry = row_of_entry
+        self._color_classes = None
+
+    def local_fields(self, x: np.ndarray) -> np.ndarray:
+        """Returns W @ x, the coupling field acting on every variable (batched over leading axes)."""
+        x = np.asarray(x, dtype=float)
+        contributions = self.data * x[..., self.indices]
+        if x.ndim == 1:
+            return np.bincount(self._row_of_entry, weights=contributions, minlength=self.num_variables)
+        flat = contributions.reshape(-1, len(self.data))
+        fields = np.array([np.bincount(self._row_of_entry, weights=c, minlength=self.num_variables) for c in flat])
+        return fields.reshape(x.shape)
+
+    def energy(self, x) -> np.ndarray:
+        """Evaluates E(x) for one assignment of shape (n,) or a batch of shape (batch, n)."""
+        x = np.asarray(x, dtype=float)
+        return x @ self.linear + 0.5 * np.sum(x * self.local_fields(x), axis=-1)
+
+    def default_temperatures(self) -> tuple:
+        """
+        Picks a temperature range from the problem's energy scale: the hottest temperature accepts
+        the largest possible uphill flip half of the time, the coldest accepts the smallest 1% of the time.
+        """
+        magnitude = np.abs(self.linear) + np.bincount(self._row_of_entry, weights=np.abs(self.data),
+                                                      minlength=self.num_variables)
+        nonzero = np.abs(np.concatenate([self.linear, self.data]))
+        nonzero = nonzero[nonzero > 0]
+        if not len(nonzero):
+            return 1.0, 1e-3
+        return max(magnitude.max() / np.log(2), 1e-9), max(nonzero.min() / np.log(100), 1e-9)
+
+    def color_classes(self) -> list:
+        """
+        Partitions the variables into independent sets of the coupling graph (greedy coloring,
+        highest degree first). Computed once and cached.
+        :return: List of (variables, coupling columns) pairs, where the coupling columns are the
+                 CSR matrix W[:, variables] used to update the local fields after flips.
+        """
+        if self._color_classes is None:
+            n, indptr, indices = self.num_variables, self.indptr, self.indices
+            colors = np.full(n, -1, dtype=np.int64)
+            for v in np.argsort(-np.diff(indptr), kind="stable").tolist():
+                neighbor_colors = colors[indices[indptr[v]:indptr[v + 1]]]
+                used = np.zeros(len(neighbor_colors) + 1, dtype=bool)
+                used[neighbor_colors[(neighbor_colors >= 0) & (neighbor_colors < len(used))]] = True
+                colors[v] = int(np.argmin(used))  # Smallest color no neighbor has
+            coupling = scipy.sparse.csc_matrix((self.data, self.indices, self.indptr), shape=(n, n))
+            self._color_classes = []
+            for color in range(int(colors.max()) + 1 if n else 0):
+                variables = np.flatnonzero(colors == color)
+                self._color_classes.append((variables, coupling[:, variables].tocsr()))
+        return self._color_classes
+
+    def anneal(self, num_sweeps: int = 1000, num_reads: int = 1, temp_range: tuple = None, initial_state=None,
+               seed: int = None):
+        """
+        Anneals with single-bit flips on a geometric cooling schedule.
+        :param num_sweeps: Number of sweeps; each sweep proposes a flip of every variable once, visiting
+                           the color classes in random order.
+        :param num_reads: Number of independent restarts, annealed together as one batch.
+        :param temp_range: (hot, cold) temperatures; derived from the coefficients when omitted.
+        :param initial_state: Optional starting assignment of shape (n,).
+        :param seed: Seed for the random generator.
+        :return: Best assignment (int8 array) and its energy.
+        """
+        rng = np.random.default_rng(seed)
+        n = self.num_variables
+        hot, cold = temp_range if temp_range is not None else self.default_temperatures()
+        temps = np.geomspace(hot, cold, max(num_sweeps, 1))
+        if initial_state is not None:
+            x = np.tile(np.asarray(initial_state, dtype=np.int8), (num_reads, 1))
+        else:
+            x = rng.integers(0, 2, size=(num_reads, n)).astype(np.int8)
+
+        classes = self.color_classes()
+        if len(classes) * self.MIN_CLASS_SIZE > n:
+            # Densely coupled: classes are too small for array steps to pay off
+            results = [self._anneal_sequential(row, temps, rng) for row in x]
+            best = int(np.argmin([energy for _, energy in results]))
+            return results[best]
+
+        # All reads run side by side as rows of one (num_reads, n) array
+        fields = self.local_fields(x)
+        energy = np.asarray(self.energy(x), dtype=float)
+        best_x, best_energy = x.copy(), energy.copy()
+
+        for temp in temps:
+            for c in rng.permutation(len(classes)).tolist():
+                variables, coupling = classes[c]
+                sign = 1 - 2 * x[:, variables]  # +1 when flipping 0 -> 1, -1 when flipping 1 -> 0
+                delta = sign * (self.linear[variables] + fields[:, variables])
+                # Accept a flip when delta <= -T log(u), i.e. with probability min(1, exp(-delta / T))
+                flip = delta <= -temp * np.log(rng.random(delta.shape))
+                if not flip.any():
+                    continue
+                x[:, variables] ^= flip.astype(np.int8)
+                energy += np.where(flip, delta, 0.0).sum(axis=1)
+                # Variables of a class are uncoupled, so their flips only move the fields of other classes
+                fields += (coupling @ np.where(flip, sign, 0).T.astype(float)).T
+            improved = energy < best_energy
+            best_x[improved] = x[improved]
+            best_energy[improved] = energy[improved]
+
+        best = int(np.argmin(best_energy))
+        return best_x[best], float(best_energy[best])
+
+    def _anneal_sequential(self, x: np.ndarray, temps: np.ndarray, rng) -> tuple:
+        """Anneals one read flip by flip, in a random variable order per sweep."""
+        n = self.num_variables
+        linear, indptr, indices, data = self.linear, self.indptr, self.indices, self.data
+        x = x.copy()
+        fields = self.local_fields(x)
+        energy = float(self.energy(x))
+        read_best_x, read_best_energy = x.copy(), energy
+
+        for temp in temps:
+            order = rng.permutation(n)
+            # Accept a flip when delta <= -T log(u), i.e. with probability min(1, exp(-delta / T))
+            thresholds = -temp * np.log(rng.random(n))
+            for i, threshold in zip(order.tolist(), thresholds.tolist()):
+                sign = 1 - 2 * int(x[i])  # +1 when flipping 0 -> 1, -1 when flipping 1 -> 0
+                delta = sign * (linear[i] + fields[i])
+                if delta <= threshold:
+                    x[i] ^= 1
+                    energy += delta
+                    start, end = indptr[i], indptr[i + 1]
+                    if start != end:
+                        fields[indices[start:end]] += sign * data[start:end]
+            if energy < read_best_energy:
+                read_best_x, read_best_energy = x.copy(), energy
+
+        return read_best_x, float(read_best_energy)
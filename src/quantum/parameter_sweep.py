@@ -0,0 +1,193 @@
+import itertools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import numpy as np
+from scipy.optimize import minimize
+from quantum.circuit_ops import num_parameter_slots, two_local_ops
+from quantum.diagonal_qaoa import DiagonalQAOASimulator
+from quantum.hamiltonians import diagonal_cost_vector, is_diagonal, num_qubits, pauli_expectation, pauli_masks
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+logger = logging.getLogger(__name__)
+
+# Per-worker state, filled once by _init_worker when the pool starts
+_WORKER = {}
+
+
+class SweepCancelled(Exception):
+    """Raised inside a worker when another task already reached the target energy."""
+
+
+def _init_worker(shm_name, size, masks, n, stop_event):
+    """Attaches the worker to the shared Hamiltonian once, instead of receiving it with every task."""
+    if shm_name is not None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _WORKER["shm"] = shm  # Keep the mapping alive for the lifetime of the worker
+        _WORKER["cost"] = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+    else:
+        _WORKER["cost"] = None
+    _WORKER["masks"] = masks
+    _WORKER["num_qubits"] = n
+    _WORKER["stop"] = stop_event
+
+
+def _run_task(task: dict, maxiter: int) -> dict:
+    """Runs one optimizer trajectory of a sweep inside a worker."""
+    cost, masks, n, stop = _WORKER["cost"], _WORKER["masks"], _WORKER["num_qubits"], _WORKER["stop"]
+    rng = np.random.default_rng(task.get("seed"))
+
+    if task["ansatz"] == "qaoa":
+        if cost is None:
+            raise ValueError("QAOA sweeps require a diagonal (Z-only) Hamiltonian.")
+        simulator = DiagonalQAOASimulator(cost)
+        energy = simulator.expectation
+        n_params = 2 * task["depth"]
+        default_point = lambda: rng.uniform(0, np.pi, n_params)
+    elif task["ansatz"] == "TwoLocal":
+        backend = NumpyStatevectorBackend()
+        ops = two_local_ops(n, task["depth"])
+        n_params = num_parameter_slots(ops)
+
+        def energy(point):
+            state = backend.statevectors(ops, n, point[None, :])[0]
+            if cost is not None:
+                return float(np.dot(np.abs(state) ** 2, cost))
+            return pauli_expectation(state, masks)
+        default_point = lambda: rng.uniform(-np.pi, np.pi, n_params)
+    else:
+        raise ValueError(f"Unsupported ansatz for sweeps: {task['ansatz']}")
+
+    evaluations = [0]
+
+    def objective(point):
+        if stop.is_set():
+            raise SweepCancelled()
+        evaluations[0] += 1
+        return energy(point)
+
+    initial_point = task.get("initial_point")
+    initial_point = default_point() if initial_point is None else np.asarray(initial_point, dtype=float)
+    try:
+        result = minimize(objective, initial_point, method="COBYLA", options={"maxiter": maxiter})
+        return {"task": task, "energy": float(result.fun), "point": result.x, "evaluations": evaluations[0],
+                "cancelled": False}
+    except SweepCancelled:
+        return {"task": task, "energy": None, "point": None, "evaluations": evaluations[0], "cancelled": True}
+
+
+def sweep_tasks(depths=(1,), ansatzes=("qaoa",), seeds=(0,), initial_points=(None,)) -> list:
+    """Returns the cartesian product of sweep settings as a list of task dicts."""
+    return [{"ansatz": ansatz, "depth": depth, "seed": seed, "initial_point": point}
+            for ansatz, depth, seed, point in itertools.product(ansatzes, depths, seeds, initial_points)]
+
+
+class ParameterSweep:
+    def __init__(self, hamiltonian, max_workers: int = None, maxiter: int = 200):
+        """
+        Fans QAOA/VQE optimizer trajectories out over a process pool.
+
+        The Hamiltonian is compiled once in the parent. A diagonal cost vector is placed in shared
+        memory and mapped by every worker; other Hamiltonians are compiled to Pauli masks and sent
+        once per worker at pool start-up.
+        :param hamiltonian: Problem Hamiltonian (see ``quantum.hamiltonians.pauli_terms``).
+        :param max_workers: Number of worker processes (defaults to the CPU count).
+        :param maxiter: Maximum COBYLA iterations per task.
+        """
+        self.maxiter = maxiter
+        self.num_qubits = num_qubits(hamiltonian)
+        self._shm = None
+        self._executor = None
+        self._lock = threading.Lock()  # Serializes starting a run against cancellation
+        self._running = False
+        masks = None
+        try:
+            if is_diagonal(hamiltonian):
+                cost = diagonal_cost_vector(hamiltonian)
+                self._shm = shared_memory.SharedMemory(create=True, size=cost.nbytes)
+                np.ndarray(cost.shape, dtype=cost.dtype, buffer=self._shm.buf)[:] = cost
+                shm_name, size = self._shm.name, len(cost)
+            else:
+                shm_name, size = None, 0
+                masks = pauli_masks(hamiltonian)
+
+            self._stop = multiprocessing.Event()
+            self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                                 initargs=(shm_name, size, masks, self.num_qubits, self._stop))
+        except BaseException:
+            self._release_shared_memory()
+            raise
+
+    def run(self, tasks: list, target_energy: float = None):
+        """
+        Runs ``tasks`` (see ``sweep_tasks``) and yields their results as they finish.
+
+        Once a result reaches ``target_energy``, queued tasks are cancelled and running ones stop at
+        their next objective evaluation; those are yielded with ``cancelled=True``. The stop flag is
+        shared by the pool's workers, so only one run may be active at a time (RuntimeError otherwise);
+        a run ends when its generator is exhausted or closed.
+        :return: Generator of dicts with 'task', 'energy', 'point', 'evaluations' and 'cancelled'.
+        """
+        with self._lock:
+            if self._running:
+                raise RuntimeError("ParameterSweep.run is already active; finish or close the previous run first.")
+            self._running = True
+            self._stop.clear()
+            futures = {self._executor.submit(_run_task, task, self.maxiter): task for task in tasks}
+        try:
+            for future in as_completed(futures):
+                if future.cancelled():
+                    yield {"task": futures[future], "energy": None, "point": None, "evaluations": 0,
+                           "cancelled": True}
+                    continue
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    # A worker (or its initializer) died; the pool is unusable, so release its resources
+                    self.close()
+                    raise
+                yield result
+                if target_energy is not None and result["energy"] is not None and result["energy"] <= target_energy:
+                    self._cancel(futures, target_energy)
+        finally:
+            with self._lock:
+                for future in futures:
+                    future.cancel()  # Queued tasks of an abandoned run would otherwise hold up the next one
+                self._running = False
+
+    def _cancel(self, futures: dict, target_energy: float) -> None:
+        """Stops running tasks at their next evaluation and cancels queued ones."""
+        with self._lock:
+            if self._stop.is_set():
+                return
+            logger.info("Target energy %f reached; cancelling remaining sweep tasks.", target_energy)
+            self._stop.set()
+            for pending in futures:
+                pending.cancel()
+
+    def best(self, tasks: list, target_energy: float = None) -> dict:
+        """Runs ``tasks`` and returns the lowest-energy result."""
+        results = [r for r in self.run(tasks, target_energy) if not r["cancelled"]]
+        return min(results, key=lambda r: r["energy"]) if results else None
+
+    def close(self) -> None:
+        """Shuts the pool down and releases the shared Hamiltonian."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._release_shared_memory()
+
+    def _release_shared_memory(self) -> None:
+        """Unmaps and unlinks the shared cost vector, if one was created."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,196 @@
+import logging
+import threading
+import numpy as np
+from quantum.hamiltonians import canonical_terms
+
+logger = logging.getLogger(__name__)
+
+
+def qubit_wise_commute(label_a: str, label_b: str) -> bool:
+    """Two Pauli strings commute qubit-wise when, on every qubit, they agree or one of them is I."""
+    return all(a == b or a == "I" or b == "I" for a, b in zip(label_a, label_b))
+
+
+def group_qubit_wise_commuting(hamiltonian) -> list:
+    """
+    Partitions the terms of a Hamiltonian into qubit-wise-commuting groups (greedy, heaviest terms first).
+    :return: List of groups, each a dict with the shared measurement 'basis' label and its 'terms'.
+             Identity terms are collected in a group with basis None, which needs no circuit.
+    """
+    groups = []
+    identity = []
+    for label, coeff in sorted(canonical_terms(hamiltonian), key=lambda t: -sum(c != "I" for c in t[0])):
+        if set(label) == {"I"}:
+            identity.append((label, coeff))
+            continue
+        for group in groups:
+            if qubit_wise_commute(group["basis"], label):
+                group["basis"] = "".join(b if b != "I" else c for b, c in zip(group["basis"], label))
+                group["terms"].append((label, coeff))
+                break
+        else:
+            groups.append({"basis": label, "terms": [(label, coeff)]})
+    if identity:
+        groups.append({"basis": None, "terms": identity})
+    return groups
+
+
+def basis_rotation_ops(basis: str) -> list:
+    """Ops rotating each qubit of ``basis`` into the Z basis, followed by measuring every qubit."""
+    n = len(basis)
+    ops = []
+    for pos, char in enumerate(basis):
+        qubit = n - 1 - pos
+        if char == "X":
+            ops.append(("h", (qubit,), ()))
+        elif char == "Y":
+            ops.append(("sdg", (qubit,), ()))
+            ops.append(("h", (qubit,), ()))
+    return ops + [("measure", (q,), (q,)) for q in range(n)]
+
+
+def group_energy(group: dict, counts: dict) -> float:
+    """Combines the expectation values of all terms in a group from one set of basis-rotated counts."""
+    if group["basis"] is None:
+        return float(sum(coeff.real for _, coeff in group["terms"]))
+    outcomes = np.array([int(key.replace(" ", ""), 2) for key in counts], dtype=np.int64)
+    frequencies = np.array(list(counts.values()), dtype=float)
+    frequencies /= frequencies.sum()
+    energy = 0.0
+    for label, coeff in group["terms"]:
+        mask = int("".join("0" if c == "I" else "1" for c in label), 2)
+        parity = np.zeros_like(outcomes)
+        selected = outcomes & mask
+        while mask:
+            parity ^= selected & 1
+            selected >>= 1
+            mask >>= 1
+        energy += coeff.real * float(np.dot(1 - 2 * parity, frequencies))
+    return energy
+
+
+class GroupedVQEResult:
+    def __init__(self, optimal_point, optimal_value: float, cost_function_evals: int, circuits_per_iteration: int,
+                 ungrouped_circuits_per_iteration: int):
+        """
+        Outcome of a grouped-measurement VQE run.
+        :param circuits_per_iteration: Circuits executed per energy evaluation (one per group).
+        :param ungrouped_circuits_per_iteration: Circuits term-by-term measurement would have needed.
+        """
+        self.optimal_point = optimal_point
+        self.optimal_parameters = optimal_point
+        self.optimal_value = optimal_value
+        self.eigenvalue = complex(optimal_value)
+        self.cost_function_evals = cost_function_evals
+        self.circuits_per_iteration = circuits_per_iteration
+        self.ungrouped_circuits_per_iteration = ungrouped_circuits_per_iteration
+
+    def __repr__(self):
+        return (f"GroupedVQEResult(optimal_value={self.optimal_value}, cost_function_evals={self.cost_function_evals}, "
+                f"circuits_per_iteration={self.circuits_per_iteration}, "
+                f"ungrouped_circuits_per_iteration={self.ungrouped_circuits_per_iteration})")
+
+
+class GroupedExpectationEstimator:
+    def __init__(self, backend, shots: int = 1024):
+        """
+        Estimates Hamiltonian expectation values with one basis-rotated circuit per
+        qubit-wise-commuting group, reusing each group's counts for all of its terms.
+        :param backend: A Qiskit backend, or a NumpyStatevectorBackend.
+        :param shots: Shots per group circuit.
+        """
+        self.backend = backend
+        self.shots = shots
+        self.circuits_executed = 0
+        self.last_circuits = 0
+        self._groups = {}
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def groups(self, hamiltonian) -> list:
+        """Returns the (cached) grouping of a Hamiltonian."""
+        key = tuple(canonical_terms(hamiltonian))
+        with self._lock:
+            if key not in self._groups:
+                self._groups[key] = group_qubit_wise_commuting(hamiltonian)
+                measured = [g for g in self._groups[key] if g["basis"] is not None]
+                logger.info("Grouped %d Pauli terms into %d measurement circuits.",
+                            sum(len(g["terms"]) for g in measured), len(measured))
+            return self._groups[key]
+
+    def _record(self, circuits: int) -> None:
+        self.last_circuits = circuits
+        self.circuits_executed += circuits
+
+    def estimate_ops(self, ops: list, num_qubits: int, hamiltonian, parameters=None) -> float:
+        """
+        Estimates <H> for a state prepared by ``ops`` on a NumpyStatevectorBackend.
+        :param ops: State-preparation ops (see ``quantum.circuit_ops``).
+        :param num_qubits: Number of qubits.
+        :param hamiltonian: Hamiltonian to measure.
+        :param parameters: Values for the free parameter slots of ``ops``.
+        """
+        groups = self.groups(hamiltonian)
+        parameters = None if parameters is None else np.atleast_2d(parameters)
+        energy = 0.0
+        measured = 0
+        for group in groups:
+            if group["basis"] is None:
+                energy += group_energy(group, {})
+                continue
+            counts = self.backend.sample_counts(ops + basis_rotation_ops(group["basis"]), num_qubits, self.shots,
+                                                parameters)[0]
+            energy += group_energy(group, counts)
+            measured += 1
+        self._record(measured)
+        return energy
+
+    def measurement_circuits(self, ansatz, hamiltonian) -> list:
+        """
+        Builds, transpiles and caches one measurement circuit per group for a parameterized ansatz.
+        :return: List of (group, transpiled circuit) pairs; identity groups have no circuit.
+        """
+        from qiskit import QuantumCircuit
+        from quantum.transpile_cache import cached_transpile, structure_key
+
+        key = (structure_key(ansatz), tuple(canonical_terms(hamiltonian)))
+        with self._lock:
+            if key in self._circuits:
+                return self._circuits[key]
+        pairs = []
+        for group in self.groups(hamiltonian):
+            if group["basis"] is None:
+                pairs.append((group, None))
+                continue
+            circuit = QuantumCircuit(ansatz.num_qubits)
+            circuit.compose(ansatz, inplace=True)
+            for name, qubits, _ in basis_rotation_ops(group["basis"]):
+                if name != "measure":
+                    getattr(circuit, name)(*qubits)
+            circuit.measure_all()
+            pairs.append((group, cached_transpile(circuit, self.backend)))
+        with self._lock:
+            self._circuits[key] = pairs
+        return pairs
+
+    def estimate(self, ansatz, parameters, hamiltonian) -> float:
+        """
+        Estimates <H> for a parameterized Qiskit ansatz, running every group circuit in one backend job.
+        :param ansatz: Parameterized QuantumCircuit.
+        :param parameters: Parameter values, in the order of ``ansatz.parameters``.
+        :param hamiltonian: Hamiltonian to measure.
+        """
+        pairs = self.measurement_circuits(ansatz, hamiltonian)
+        binding = dict(zip(ansatz.parameters, parameters))
+        bound = [circuit.assign_parameters(binding) for _, circuit in pairs if circuit is not None]
+        result = self.backend.run(bound, shots=self.shots).result()
+        energy = 0.0
+        index = 0
+        for group, circuit in pairs:
+            if circuit is None:
+                energy += group_energy(group, {})
+            else:
+                energy += group_energy(group, result.get_counts(index))
+                index += 1
+        self._record(len(bound))
+        return energy
@@ -0,0 +1,161 @@
+import numpy as np
+import scipy.sparse
+
+
+def to_coo(matrix, num_variables: int = None) -> tuple:
+    """
+    Converts coefficients to COO arrays.
+    :param matrix: Dense square array, scipy.sparse matrix, or dict mapping (i, j) to coefficients.
+    :param num_variables: Number of variables (only needed for dicts with trailing unused variables).
+    :return: (rows, cols, values, n).
+    """
+    if isinstance(matrix, dict):
+        keys = list(matrix.keys())
+        rows = np.array([i for i, _ in keys], dtype=np.int64)
+        cols = np.array([j for _, j in keys], dtype=np.int64)
+        values = np.array([matrix[k] for k in keys], dtype=float)
+        n = num_variables if num_variables is not None else int(max(rows.max(initial=-1), cols.max(initial=-1)) + 1)
+    elif scipy.sparse.issparse(matrix):
+        coo = matrix.tocoo()
+        rows, cols, values = coo.row.astype(np.int64), coo.col.astype(np.int64), coo.data.astype(float)
+        n = coo.shape[0]
+    else:
+        dense = np.asarray(matrix, dtype=float)
+        if dense.ndim != 2 or dense.shape[0] != dense.shape[1]:
+            raise ValueError("Coefficient matrix must be square.")
+        rows, cols = np.nonzero(dense)
+        values = dense[rows, cols]
+        n = dense.shape[0]
+    return rows, cols, values, n
+
+
+def _merge_upper(rows, cols, values, n) -> tuple:
+    """Folds (i, j) and (j, i) entries onto i < j, sums duplicates and drops zeros."""
+    upper_rows, upper_cols = np.minimum(rows, cols), np.maximum(rows, cols)
+    keys, inverse = np.unique(upper_rows * n + upper_cols, return_inverse=True)
+    merged = np.bincount(inverse, weights=values, minlength=len(keys))
+    keep = merged != 0
+    return (keys[keep] // n).astype(np.int64), (keys[keep] % n).astype(np.int64), merged[keep]
+
+
+class IsingProblem:
+    def __init__(self, linear, coupling_rows, coupling_cols, coupling_values, offset: float = 0.0):
+        """
+        Sparse Ising problem E(z) = offset + sum_i h_i z_i + sum_{i<j} J_ij z_i z_j over spins z in {+1, -1}.
+
+        Spin z_i = +1 corresponds to bit x_i = 0 (the |0> state), so measured bitstrings map directly to
+        QUBO assignments. Storage and construction scale with the number of nonzero couplings.
+        Use ``from_qubo`` or ``from_ising`` rather than calling this directly.
+        """
+        self.linear = np.asarray(linear, dtype=float)
+        self.num_qubits = len(self.linear)
+        self.coupling_rows = np.asarray(coupling_rows, dtype=np.int64)
+        self.coupling_cols = np.asarray(coupling_cols, dtype=np.int64)
+        self.coupling_values = np.asarray(coupling_values, dtype=float)
+        self.offset = float(offset)
+
+    @classmethod
+    def from_ising(cls, h, J, offset: float = 0.0, num_variables: int = None):
+        """
+        Builds a problem from Ising coefficients.
+        :param h: Linear fields, as an array or a dict mapping i to h_i.
+        :param J: Couplings, as a dense array, scipy.sparse matrix or dict mapping (i, j) to J_ij.
+        :param offset: Constant energy offset.
+        :param num_variables: Number of spins, when it cannot be inferred from h and J.
+        """
+        rows, cols, values, n = to_coo(J, num_variables)
+        if isinstance(h, dict):
+            n = max([n, num_variables or 0] + [i + 1 for i in h])
+            linear = np.zeros(n)
+            for i, value in h.items():
+                linear[i] += value
+        else:
+            linear = np.zeros(max(n, len(h)))
+            linear[:len(h)] = h
+            n = len(linear)
+        diagonal = rows == cols
+        if np.any(diagonal):
+            offset += values[diagonal].sum()  # z_i * z_i == 1
+        return cls(linear, *_merge_upper(rows[~diagonal], cols[~diagonal], values[~diagonal], n), offset)
+
+    @classmethod
+    def from_qubo(cls, qubo, num_variables: int = None):
+        """
+        Builds a problem from QUBO coefficients, minimizing x^T Q x over x in {0, 1}^n.
+        :param qubo: Dense array, scipy.sparse matrix, or dict mapping (i, j) to Q_ij.
+        :param num_variables: Number of variables, when it cannot be inferred from ``qubo``.
+        """
+        rows, cols, values, n = to_coo(qubo, num_variables)
+        diagonal = rows == cols
+        q_diag = np.bincount(rows[diagonal], weights=values[diagonal], minlength=n)
+        w_rows, w_cols, w_values = _merge_upper(rows[~diagonal], cols[~diagonal], values[~diagonal], n)
+
+        # Substitute x_i = (1 - z_i) / 2
+        linear = -q_diag / 2
+        linear -= np.bincount(w_rows, weights=w_values, minlength=n) / 4
+        linear -= np.bincount(w_cols, weights=w_values, minlength=n) / 4
+        offset = q_diag.sum() / 2 + w_values.sum() / 4
+        return cls(linear, w_rows, w_cols, w_values / 4, offset)
+
+    def to_qubo(self) -> tuple:
+        """
+        Returns the equivalent QUBO for the classical solvers.
+        :return: (Q as an upper-triangular scipy.sparse CSR matrix, constant offset).
+        """
+        n = self.num_qubits
+        # Substitute z_i = 1 - 2 x_i
+        diagonal = -2 * self.linear
+        diagonal -= 2 * np.bincount(self.coupling_rows, weights=self.coupling_values, minlength=n)
+        diagonal -= 2 * np.bincount(self.coupling_cols, weights=self.coupling_values, minlength=n)
+        rows = np.concatenate([np.arange(n), self.coupling_rows])
+        cols = np.concatenate([np.arange(n), self.coupling_cols])
+        values = np.concatenate([diagonal, 4 * self.coupling_values])
+        qubo = scipy.sparse.coo_matrix((values, (rows, cols)), shape=(n, n)).tocsr()
+        offset = self.offset + self.linear.sum() + self.coupling_values.sum()
+        return qubo, offset
+
+    def energy(self, bits) -> np.ndarray:
+        """Evaluates the energy of bit assignments of shape (n,) or (batch, n)."""
+        spins = 1.0 - 2.0 * np.asarray(bits, dtype=float)
+        pairs = spins[..., self.coupling_rows] * spins[..., self.coupling_cols]
+        return self.offset + spins @ self.linear + pairs @ self.coupling_values
+
+    def cost_vector(self) -> np.ndarray:
+        """
+        Returns the diagonal of the Ising Hamiltonian over all 2 ** n basis states, built directly
+        from the coefficients in O((n + nnz) * 2 ** n) without materializing Pauli strings.
+        """
+        index = np.arange(2 ** self.num_qubits, dtype=np.uint64)
+        cost = np.full(len(index), self.offset)
+        spin = lambda q: 1.0 - 2.0 * ((index >> np.uint64(q)) & np.uint64(1)).astype(np.float64)
+        for q in np.flatnonzero(self.linear):
+            cost += self.linear[q] * spin(q)
+        for i, j, value in zip(self.coupling_rows, self.coupling_cols, self.coupling_values):
+            parity = ((index >> np.uint64(i)) ^ (index >> np.uint64(j))) & np.uint64(1)
+            cost += value * (1.0 - 2.0 * parity.astype(np.float64))
+        return cost
+
+    def sparse_terms(self) -> list:
+        """Returns the Hamiltonian as (Pauli label, qubit indices, coefficient) triples."""
+        terms = [("Z", [int(q)], float(self.linear[q])) for q in np.flatnonzero(self.linear)]
+        terms += [("ZZ", [int(i), int(j)], float(v))
+                  for i, j, v in zip(self.coupling_rows, self.coupling_cols, self.coupling_values)]
+        if self.offset:
+            terms.append(("", [], self.offset))
+        return terms
+
+    def to_sparse_pauli_op(self):
+        """Builds the Hamiltonian as a Qiskit SparsePauliOp straight from the sparse coefficients."""
+        from qiskit.quantum_info import SparsePauliOp
+        return SparsePauliOp.from_sparse_list(self.sparse_terms(), num_qubits=self.num_qubits)
+
+    def to_list(self) -> list:
+        """Returns (label, coefficient) pairs as accepted by ``PauliSumOp.from_list`` (dense labels, small n)."""
+        n = self.num_qubits
+        terms = []
+        for paulis, qubits, coeff in self.sparse_terms():
+            label = ["I"] * n
+            for pauli, q in zip(paulis, qubits):
+                label[n - 1 - q] = pauli
+            terms.append(("".join(label), coeff))
+        return terms
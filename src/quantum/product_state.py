@@ -0,0 +1,99 @@
+import numpy as np
+from quantum.circuit_ops import measurement_map
+from quantum.gate_matrices import FIXED_GATES, ROTATION_GATES, rotation_matrices
+
+
+class ProductStateEvaluator:
+    def __init__(self, rng: np.random.Generator = None, max_chunk_elements: int = 2 ** 24):
+        """
+        Closed-form evaluator for circuits made only of single-qubit gates.
+
+        Such circuits prepare product states, so every qubit can be tracked as its own
+        2-vector and measurement statistics follow from per-qubit marginals without
+        ever building the 2 ** n statevector.
+        :param rng: Random generator used for sampling.
+        :param max_chunk_elements: Upper bound on sampled bits held in memory at once.
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.max_chunk_elements = max_chunk_elements
+
+    @staticmethod
+    def supports(ops: list) -> bool:
+        """Returns True when ``ops`` contain no multi-qubit gates."""
+        for name, qubits, _ in ops:
+            if name in ("measure", "barrier"):
+                continue
+            if len(qubits) != 1 or (name not in FIXED_GATES and name not in ROTATION_GATES):
+                return False
+        return True
+
+    def qubit_states(self, ops: list, num_qubits: int, parameters=None) -> np.ndarray:
+        """
+        Returns the single-qubit states of a batch of product circuits.
+        :param ops: Circuit ops; ``None`` parameters are free slots (see ``quantum.circuit_ops``).
+        :param num_qubits: Number of qubits.
+        :param parameters: Array of shape (batch, n_free_slots), one row per circuit.
+        :return: Complex array of shape (batch, num_qubits, 2).
+        """
+        if not self.supports(ops):
+            raise ValueError("Circuit contains multi-qubit gates and is not a product state.")
+        parameters = np.zeros((1, 0)) if parameters is None else np.atleast_2d(np.asarray(parameters, dtype=float))
+        batch = parameters.shape[0]
+        states = np.zeros((batch, num_qubits, 2), dtype=complex)
+        states[:, :, 0] = 1.0
+
+        column = 0
+        for name, qubits, params in ops:
+            if name in ("measure", "barrier"):
+                continue
+            q = qubits[0]
+            if name in FIXED_GATES:
+                states[:, q] = states[:, q] @ FIXED_GATES[name].T
+                continue
+            theta = params[0]
+            if theta is None:
+                theta = parameters[:, column]
+                column += 1
+            else:
+                theta = np.full(batch, theta)
+            states[:, q] = np.einsum("bij,bj->bi", rotation_matrices(name, theta), states[:, q])
+        return states
+
+    def marginals(self, ops: list, num_qubits: int, parameters=None) -> np.ndarray:
+        """Returns the (batch, num_qubits) probabilities of measuring each qubit as 1."""
+        states = self.qubit_states(ops, num_qubits, parameters)
+        return np.abs(states[:, :, 1]) ** 2
+
+    def expectation_values(self, ops: list, num_qubits: int, parameters=None) -> np.ndarray:
+        """Returns the (batch, num_qubits) Pauli-Z expectation value of each qubit."""
+        return 1.0 - 2.0 * self.marginals(ops, num_qubits, parameters)
+
+    def sample_bits(self, marginals: np.ndarray, shots: int) -> np.ndarray:
+        """
+        Samples independent measurement outcomes from per-qubit marginals.
+        :param marginals: Array of shape (batch, num_qubits).
+        :param shots: Number of shots per circuit.
+        :return: Boolean array of shape (batch, shots, num_qubits).
+        """
+        marginals = np.atleast_2d(marginals)
+        return self.rng.random((marginals.shape[0], shots, marginals.shape[1])) < marginals[:, None, :]
+
+    def sample_counts(self, ops: list, num_qubits: int, shots: int = 1024, parameters=None) -> list:
+        """
+        Samples Qiskit-style counts for a batch of product circuits.
+        :return: One counts dictionary per circuit, keyed by classical-register bitstrings.
+        """
+        marginals = self.marginals(ops, num_qubits, parameters)
+        measurements, num_clbits = measurement_map(ops, num_qubits)
+        qubits = np.array([q for q, _ in measurements])
+        weights = np.array([1 << c for _, c in measurements], dtype=np.int64)
+
+        counts = []
+        rows_per_chunk = max(1, self.max_chunk_elements // max(1, shots * num_qubits))
+        for start in range(0, len(marginals), rows_per_chunk):
+            bits = self.sample_bits(marginals[start:start + rows_per_chunk, qubits], shots)
+            registers = bits.astype(np.int64) @ weights
+            for row in registers:
+                values, occurrences = np.unique(row, return_counts=True)
+                counts.append({format(int(v), f"0{num_clbits}b"): int(n) for v, n in zip(values, occurrences)})
+        return counts
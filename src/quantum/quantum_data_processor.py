@@ -1,6 +1,19 @@
+import logging
+import numpy as np
 from qiskit import QuantumCircuit
+from quantum.circuit_ops import circuit_to_ops, ops_to_circuit
+from quantum.circuit_reduction import reduce_ops
+from quantum.product_state import ProductStateEvaluator
+
+logger = logging.getLogger(__name__)
 
 class QuantumDataProcessor:
+    def __init__(self, seed: int = None):
+        # encode_data only applies independent rotations, so its circuits are evaluated in closed form
+        self.evaluator = ProductStateEvaluator(rng=np.random.default_rng(seed))
+        # Report of the most recent compress_data call
+        self.last_reduction = None
+
     def encode_data(self, classical_data):
         # Encode classical data into a quantum state
         circuit = QuantumCircuit(len(classical_data))
@@ -8,7 +21,46 @@ class QuantumDataProcessor:
             circuit.rx(value, i)
         return circuit
 
+    def encoded_marginals(self, data_matrix) -> np.ndarray:
+        """
+        Probability of measuring each qubit as 1 after ``encode_data``, for every row at once.
+        :param data_matrix: Array of shape (n_rows, n_features).
+        :return: Array of shape (n_rows, n_features) equal to sin^2(value / 2).
+        """
+        return np.sin(np.atleast_2d(np.asarray(data_matrix, dtype=float)) / 2) ** 2
+
+    def encoded_expectations(self, data_matrix) -> np.ndarray:
+        """
+        Pauli-Z expectation value of each qubit after ``encode_data``, for every row at once.
+        :param data_matrix: Array of shape (n_rows, n_features).
+        :return: Array of shape (n_rows, n_features) equal to cos(value).
+        """
+        return np.cos(np.atleast_2d(np.asarray(data_matrix, dtype=float)))
+
+    def sample_encoded(self, data_matrix, shots: int = 1024) -> list:
+        """
+        Samples measurement counts of the ``encode_data`` circuit for every row, without simulation.
+        :param data_matrix: Array of shape (n_rows, n_features).
+        :param shots: Number of shots per row.
+        :return: One Qiskit-style counts dictionary per row.
+        """
+        data_matrix = np.atleast_2d(np.asarray(data_matrix, dtype=float))
+        ops = [("rx", (i,), (None,)) for i in range(data_matrix.shape[1])]
+        return self.evaluator.sample_counts(ops, data_matrix.shape[1], shots, data_matrix)
+
     def compress_data(self, quantum_circuit):
-        # Compress quantum circuit for efficient transmission
-        # Placeholder for compression logic
-        return quantum_circuit
\ No newline at end of file
+        """
+        Compresses a circuit for efficient simulation and transmission.
+
+        Consecutive rotations on a qubit are merged, adjacent self-inverse pairs cancel,
+        identity rotations are dropped and qubits that are never used are removed. The gate-count
+        and depth reduction is logged and kept in ``last_reduction``.
+        :param quantum_circuit: A Qiskit circuit with bound parameters.
+        :return: The reduced circuit.
+        """
+        reduction = reduce_ops(circuit_to_ops(quantum_circuit), quantum_circuit.num_qubits)
+        self.last_reduction = reduction
+        logger.info("Compressed circuit: %d gates removed (%d -> %d), depth %d -> %d, qubits %d -> %d.",
+                    reduction.gate_reduction, reduction.original_gates, reduction.gates,
+                    reduction.original_depth, reduction.depth, reduction.original_qubits, reduction.num_qubits)
+        return ops_to_circuit(reduction.ops, reduction.num_qubits)
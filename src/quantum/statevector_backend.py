@@ -0,0 +1,175 @@
+import logging
+import numpy as np
+from quantum.circuit_ops import circuit_to_ops, measurement_map
+from quantum.gate_matrices import FIXED_GATES, ROTATION_GATES, rotation_matrices
+from quantum.product_state import ProductStateEvaluator
+
+logger = logging.getLogger(__name__)
+
+
+def counts_to_dicts(count_arrays: np.ndarray, num_clbits: int) -> list:
+    """Converts dense (batch, 2 ** num_clbits) count arrays into Qiskit-style counts dictionaries."""
+    counts = []
+    for row in np.atleast_2d(count_arrays):
+        nonzero = np.flatnonzero(row)
+        counts.append({format(int(v), f"0{num_clbits}b"): int(row[v]) for v in nonzero})
+    return counts
+
+
+class NumpyResult:
+    def __init__(self, counts: list):
+        """
+        Measurement results of a numpy backend run, mirroring ``qiskit.result.Result.get_counts``.
+        :param counts: One counts dictionary per circuit.
+        """
+        self.counts = counts
+
+    def get_counts(self, experiment: int = None):
+        if experiment is None:
+            return self.counts[0] if len(self.counts) == 1 else self.counts
+        return self.counts[experiment]
+
+
+class NumpyJob:
+    def __init__(self, result: NumpyResult):
+        # Runs are synchronous; the job only exists to match the Qiskit ``backend.run(...).result()`` API
+        self._result = result
+
+    def result(self) -> NumpyResult:
+        return self._result
+
+
+class NumpyStatevectorBackend:
+    name = "numpy_statevector"
+
+    def __init__(self, seed: int = None):
+        """
+        Statevector simulator for small circuits, vectorized over a batch of circuits.
+        :param seed: Seed for measurement sampling.
+        """
+        self.rng = np.random.default_rng(seed)
+        # Unentangled circuits are sampled in closed form instead of through the statevector
+        self.product_evaluator = ProductStateEvaluator(rng=self.rng)
+
+    def statevectors(self, ops: list, num_qubits: int, parameters=None) -> np.ndarray:
+        """
+        Simulates a batch of circuits sharing the gate structure ``ops``.
+        :param ops: Circuit ops; ``None`` parameters are free slots (see ``quantum.circuit_ops``).
+        :param num_qubits: Number of qubits.
+        :param parameters: Array of shape (batch, n_free_slots), one row per circuit.
+        :return: Complex array of shape (batch, 2 ** num_qubits).
+        """
+        parameters = np.zeros((1, 0)) if parameters is None else np.atleast_2d(np.asarray(parameters, dtype=float))
+        batch = parameters.shape[0]
+        state = np.zeros((batch,) + (2,) * num_qubits, dtype=complex)
+        state[(slice(None),) + (0,) * num_qubits] = 1.0
+
+        column = 0
+        for name, qubits, params in ops:
+            if name in ("measure", "barrier"):
+                continue
+            # Qubit q is bit q of the basis index (little-endian), i.e. axis num_qubits - q
+            axes = [num_qubits - q for q in qubits]
+            if name in FIXED_GATES:
+                state = self._apply_single(state, axes[0], FIXED_GATES[name])
+            elif name in ROTATION_GATES:
+                theta = params[0]
+                if theta is None:
+                    theta = parameters[:, column]
+                    column += 1
+                else:
+                    theta = np.full(batch, theta)
+                state = self._apply_single(state, axes[0], rotation_matrices(name, theta))
+            elif name in ("cx", "cz", "swap"):
+                state = self._apply_two(state, axes[0], axes[1], name)
+            else:
+                raise ValueError(f"Unsupported gate for the numpy backend: {name}")
+        return state.reshape(batch, 2 ** num_qubits)
+
+    @staticmethod
+    def _apply_single(state: np.ndarray, axis: int, matrix: np.ndarray) -> np.ndarray:
+        """Applies a (2, 2) gate, or one (batch, 2, 2) gate per circuit, on ``axis``."""
+        state = np.moveaxis(state, axis, -1)
+        if matrix.ndim == 2:
+            state = state @ matrix.T
+        else:
+            shape = state.shape
+            flat = state.reshape(shape[0], -1, 2)
+            state = np.einsum("bij,bmj->bmi", matrix, flat).reshape(shape)
+        return np.moveaxis(state, -1, axis)
+
+    @staticmethod
+    def _apply_two(state: np.ndarray, axis_a: int, axis_b: int, name: str) -> np.ndarray:
+        """Applies a two-qubit gate; ``axis_a`` is the control for ``cx``."""
+        state = np.moveaxis(state, (axis_a, axis_b), (-2, -1)).copy()
+        if name == "cx":
+            state[..., 1, :] = state[..., 1, ::-1]
+        elif name == "cz":
+            state[..., 1, 1] *= -1
+        else:
+            state = np.swapaxes(state, -1, -2)
+        return np.moveaxis(state, (-2, -1), (axis_a, axis_b))
+
+    def probabilities(self, ops: list, num_qubits: int, parameters=None) -> np.ndarray:
+        """Returns the (batch, 2 ** num_qubits) computational-basis probabilities."""
+        probs = np.abs(self.statevectors(ops, num_qubits, parameters)) ** 2
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def sample_counts(self, ops: list, num_qubits: int, shots: int = 1024, parameters=None) -> list:
+        """
+        Samples measurement counts for a batch of circuits sharing the structure ``ops``.
+
+        Counts are keyed by classical-register bitstrings as in Qiskit. Circuits without
+        measurements are treated as if every qubit were measured into the same-index clbit.
+        Product-state circuits skip the statevector and are sampled from per-qubit marginals.
+        :return: One counts dictionary per circuit.
+        """
+        if ProductStateEvaluator.supports(ops):
+            return self.product_evaluator.sample_counts(ops, num_qubits, shots, parameters)
+        _, num_clbits = measurement_map(ops, num_qubits)
+        return counts_to_dicts(self.sample_count_arrays(ops, num_qubits, shots, parameters), num_clbits)
+
+    def sample_count_arrays(self, ops: list, num_qubits: int, shots: int = 1024, parameters=None) -> np.ndarray:
+        """
+        Samples measurement counts as dense arrays, always through the statevector.
+        :return: Integer array of shape (batch, 2 ** num_clbits); entry v counts classical register value v.
+        """
+        probs = self.probabilities(ops, num_qubits, parameters)
+        samples = self.rng.multinomial(shots, probs)
+
+        # Classical register value of every basis state
+        measurements, num_clbits = measurement_map(ops, num_qubits)
+        basis = np.arange(2 ** num_qubits)
+        register = np.zeros_like(basis)
+        for qubit, clbit in measurements:
+            register = (register & ~(1 << clbit)) | (((basis >> qubit) & 1) << clbit)
+
+        outcomes = np.zeros((len(samples), 2 ** num_clbits), dtype=np.int64)
+        for row, sample in zip(outcomes, samples):
+            row += np.bincount(register, weights=sample, minlength=2 ** num_clbits).astype(np.int64)
+        return outcomes
+
+    def run(self, circuits, shots: int = 1024) -> NumpyJob:
+        """
+        Runs bound Qiskit circuits, grouping those with identical structure into one vectorized batch.
+        :param circuits: A QuantumCircuit or a list of them.
+        :param shots: Number of shots per circuit.
+        :return: A job whose ``result()`` provides ``get_counts``.
+        """
+        if not isinstance(circuits, (list, tuple)):
+            circuits = [circuits]
+
+        groups = {}
+        for index, circuit in enumerate(circuits):
+            ops = circuit_to_ops(circuit)
+            structure = (circuit.num_qubits, tuple((name, qubits, params if name == "measure" else (None,) * len(params))
+                                                   for name, qubits, params in ops))
+            values = [p for name, _, params in ops if name != "measure" for p in params]
+            groups.setdefault(structure, []).append((index, values))
+
+        counts = [None] * len(circuits)
+        for (num_qubits, template), members in groups.items():
+            parameters = np.array([values for _, values in members], dtype=float).reshape(len(members), -1)
+            for (index, _), circuit_counts in zip(members, self.sample_counts(list(template), num_qubits, shots, parameters)):
+                counts[index] = circuit_counts
+        return NumpyJob(NumpyResult(counts))
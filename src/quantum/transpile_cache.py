@@ -0,0 +1,142 @@
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+def _param_key(param):
+    """Bound parameters are keyed by value, unbound ones by their symbolic expression."""
+    try:
+        return float(param)
+    except (TypeError, ValueError):
+        return str(param)
+
+
+def _freeze(value):
+    """Converts a transpile option or backend property (lists, dicts, coupling maps) into a hashable value."""
+    if hasattr(value, "get_edges"):  # CouplingMap
+        return tuple(sorted(tuple(edge) for edge in value.get_edges()))
+    if isinstance(value, dict):
+        return tuple(sorted(((_freeze(k), _freeze(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_freeze(item) for item in value), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _backend_key(backend) -> tuple:
+    """
+    Returns a hashable key for a Qiskit backend (BackendV1 or BackendV2): its name plus the
+    basis gates and coupling map, so same-named backends with different targets do not share entries.
+    """
+    name = getattr(backend, "name", None)
+    if callable(name):
+        name = name()
+    basis_gates, coupling_map = None, None
+    target = getattr(backend, "target", None)
+    if target is not None:
+        basis_gates = getattr(target, "operation_names", None)
+        build_coupling_map = getattr(target, "build_coupling_map", None)
+        coupling_map = build_coupling_map() if build_coupling_map else None
+    elif callable(getattr(backend, "configuration", None)):
+        configuration = backend.configuration()
+        basis_gates = getattr(configuration, "basis_gates", None)
+        coupling_map = getattr(configuration, "coupling_map", None)
+    basis_gates = tuple(sorted(basis_gates)) if basis_gates is not None else None
+    coupling_map = tuple(sorted(_freeze(coupling_map))) if coupling_map is not None else None
+    return name or repr(backend), basis_gates, coupling_map
+
+
+def structure_key(circuit) -> tuple:
+    """
+    Returns a hashable key describing the structure of a circuit.
+
+    Two circuits share a key when they have the same registers (names and sizes, in order),
+    gates, qubit and clbit wiring, and parameters, so they transpile to the same result.
+    :param circuit: A Qiskit QuantumCircuit.
+    :return: A tuple usable as a dictionary key.
+    """
+    registers = (tuple((register.name, register.size) for register in circuit.qregs),
+                 tuple((register.name, register.size) for register in circuit.cregs))
+    gates = []
+    for operation, qargs, cargs in circuit.data:
+        gates.append((
+            operation.name,
+            tuple(circuit.find_bit(q).index for q in qargs),
+            tuple(circuit.find_bit(c).index for c in cargs),
+            tuple(_param_key(p) for p in operation.params),
+        ))
+    return circuit.num_qubits, circuit.num_clbits, registers, tuple(gates)
+
+
+class TranspileCache:
+    def __init__(self, maxsize: int = 256):
+        """
+        LRU cache of transpiled circuits keyed by circuit structure and target backend.
+
+        :param maxsize: Maximum number of transpiled circuits to keep.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def transpile(self, circuit, backend, **transpile_options):
+        """
+        Transpiles a circuit for a backend, reusing a previous result when possible.
+
+        The returned circuit is shared between callers and must not be modified in place;
+        use ``assign_parameters`` (which returns a copy) to bind parameterized templates.
+        :param circuit: The circuit to transpile.
+        :param backend: The target backend.
+        :param transpile_options: Extra keyword arguments forwarded to ``qiskit.transpile``.
+        :return: The transpiled circuit.
+        """
+        options = tuple(sorted((name, _freeze(value)) for name, value in transpile_options.items()))
+        key = (structure_key(circuit), _backend_key(backend), options)
+        with self._lock:
+            transpiled = self._entries.get(key)
+            if transpiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return transpiled
+            self.misses += 1
+
+        # Transpile outside the lock so other circuits are not blocked by a slow miss
+        from qiskit import transpile
+        transpiled = transpile(circuit, backend, **transpile_options)
+
+        with self._lock:
+            self._entries[key] = transpiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return transpiled
+
+    def stats(self) -> dict:
+        """Returns the hit/miss counters and the current number of cached circuits."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self) -> None:
+        """Drops all cached circuits and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache shared by every circuit-producing component in the process
+transpile_cache = TranspileCache()
+
+
+def cached_transpile(circuit, backend, **transpile_options):
+    """Transpiles ``circuit`` for ``backend`` through the shared cache."""
+    return transpile_cache.transpile(circuit, backend, **transpile_options)
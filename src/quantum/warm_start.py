@@ -0,0 +1,175 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import numpy as np
+from quantum.hamiltonians import canonical_sparse_terms, num_qubits, real_coefficients
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "quaintum", "warm_start.json")
+
+
+def hamiltonian_fingerprint(hamiltonian) -> tuple:
+    """
+    Fingerprints a Hamiltonian for warm-start lookups.
+    :return: (fingerprint, structure, coefficients). The fingerprint identifies the exact
+             canonical Hamiltonian; the structure only identifies its set of Pauli labels, so
+             Hamiltonians sharing a structure can be compared through their coefficient vectors.
+             Terms are keyed in sparse form, so an ``IsingProblem`` and its ``to_list()`` share a
+             fingerprint and large problems are fingerprinted without building dense labels.
+    """
+    terms = canonical_sparse_terms(hamiltonian)
+    labels = f"{num_qubits(hamiltonian)}|" + "|".join(key for key, _ in terms)
+    coefficients = real_coefficients(terms)
+    structure = hashlib.sha256(labels.encode()).hexdigest()
+    fingerprint = hashlib.sha256((labels + repr(coefficients.tolist())).encode()).hexdigest()
+    return fingerprint, structure, coefficients
+
+
+def interpolate_qaoa_parameters(betas, gammas) -> tuple:
+    """
+    Extends depth-p QAOA angles to depth p + 1 by linear interpolation (the INTERP heuristic):
+    new[i] = (i / p) * old[i - 1] + ((p - i) / p) * old[i], for i = 0..p, with out-of-range terms as 0.
+    """
+    betas, gammas = np.asarray(betas, dtype=float), np.asarray(gammas, dtype=float)
+    p = len(betas)
+    i = np.arange(p + 1)
+    padded = lambda angles: (np.concatenate([[0.0], angles]), np.concatenate([angles, [0.0]]))
+    b_prev, b_curr = padded(betas)
+    g_prev, g_curr = padded(gammas)
+    return (i / p) * b_prev + ((p - i) / p) * b_curr, (i / p) * g_prev + ((p - i) / p) * g_curr
+
+
+class WarmStartStore:
+    def __init__(self, path: str = DEFAULT_STORE_PATH, max_entries: int = 1000, max_distance: float = None):
+        """
+        Persistent store of optimal variational parameters keyed by Hamiltonian fingerprint.
+
+        Exact repeats return their stored parameters; otherwise the closest stored Hamiltonian with
+        the same Pauli labels is used, and QAOA angles from a shallower depth are interpolated up.
+        :param path: JSON file holding the store.
+        :param max_entries: Maximum number of entries; the least recently used are evicted. Lookups
+                            refresh an entry's last use; the refresh is written with the next
+                            ``record`` or ``flush``.
+        :param max_distance: Largest coefficient-vector distance accepted for a near-repeat match.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._unsaved = False  # Lookups changed last_used since the last save
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return {entry["key"]: entry for entry in json.load(file)}
+        except FileNotFoundError:
+            return {}
+        except (ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable warm-start store %s: %s", self.path, e)
+            return {}
+
+    def _save(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a half-written store
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(list(self._entries.values()), file)
+        os.replace(tmp_path, self.path)
+        self._unsaved = False
+
+    def flush(self) -> None:
+        """Writes last-use times refreshed by lookups since the last save, so eviction order survives restarts."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    @staticmethod
+    def _key(fingerprint: str, ansatz: str, depth) -> str:
+        return f"{fingerprint}:{ansatz}:{depth}"
+
+    def lookup(self, hamiltonian, ansatz: str = "qaoa", depth: int = None):
+        """
+        Finds initial parameters for a problem.
+        :param hamiltonian: Problem Hamiltonian (see ``quantum.hamiltonians.pauli_terms``).
+        :param ansatz: Ansatz name, e.g. "qaoa" or "TwoLocal".
+        :param depth: Ansatz depth (QAOA reps).
+        :return: Initial point as a numpy array, or None when nothing suitable is stored.
+                 QAOA points are laid out as Qiskit's QAOAAnsatz orders them: betas, then gammas.
+        """
+        fingerprint, structure, coefficients = hamiltonian_fingerprint(hamiltonian)
+        with self._lock:
+            entry = self._entries.get(self._key(fingerprint, ansatz, depth))
+            if entry is None:
+                entry = self._nearest(structure, coefficients, ansatz, depth)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+            self._unsaved = True
+
+        point = np.array(entry["point"], dtype=float)
+        if ansatz == "qaoa" and entry["depth"] != depth:
+            p = entry["depth"]
+            betas, gammas = point[:p], point[p:]
+            for _ in range(depth - p):
+                betas, gammas = interpolate_qaoa_parameters(betas, gammas)
+            point = np.concatenate([betas, gammas])
+        return point
+
+    def _nearest(self, structure: str, coefficients: np.ndarray, ansatz: str, depth):
+        """Closest entry with the same Pauli labels, preferring the requested depth, then the deepest shallower QAOA."""
+        candidates = [e for e in self._entries.values() if e["structure"] == structure and e["ansatz"] == ansatz]
+        if ansatz == "qaoa" and depth is not None:
+            candidates = [e for e in candidates if e["depth"] <= depth]
+        else:
+            candidates = [e for e in candidates if e["depth"] == depth]
+        if not candidates:
+            return None
+
+        distances = [float(np.linalg.norm(np.asarray(e["coefficients"]) - coefficients)) for e in candidates]
+        ranked = [(-(e["depth"] or 0), d, k) for k, (e, d) in enumerate(zip(candidates, distances))
+                  if self.max_distance is None or d <= self.max_distance]
+        if not ranked:
+            return None
+        return candidates[min(ranked)[2]]
+
+    def record(self, hamiltonian, point, energy: float, ansatz: str = "qaoa", depth: int = None) -> None:
+        """
+        Stores optimal parameters for a problem, keeping the lower-energy point on repeats.
+        :param hamiltonian: Problem Hamiltonian.
+        :param point: Optimal parameters (for QAOA: betas, then gammas).
+        :param energy: Energy reached with these parameters.
+        :param ansatz: Ansatz name.
+        :param depth: Ansatz depth (QAOA reps).
+        """
+        fingerprint, structure, coefficients = hamiltonian_fingerprint(hamiltonian)
+        key = self._key(fingerprint, ansatz, depth)
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing["energy"] <= energy:
+                existing["last_used"] = time.time()
+            else:
+                self._entries[key] = {
+                    "key": key,
+                    "structure": structure,
+                    "coefficients": coefficients.tolist(),
+                    "ansatz": ansatz,
+                    "depth": depth,
+                    "point": np.asarray(point, dtype=float).tolist(),
+                    "energy": float(energy),
+                    "last_used": time.time(),
+                }
+            if len(self._entries) > self.max_entries:
+                by_age = sorted(self._entries.values(), key=lambda e: e["last_used"])
+                for entry in by_age[:len(self._entries) - self.max_entries]:
+                    del self._entries[entry["key"]]
+            self._save()
+
+    def __len__(self) -> int:
+        return len(self._entries)
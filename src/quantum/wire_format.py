@@ -0,0 +1,257 @@
+"""
+Compact binary wire format for circuit ops (see ``quantum.circuit_ops``).
+
+A message is a fixed 32-byte little-endian header followed by a table of 6-byte op records
+and, 8-byte aligned, a float32 or float64 parameter block::
+
+    header   magic b"QWIR", version, flags, num_qubits, template_id, num_ops,
+             num_inline, rows, cols, reserved
+    ops      num_ops records of (opcode: u8, reserved: u8, q0: u16, q1: u16)
+    inline   num_inline values, one per rotation op (NaN marks a free parameter slot)
+    matrix   rows x cols parameter matrix filling the free slots, one row per circuit
+
+A circuit message carries ops and inline values, and optionally a parameter matrix. In
+template mode the sender transmits a template once, then parameters-only messages that
+carry just its ``template_id`` and the parameter matrix. Decoding never copies: the op
+table and parameter blocks are ``np.frombuffer`` views into the received buffer, which
+may be ``bytes``, a ``memoryview`` or an ``mmap``.
+"""
+import logging
+import struct
+import zlib
+from collections import OrderedDict
+import numpy as np
+from quantum.gate_matrices import ROTATION_GATES
+
+MAGIC = b"QWIR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHIIIIII")
+
+FLAG_FLOAT64 = 0x01
+FLAG_PARAMETERS_ONLY = 0x02
+
+# Opcodes are part of the format: append new gates, never reorder
+OPNAMES = ("id", "x", "y", "z", "h", "s", "sdg", "t", "tdg", "sx",
+           "rx", "ry", "rz", "p", "u1", "cx", "cz", "swap", "measure")
+OPCODES = {name: code for code, name in enumerate(OPNAMES)}
+TWO_QUBIT_GATES = ("cx", "cz", "swap")
+
+OP_DTYPE = np.dtype([("opcode", "u1"), ("reserved", "u1"), ("q0", "<u2"), ("q1", "<u2")])
+
+logger = logging.getLogger(__name__)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _float_dtype(flags: int) -> np.dtype:
+    return np.dtype("<f8") if flags & FLAG_FLOAT64 else np.dtype("<f4")
+
+
+def _encode_matrix(parameters, dtype) -> np.ndarray:
+    if parameters is None:
+        return np.zeros((0, 0), dtype=dtype)
+    return np.ascontiguousarray(np.atleast_2d(parameters), dtype=dtype)
+
+
+def _body(ops: list) -> tuple:
+    """Builds the op table and the (float64) inline parameter values of ``ops``."""
+    rows = []
+    inline = []
+    for name, qubits, params in ops:
+        opcode = OPCODES.get(name)
+        if opcode is None:
+            raise ValueError(f"Gate '{name}' is not supported by the wire format.")
+        if name in TWO_QUBIT_GATES:
+            rows.append((opcode, 0, qubits[0], qubits[1]))
+        elif name == "measure":
+            rows.append((opcode, 0, qubits[0], params[0]))
+        else:
+            rows.append((opcode, 0, qubits[0], 0))
+            if name in ROTATION_GATES:
+                inline.append(np.nan if params[0] is None else params[0])
+    return np.array(rows, dtype=OP_DTYPE), np.array(inline, dtype=np.float64)
+
+
+def _template_id(num_qubits: int, records: np.ndarray, inline: np.ndarray) -> int:
+    return zlib.crc32(inline.tobytes(), zlib.crc32(records.tobytes(), num_qubits))
+
+
+def _message(flags: int, num_qubits: int, template_id: int, records, inline, matrix) -> bytes:
+    header = HEADER.pack(MAGIC, VERSION, flags, num_qubits, template_id, len(records), len(inline),
+                         matrix.shape[0], matrix.shape[1], 0)
+    table_end = HEADER.size + records.nbytes
+    padding = b"\0" * (_aligned(table_end) - table_end)
+    return b"".join([header, records.tobytes(), padding, inline.tobytes(), matrix.tobytes()])
+
+
+def template_id(ops: list, num_qubits: int) -> int:
+    """Identifier of a template: CRC-32 of its qubit count, op table and inline parameters (as float64)."""
+    return _template_id(num_qubits, *_body(ops))
+
+
+def encode_ops(ops: list, num_qubits: int, parameters=None, dtype=np.float64) -> bytes:
+    """
+    Encodes ops as a circuit message.
+    :param ops: Circuit ops; ``None`` parameters are free slots.
+    :param num_qubits: Number of qubits.
+    :param parameters: Optional (rows, free slots) matrix filling the free slots, one row per circuit.
+    :param dtype: np.float32 (half the size) or np.float64 for the parameter blocks.
+    :return: The encoded message.
+    """
+    dtype = np.dtype(dtype)
+    flags = FLAG_FLOAT64 if dtype == np.float64 else 0
+    records, inline = _body(ops)
+    return _message(flags, num_qubits, _template_id(num_qubits, records, inline), records,
+                    inline.astype(dtype, copy=False), _encode_matrix(parameters, dtype))
+
+
+def encode_circuit(circuit, dtype=np.float64) -> bytes:
+    """Encodes a bound Qiskit circuit as a circuit message."""
+    from quantum.circuit_ops import circuit_to_ops
+    return encode_ops(circuit_to_ops(circuit), circuit.num_qubits, dtype=dtype)
+
+
+def encode_parameters(template: int, parameters, dtype=np.float64) -> bytes:
+    """
+    Encodes a parameters-only message for a template the receiver already holds.
+    :param template: The template's ``template_id``.
+    :param parameters: (rows, free slots) parameter matrix.
+    :param dtype: np.float32 or np.float64.
+    """
+    dtype = np.dtype(dtype)
+    flags = FLAG_PARAMETERS_ONLY | (FLAG_FLOAT64 if dtype == np.float64 else 0)
+    return _message(flags, 0, template, np.zeros(0, dtype=OP_DTYPE), np.zeros(0, dtype=dtype),
+                    _encode_matrix(parameters, dtype))
+
+
+class WireCircuit:
+    def __init__(self, num_qubits: int, template_id: int, records: np.ndarray, inline: np.ndarray,
+                 parameters: np.ndarray):
+        """
+        A decoded message. ``records``, ``inline`` and ``parameters`` are views into the
+        received buffer, which must stay alive while they are in use.
+        :param num_qubits: Number of qubits.
+        :param template_id: Identifier of the circuit structure.
+        :param records: Op table (structured array with opcode, q0 and q1 fields).
+        :param inline: One value per rotation op; NaN marks a free slot.
+        :param parameters: (rows, free slots) parameter matrix; empty when none was sent.
+        """
+        self.num_qubits = num_qubits
+        self.template_id = template_id
+        self.records = records
+        self.inline = inline
+        self.parameters = parameters
+
+    def ops(self) -> list:
+        """Materializes the op list (free slots become ``None``)."""
+        ops = []
+        inline = iter(self.inline.tolist())
+        for opcode, _, q0, q1 in self.records.tolist():
+            name = OPNAMES[opcode]
+            if name in TWO_QUBIT_GATES:
+                ops.append((name, (q0, q1), ()))
+            elif name == "measure":
+                ops.append((name, (q0,), (q1,)))
+            elif name in ROTATION_GATES:
+                value = next(inline)
+                ops.append((name, (q0,), (None if value != value else value,)))
+            else:
+                ops.append((name, (q0,), ()))
+        return ops
+
+    def to_circuit(self):
+        """Rebuilds a Qiskit circuit (all parameters must be bound inline)."""
+        from quantum.circuit_ops import ops_to_circuit
+        return ops_to_circuit(self.ops(), self.num_qubits)
+
+
+def decode(buffer, templates: dict = None) -> WireCircuit:
+    """
+    Decodes a message without copying its arrays.
+    :param buffer: bytes, bytearray, memoryview or mmap holding one message.
+    :param templates: template_id -> WireCircuit of templates received earlier, needed to resolve
+                      parameters-only messages.
+    :return: The decoded circuit. For a parameters-only message, the template's ops with the new parameters.
+    """
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError("Buffer is too short for a wire-format header.")
+    magic, version, flags, num_qubits, identifier, num_ops, num_inline, rows, cols, _ = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Buffer is not a wire-format message.")
+    if version > VERSION:
+        raise ValueError(f"Unsupported wire-format version {version} (this reader supports up to {VERSION}).")
+
+    dtype = _float_dtype(flags)
+    records = np.frombuffer(view, dtype=OP_DTYPE, count=num_ops, offset=HEADER.size)
+    offset = _aligned(HEADER.size + num_ops * OP_DTYPE.itemsize)
+    inline = np.frombuffer(view, dtype=dtype, count=num_inline, offset=offset)
+    offset += num_inline * dtype.itemsize
+    parameters = np.frombuffer(view, dtype=dtype, count=rows * cols, offset=offset).reshape(rows, cols)
+
+    if flags & FLAG_PARAMETERS_ONLY:
+        if templates is None or identifier not in templates:
+            raise ValueError(f"Unknown template {identifier:#010x}; send the template first.")
+        template = templates[identifier]
+        if template is None:
+            raise ValueError(f"Template id {identifier:#010x} is shared by different templates; "
+                             "send these circuits as full messages.")
+        _check_parameter_width(template.inline, parameters)
+        return WireCircuit(template.num_qubits, identifier, template.records, template.inline, parameters)
+    _check_parameter_width(inline, parameters)
+    return WireCircuit(num_qubits, identifier, records, inline, parameters)
+
+
+def _check_parameter_width(inline: np.ndarray, parameters: np.ndarray) -> None:
+    """Rejects a parameter matrix whose rows do not fill exactly the free (NaN) slots of the circuit."""
+    free_slots = int(np.count_nonzero(np.isnan(inline)))
+    if parameters.shape[0] and parameters.shape[1] != free_slots:
+        raise ValueError(f"Parameter matrix has {parameters.shape[1]} columns but the circuit has "
+                         f"{free_slots} free parameter slots.")
+
+
+def _same_template(a: WireCircuit, b: WireCircuit) -> bool:
+    """
+    True when two circuits have the same structure. Inline values are compared at float32
+    precision, so one template sent once as float32 and once as float64 still matches.
+    """
+    return (a.num_qubits == b.num_qubits and a.records.tobytes() == b.records.tobytes()
+            and np.array_equal(a.inline.astype(np.float32), b.inline.astype(np.float32), equal_nan=True))
+
+
+class WireDecoder:
+    def __init__(self, max_templates: int = 1024):
+        """
+        Decoder for a stream mixing circuit messages and template-mode parameter messages.
+
+        Templates are kept in an LRU of ``max_templates`` entries; a parameters-only message for an
+        evicted template is rejected like one for an unknown template, so the sender resends it.
+        Template ids are CRC-32s, so a circuit message whose id is already held by a different
+        template is decoded normally, but the id is then refused for parameters-only messages.
+        :param max_templates: Maximum number of templates to remember.
+        """
+        self.max_templates = max_templates
+        self.templates = OrderedDict()
+
+    def decode(self, buffer) -> WireCircuit:
+        """Decodes one message; circuit messages are remembered as templates for later parameter messages."""
+        circuit = decode(buffer, self.templates)
+        identifier = circuit.template_id
+        if identifier in self.templates:
+            template = self.templates[identifier]
+            if template is not None and circuit.records is not template.records \
+                    and not _same_template(circuit, template):
+                logger.warning("Template id %#010x collides between different templates; "
+                               "refusing parameters-only messages for it.", identifier)
+                self.templates[identifier] = None
+            self.templates.move_to_end(identifier)
+            return circuit
+
+        # Templates outlive the buffer they arrived in, so keep a copy of their (small) op table
+        self.templates[identifier] = WireCircuit(circuit.num_qubits, identifier, circuit.records.copy(),
+                                                 circuit.inline.copy(), circuit.parameters[:0].copy())
+        while len(self.templates) > self.max_templates:
+            self.templates.popitem(last=False)
+        return circuit
@@ -0,0 +1,39 @@
+import unittest
+import numpy as np
+from quantum.adaptive_sampling import hoeffding_interval, sequential_sample, shot_schedule, wilson_interval
+
+class TestAdaptiveSampling(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+        self.probabilities = np.array([0.02, 0.98, 0.3, 0.7, 0.5])
+
+    def sample(self, rows, shots):
+        return self.rng.binomial(shots, self.probabilities[rows])
+
+    def test_intervals_contain_estimate(self):
+        for interval in (wilson_interval, hoeffding_interval):
+            lower, upper = interval([10, 0, 50], [100, 100, 100], 0.01)
+            self.assertTrue(np.all(lower <= np.array([0.1, 0.0, 0.5])))
+            self.assertTrue(np.all(upper >= np.array([0.1, 0.0, 0.5])))
+
+    def test_shot_schedule_doubles_up_to_budget(self):
+        self.assertEqual(shot_schedule(64, 1000), [64, 128, 256, 512, 1000])
+        with self.assertRaises(ValueError):
+            shot_schedule(128, 64)
+
+    def test_clear_decisions_stop_early(self):
+        result = sequential_sample(self.sample, 5, initial_shots=32, max_shots=4096)
+        np.testing.assert_array_equal(result.decided, [True, True, True, True, False])
+        np.testing.assert_array_equal(result.above[:4], [False, True, False, True])
+        self.assertLessEqual(result.shots[0], 64)
+        self.assertEqual(result.shots[4], 4096)
+        self.assertLess(result.total_shots, 5 * 4096)
+
+    def test_hoeffding_is_more_conservative(self):
+        wilson = sequential_sample(self.sample, 4, bound="wilson", initial_shots=16, max_shots=4096)
+        hoeffding = sequential_sample(self.sample, 4, bound="hoeffding", initial_shots=16, max_shots=4096)
+        self.assertGreaterEqual(hoeffding.total_shots, wilson.total_shots)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from quantum.circuit_reduction import fuse_and_cancel, ops_depth, reduce_ops
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+class TestCircuitReduction(unittest.TestCase):
+
+    def test_merges_consecutive_rotations(self):
+        ops = [("rx", (0,), (0.3,)), ("rx", (0,), (0.4,)), ("ry", (0,), (0.1,))]
+        reduced = fuse_and_cancel(ops, 1)
+        self.assertEqual(len(reduced), 2)
+        self.assertAlmostEqual(reduced[0][2][0], 0.7)
+
+    def test_drops_identity_rotations(self):
+        ops = [("rz", (0,), (2 * np.pi,)), ("rx", (0,), (0.5,)), ("rx", (0,), (-0.5,)), ("id", (0,), ())]
+        self.assertEqual(fuse_and_cancel(ops, 1), [])
+
+    def test_cancellations_cascade(self):
+        ops = [("h", (0,), ()), ("cx", (0, 1), ()), ("x", (1,), ()), ("x", (1,), ()), ("cx", (0, 1), ()),
+               ("h", (0,), ()), ("s", (1,), ()), ("sdg", (1,), ())]
+        self.assertEqual(fuse_and_cancel(ops, 2), [])
+
+    def test_blocked_by_intervening_ops(self):
+        ops = [("x", (0,), ()), ("cx", (0, 1), ()), ("x", (0,), ()), ("rx", (1,), (None,)), ("rx", (1,), (0.2,))]
+        self.assertEqual(len(fuse_and_cancel(ops, 2)), 5)
+
+    def test_removes_idle_qubits_and_reports_reduction(self):
+        ops = [("h", (0,), ()), ("h", (0,), ()), ("rx", (2,), (0.1,)), ("rx", (2,), (0.2,)),
+               ("cx", (2, 3), ()), ("measure", (2,), (0,)), ("measure", (3,), (1,))]
+        result = reduce_ops(ops, 4)
+        self.assertEqual(result.num_qubits, 2)
+        self.assertEqual(result.qubit_map, [2, 3])
+        self.assertEqual(result.gate_reduction, 3)
+        self.assertEqual(result.depth_reduction, ops_depth(ops, 4) - 3)
+
+    def test_reduced_circuit_has_same_distribution(self):
+        rng = np.random.default_rng(0)
+        names = ["h", "x", "rx", "ry", "rz", "cx", "cz", "s", "sdg"]
+        ops = []
+        for _ in range(60):
+            name = names[rng.integers(len(names))]
+            if name in ("cx", "cz"):
+                a, b = rng.choice(3, 2, replace=False)
+                ops.append((name, (int(a), int(b)), ()))
+            elif name.startswith("r"):
+                ops.append((name, (int(rng.integers(3)),), (float(rng.choice([0.5, -0.5, np.pi])),)))
+            else:
+                ops.append((name, (int(rng.integers(3)),), ()))
+        backend = NumpyStatevectorBackend()
+        reduced = fuse_and_cancel(ops, 3)
+        self.assertLessEqual(len(reduced), len(ops))
+        np.testing.assert_allclose(backend.probabilities(reduced, 3), backend.probabilities(ops, 3), atol=1e-10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+import optimization_path  # noqa: F401  (registers the optimization package)
+from optimization.classical_optimization import ClassicalOptimizer
+
+
+def rastrigin(points):
+    """Global minimum 0 at the origin; the nearest local minima have value ~1."""
+    points = np.atleast_2d(points)
+    return 10 * points.shape[1] + np.sum(points ** 2 - 10 * np.cos(2 * np.pi * points), axis=-1)
+
+
+class TestSimulatedAnnealingChains(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = ClassicalOptimizer()
+        self.bounds = np.array([[-5.12, 5.12], [-5.12, 5.12]])
+
+    def test_parallel_tempering_reaches_global_minimum(self):
+        for seed in range(3):
+            x, value, traces = self.optimizer.simulated_annealing_chains(
+                rastrigin, self.bounds, n_chains=8, max_iter=1500, temp=10, swap_interval=10, seed=seed)
+            self.assertLess(value, 0.1)
+            np.testing.assert_allclose(x, [0.0, 0.0], atol=0.05)
+            self.assertAlmostEqual(float(rastrigin(x)[0]), value)
+            self.assertGreater(traces["swap_rate"], 0.0)
+
+    def test_traces(self):
+        _, value, traces = self.optimizer.simulated_annealing_chains(rastrigin, self.bounds, n_chains=4,
+                                                                     max_iter=50, seed=0)
+        self.assertEqual(traces["energies"].shape, (50, 4))
+        self.assertTrue(np.all(np.diff(traces["best_values"], axis=0) <= 0))  # Best values never get worse
+        self.assertEqual(value, traces["chain_best_values"].min())
+        self.assertEqual(traces["swap_rate"], 0.0)
+
+    def test_vectorized_and_per_chain_calls_agree(self):
+        batched = self.optimizer.simulated_annealing_chains(rastrigin, self.bounds, n_chains=4, max_iter=100,
+                                                            swap_interval=5, seed=1)
+        per_chain = self.optimizer.simulated_annealing_chains(lambda p: float(rastrigin(p)[0]), self.bounds,
+                                                              n_chains=4, max_iter=100, swap_interval=5,
+                                                              vectorized=False, seed=1)
+        np.testing.assert_allclose(batched[0], per_chain[0])
+        self.assertAlmostEqual(batched[1], per_chain[1])
+
+    def test_single_chain_value_matches_point(self):
+        np.random.seed(0)
+        x, value = self.optimizer.simulated_annealing(lambda p: float(rastrigin(p)[0]), self.bounds,
+                                                      max_iter=500, temp=10)
+        self.assertAlmostEqual(float(rastrigin(x)[0]), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
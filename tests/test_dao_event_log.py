@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from agents.dao_event_log import DAOEventLog, encode_record, encode_strings, decode_strings, read_records, MEMBERS_ADDED
+
+
+class TestDAOEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def populate(self, ledger):
+        ledger.add_members([f"m{i}" for i in range(6)])
+        first = ledger.add_proposal("Fund the treasury")
+        ledger.ingest_votes(first, ["m0", "m1", "m2", "m1"], [True, True, False, False])
+        return first
+
+    def test_restore_replays_log(self):
+        log = DAOEventLog(self.directory)
+        proposal = self.populate(log.restore())
+        log.close()
+        restored = DAOEventLog(self.directory).restore()
+        self.assertEqual(restored.members.keys, [f"m{i}" for i in range(6)])
+        self.assertEqual(restored.proposals, ["Fund the treasury"])
+        self.assertEqual(restored.tally(proposal), (1, 2))
+
+    def test_restore_from_snapshot_and_tail(self):
+        log = DAOEventLog(self.directory)
+        ledger = log.restore()
+        proposal = self.populate(ledger)
+        log.compact(ledger)
+        ledger.add_member("late")
+        second = ledger.add_proposal("Change the logo")
+        ledger.cast_vote(second, "late", True)
+        ledger.cast_vote(proposal, "m2", True)
+        log.close()
+        self.assertEqual(sorted(os.listdir(self.directory)), ["events-1.log", "snapshot-1"])
+
+        log = DAOEventLog(self.directory)
+        restored = log.restore()
+        self.assertEqual(len(restored.members), 7)
+        self.assertEqual(restored.tally(proposal), (2, 1))
+        self.assertEqual(restored.tally(second), (1, 0))
+        self.assertTrue(restored.vote_of(second, "late"))
+        # Votes after a restore go to the log, not into the mapped snapshot
+        restored.cast_vote(proposal, "m0", False)
+        log.close()
+        snapshot_votes = np.load(os.path.join(self.directory, "snapshot-1", "votes.npy"))
+        self.assertEqual(snapshot_votes[proposal, 0], 1)
+        self.assertEqual(DAOEventLog(self.directory).restore().tally(proposal), (1, 2))
+
+    def test_torn_tail_is_truncated(self):
+        log = DAOEventLog(self.directory)
+        self.populate(log.restore())
+        log.close()
+        path = os.path.join(self.directory, "events-0.log")
+        size = os.path.getsize(path)
+        with open(path, "ab") as file:
+            file.write(encode_record(MEMBERS_ADDED, encode_strings(["partial"]))[:-3])
+        restored = DAOEventLog(self.directory).restore()
+        self.assertEqual(len(restored.members), 6)
+        self.assertEqual(os.path.getsize(path), size)
+
+    def test_corrupt_record_stops_reading(self):
+        data = bytearray(encode_record(MEMBERS_ADDED, b"a") + encode_record(MEMBERS_ADDED, b"b"))
+        data[-1] ^= 0xFF
+        self.assertEqual([bytes(payload) for _, payload, _ in read_records(data)], [b"a"])
+
+    def test_strings_round_trip(self):
+        keys = ["m0", "", "clé"]
+        self.assertEqual(decode_strings(encode_strings(keys)), keys)
+
+    def test_append_requires_restore(self):
+        with self.assertRaises(RuntimeError):
+            DAOEventLog(self.directory).members_added(["m0"])
+
+    def test_rejected_events_leave_ledger_unchanged(self):
+        log = DAOEventLog(self.directory)
+        ledger = log.restore()
+        proposal = self.populate(ledger)
+        with self.assertRaises(AttributeError):
+            ledger.add_member(42)  # Member keys must be strings to be journaled
+        self.assertNotIn(42, ledger.members)
+        log.close()
+        with self.assertRaises(RuntimeError):
+            ledger.add_proposal("After close")
+        with self.assertRaises(RuntimeError):
+            ledger.cast_vote(proposal, "m3", True)
+        self.assertEqual(ledger.proposals, ["Fund the treasury"])
+        self.assertEqual(ledger.tally(proposal), (1, 2))
+
+        restored = DAOEventLog(self.directory).restore()
+        self.assertEqual(restored.members.keys, ledger.members.keys)
+        self.assertEqual(restored.vote_matrix().tolist(), ledger.vote_matrix().tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
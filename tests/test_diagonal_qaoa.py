@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from quantum.diagonal_qaoa import DiagonalQAOASimulator
+from quantum.hamiltonians import diagonal_cost_vector
+
+class TestDiagonalQAOASimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.hamiltonian = [("ZZI", 1.0), ("IZZ", -0.7), ("IIZ", 0.5)]
+
+    def test_cost_vector_follows_qiskit_bit_order(self):
+        cost = diagonal_cost_vector([("IZ", 1.0), ("ZI", 2.0)])
+        # Index bit 0 is qubit 0, which is the rightmost label character
+        np.testing.assert_allclose(cost, [3.0, 1.0, -1.0, -3.0])
+
+    def test_statevector_matches_dense_evolution(self):
+        sim = DiagonalQAOASimulator(self.hamiltonian)
+        beta, gamma = 0.3, 0.8
+        state = np.full(8, 1 / np.sqrt(8), dtype=complex) * np.exp(-1j * gamma * sim.cost)
+        rx = np.array([[np.cos(beta), -1j * np.sin(beta)], [-1j * np.sin(beta), np.cos(beta)]])
+        state = np.kron(np.kron(rx, rx), rx) @ state
+        np.testing.assert_allclose(sim.statevector([beta, gamma]), state, atol=1e-12)
+
+    def test_minimize_improves_on_uniform_state(self):
+        sim = DiagonalQAOASimulator(self.hamiltonian)
+        result = sim.minimize(p=2)
+        self.assertLess(result.optimal_value, sim.cost.mean())
+        self.assertEqual(len(result.optimal_point), 4)
+
+if __name__ == '__main__':
+    unittest.main()
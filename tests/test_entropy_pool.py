@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+from quantum.entropy_pool import NumpyBitSampler, QuantumEntropyPool, shared_entropy_pool
+
+class CountingSampler:
+    """Deterministic sampler that records how many bits were requested."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, n_bits):
+        self.requests.append(n_bits)
+        return (np.arange(n_bits) % 3 == 0).astype(np.uint8)
+
+class TestQuantumEntropyPool(unittest.TestCase):
+
+    def test_bits_are_served_in_sampler_order(self):
+        sampler = CountingSampler()
+        pool = QuantumEntropyPool(sampler, capacity=64, background=False)
+        bits = np.concatenate([pool.take_bits(5), pool.take_bits(11), [int(pool.coin_flip())]])
+        np.testing.assert_array_equal(bits, (np.arange(17) % 3 == 0).astype(np.uint8))
+        self.assertEqual(sampler.requests, [64])
+        self.assertEqual(pool.available(), 64 - 17)
+
+    def test_one_job_serves_many_decisions(self):
+        sampler = CountingSampler()
+        pool = QuantumEntropyPool(sampler, capacity=1024, low_water=0.0, background=False)
+        for _ in range(1000):
+            pool.coin_flip()
+        self.assertEqual(len(sampler.requests), 1)
+
+    def test_low_water_mark_triggers_background_refill(self):
+        sampler = CountingSampler()
+        pool = QuantumEntropyPool(sampler, capacity=100, low_water=0.5)
+        pool.take_bits(60)
+        pool._refill_thread.join()
+        self.assertEqual(pool.available(), 100)
+        self.assertEqual(sampler.requests, [100, 60])
+
+    def test_large_requests_refill_synchronously(self):
+        pool = QuantumEntropyPool(NumpyBitSampler(seed=3), capacity=32, background=False)
+        bits = pool.take_bits(1000)
+        self.assertEqual(len(bits), 1000)
+        self.assertTrue(0.4 < bits.mean() < 0.6)
+
+    def test_random_integers_in_range(self):
+        pool = QuantumEntropyPool(NumpyBitSampler(seed=1), background=False)
+        values = pool.random_integers(4, 500)
+        self.assertTrue(np.all((values >= 0) & (values < 16)))
+
+    def test_shared_pools_are_keyed_by_sampler_type(self):
+        default = shared_entropy_pool(background=False)
+        counting = shared_entropy_pool(CountingSampler(), background=False)
+        self.assertIsInstance(default.sampler, NumpyBitSampler)
+        self.assertIsInstance(counting.sampler, CountingSampler)
+        self.assertIs(shared_entropy_pool(CountingSampler()), counting)
+        self.assertIs(shared_entropy_pool(NumpyBitSampler()), default)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+from agents.quantum_agent import QuantumAgent
+from quantum.circuit_ops import two_local_ops
+from quantum.execution_service import CircuitExecutionService
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+class TestCircuitExecutionService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = CircuitExecutionService(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.close()
+
+    def test_statevectors_match_local_backend(self):
+        ops = two_local_ops(3, reps=1)
+        parameters = np.random.default_rng(0).uniform(-np.pi, np.pi, (4, 12))
+        future = self.service.submit_statevectors(ops, 3, parameters)
+        expected = NumpyStatevectorBackend().statevectors(ops, 3, parameters)
+        np.testing.assert_allclose(future.result(timeout=60), expected, atol=1e-12)
+
+    def test_counts_follow_measurement_map(self):
+        ops = [("x", (1,), ()), ("measure", (1,), (0,))]
+        counts = self.service.submit_counts(ops, 2, shots=50).result(timeout=60)
+        self.assertEqual(counts, [{"1": 50}])
+
+    def test_concurrent_submissions_and_metrics(self):
+        ops = [("ry", (0,), (None,)), ("cx", (0, 1), ())]
+        futures = [self.service.submit_probabilities(ops, 2, [[theta]]) for theta in np.linspace(0, np.pi, 8)]
+        probabilities = np.vstack([f.result(timeout=60) for f in futures])
+        np.testing.assert_allclose(probabilities[:, 0] + probabilities[:, 3], 1.0)
+        metrics = self.service.metrics()
+        self.assertEqual(metrics["pool_size"], 2)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreaterEqual(metrics["completed"], 8)
+
+    def test_worker_errors_reach_the_future(self):
+        future = self.service.submit_probabilities([("rx", (0,), (None,))], 1, np.zeros((1, 0)))
+        with self.assertRaisesRegex(ValueError, "free parameter slots"):
+            future.result(timeout=60)
+        with self.assertRaises(ValueError):
+            self.service.submit("unitary", [], 1)
+
+    def test_agent_decisions_through_service(self):
+        agent = QuantumAgent(circuit_size=3, backend="numpy", execution_service=self.service)
+        batch = [[1, 1, 1], [0, 0, 0], [1, 0, 0], [0, 1, 1]]
+        future = agent.submit_decisions(batch, shots=64)
+        np.testing.assert_allclose(future.result(timeout=60), [1.0, 0.0, 1 / 3, 2 / 3])
+        local = QuantumAgent(circuit_size=3, backend="numpy")
+        np.testing.assert_allclose(agent.make_decisions(batch, shots=64), local.make_decisions(batch, shots=64))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import numpy as np
+import optimization_path  # noqa: F401  (registers the optimization package)
+from optimization.gradient_engine import GradientDescentEngine
+
+A = np.array([[3.0, 1.0], [1.0, 2.0]])
+B = np.array([1.0, -1.0])
+
+
+def quadratic(points):
+    """0.5 x^T A x - b^T x for a batch of points (or a single point)."""
+    points = np.asarray(points, dtype=float)
+    return 0.5 * np.einsum("...i,ij,...j->...", points, A, points) - points @ B
+
+
+def quadratic_gradient(points):
+    return np.asarray(points, dtype=float) @ A - B
+
+
+class TestGradientDescentEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.minimum = np.linalg.solve(A, B)
+        self.starts = np.array([[5.0, 5.0], [-3.0, 4.0], [0.0, 0.0]])
+
+    def test_step_rules_converge_on_quadratic(self):
+        for rule, learning_rate in [("sgd", 0.1), ("momentum", 0.05), ("adam", 0.05), ("bb", 0.1)]:
+            with self.subTest(rule=rule):
+                engine = GradientDescentEngine(rule, learning_rate=learning_rate, max_iter=5000)
+                result = engine.minimize(quadratic, quadratic_gradient, self.starts)
+                self.assertTrue(result["converged"].all())
+                self.assertTrue(np.all(result["iterations"] < 5000))
+                np.testing.assert_allclose(result["points"], np.tile(self.minimum, (3, 1)), atol=1e-5)
+                self.assertAlmostEqual(result["value"], float(quadratic(self.minimum)))
+
+    def test_barzilai_borwein_needs_fewer_iterations(self):
+        sgd = GradientDescentEngine("sgd", learning_rate=0.1).minimize(quadratic, quadratic_gradient, self.starts)
+        bb = GradientDescentEngine("bb", learning_rate=0.1).minimize(quadratic, quadratic_gradient, self.starts)
+        self.assertLess(bb["iterations"].max(), sgd["iterations"].min())
+
+    def test_initial_points_are_not_modified(self):
+        starts = self.starts.copy()
+        GradientDescentEngine("adam", learning_rate=0.05).minimize(quadratic, quadratic_gradient, starts)
+        np.testing.assert_array_equal(starts, self.starts)
+
+    def test_non_vectorized_objective_in_worker_processes(self):
+        engine = GradientDescentEngine("sgd", learning_rate=0.1)
+        local = engine.minimize(quadratic, quadratic_gradient, self.starts, vectorized=False)
+        pooled = engine.minimize(quadratic, quadratic_gradient, self.starts, vectorized=False, n_jobs=2)
+        np.testing.assert_allclose(pooled["points"], local["points"])
+        np.testing.assert_array_equal(pooled["iterations"], local["iterations"])
+
+    def test_unknown_step_rule(self):
+        with self.assertRaises(ValueError):
+            GradientDescentEngine("newton")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import numpy as np
+import optimization_path  # noqa: F401  (registers the optimization package)
+from optimization.gradient_estimators import FiniteDifferenceGradient, SPSAGradient, make_gradient
+
+
+def objective(points):
+    points = np.asarray(points, dtype=float)
+    return np.sum(np.sin(points), axis=-1) + points[..., 0] * points[..., 1]
+
+
+def analytic_gradient(point):
+    return np.cos(point) + np.array([point[1], point[0], 0.0])
+
+
+class TestGradientEstimators(unittest.TestCase):
+
+    def setUp(self):
+        self.x = np.array([0.3, -0.7, 1.1])
+
+    def test_finite_differences_match_analytic_gradient(self):
+        for vectorized in (True, False):
+            estimator = FiniteDifferenceGradient(objective, epsilon=1e-5, vectorized=vectorized)
+            np.testing.assert_allclose(estimator(self.x), analytic_gradient(self.x), atol=1e-8)
+            self.assertEqual(estimator.evaluations, 6)
+
+    def test_finite_differences_on_a_batch(self):
+        points = np.random.default_rng(0).normal(size=(4, 3))
+        estimator = FiniteDifferenceGradient(objective, vectorized=True)
+        expected = np.array([analytic_gradient(p) for p in points])
+        np.testing.assert_allclose(estimator(points), expected, atol=1e-6)
+        self.assertEqual(estimator.evaluations, 4 * 6)
+
+    def test_spsa_is_unbiased(self):
+        # Averaged over many random directions, SPSA estimates approach the gradient
+        estimator = SPSAGradient(objective, c=0.01, vectorized=True, seed=0)
+        estimates = estimator(np.tile(self.x, (20000, 1)))
+        np.testing.assert_allclose(estimates.mean(axis=0), analytic_gradient(self.x), atol=0.05)
+        self.assertEqual(estimator.evaluations, 2 * 20000)
+
+    def test_spsa_is_exact_in_one_dimension(self):
+        estimator = SPSAGradient(lambda p: float(np.sin(p[0])), c=1e-4, seed=1)
+        self.assertAlmostEqual(float(estimator(np.array([0.4]))[0]), np.cos(0.4), places=6)
+
+    def test_spsa_counts_calls_and_evaluations(self):
+        estimator = SPSAGradient(objective, c=0.2, gamma=0.5, vectorized=True, seed=0)
+        for _ in range(3):
+            estimator(self.x)
+        self.assertEqual(estimator.calls, 3)
+        self.assertEqual(estimator.evaluations, 6)
+
+    def test_make_gradient(self):
+        self.assertIsInstance(make_gradient(objective, "fd"), FiniteDifferenceGradient)
+        self.assertIsInstance(make_gradient(objective, "spsa", seed=0), SPSAGradient)
+        with self.assertRaises(ValueError):
+            make_gradient(objective, "adjoint")
+
+
+if __name__ == '__main__':
+    unittest.main()
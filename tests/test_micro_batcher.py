@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+import numpy as np
+from agents.micro_batcher import MicroBatcher
+
+class TestMicroBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def predict(self, batch):
+        self.calls.append(len(batch))
+        time.sleep(0.005)  # Per-call overhead that batching amortizes
+        return batch.sum(axis=1)
+
+    def test_single_request_waits_at_most_latency(self):
+        batcher = MicroBatcher(self.predict, max_batch_size=8, max_latency_ms=5)
+        self.assertEqual(batcher.predict([1.0, 2.0], timeout=5), 3.0)
+        batcher.close()
+        self.assertEqual(self.calls, [1])
+
+    def test_concurrent_requests_share_batches(self):
+        batcher = MicroBatcher(self.predict, max_batch_size=16, max_latency_ms=20)
+        rows = np.random.default_rng(0).uniform(size=(64, 3))
+        results = [None] * len(rows)
+
+        def call(i):
+            results[i] = batcher.predict(rows[i], timeout=5)
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(len(rows))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+
+        np.testing.assert_allclose(results, rows.sum(axis=1))
+        self.assertLessEqual(max(self.calls), 16)
+        self.assertLess(len(self.calls), len(rows))
+        stats = batcher.stats()
+        self.assertEqual((stats["batches"], stats["items"]), (len(self.calls), len(rows)))
+
+    def test_errors_reach_every_caller(self):
+        def failing(batch):
+            raise ValueError("model not fitted")
+        batcher = MicroBatcher(failing, max_latency_ms=1)
+        with self.assertRaises(ValueError):
+            batcher.predict([1.0], timeout=5)
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit([1.0])
+
+    def test_short_predictions_fail_every_caller(self):
+        batcher = MicroBatcher(lambda batch: batch[:-1].sum(axis=1), max_batch_size=4, max_latency_ms=50)
+        futures = [batcher.submit([float(i)]) for i in range(4)]
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+        scalar = MicroBatcher(lambda batch: 0.0, max_latency_ms=1)
+        with self.assertRaises(ValueError):
+            scalar.predict([1.0], timeout=5)
+        batcher.close()
+        scalar.close()
+
+if __name__ == '__main__':
+    unittest.main()
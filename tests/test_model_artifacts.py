@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from sklearn.neural_network import MLPClassifier
+from agents.hybrid_agent import HybridAgent
+from ml.model_artifacts import ModelRegistry, list_versions, load_metadata, load_model, model_registry, save_model
+
+class TestModelArtifacts(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.model_dir = os.path.join(self.directory.name, "hybrid")
+        rng = np.random.default_rng(0)
+        self.X = rng.uniform(size=(100, 3))
+        self.y = (self.X.sum(axis=1) > 1.5).astype(int)
+        self.model = MLPClassifier(hidden_layer_sizes=(8,), max_iter=2000, random_state=0).fit(self.X, self.y)
+
+    def tearDown(self):
+        model_registry.clear()
+        self.directory.cleanup()
+
+    def test_latest_version_is_numeric(self):
+        for version in ("2", "10", "9"):
+            save_model(self.model, self.model_dir, version)
+        self.assertEqual(list_versions(self.model_dir), ["2", "9", "10"])
+        self.assertEqual(load_metadata(self.model_dir)["version"], "10")
+        with self.assertRaises(FileExistsError):
+            save_model(self.model, self.model_dir, "10")
+        with self.assertRaises(FileNotFoundError):
+            load_model(self.model_dir, "11")
+
+    def test_weights_are_memory_mapped(self):
+        save_model(self.model, self.model_dir, "1")
+        loaded = load_model(self.model_dir)
+        self.assertIsInstance(loaded.coefs_[0], np.memmap)
+        np.testing.assert_array_equal(loaded.predict(self.X), self.model.predict(self.X))
+
+    def test_registry_shares_one_model(self):
+        save_model(self.model, self.model_dir, "1")
+        registry = ModelRegistry()
+        self.assertIs(registry.get(self.model_dir), registry.get(self.model_dir, "1"))
+        self.assertEqual(registry.loads, 1)
+
+    def test_hybrid_agents_share_model_and_defer_solana(self):
+        save_model(self.model, self.model_dir, "1")
+        first = HybridAgent(3, "http://localhost:8899", model_path=self.model_dir)
+        second = HybridAgent(3, "http://localhost:8899", model_path=self.model_dir)
+        self.assertIs(first.model, second.model)
+        self.assertIsNone(first._solana_agent)
+        np.testing.assert_array_equal(first.make_decisions(self.X[:5]), self.model.predict(self.X[:5]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import types
+import unittest
+from multiprocessing import shared_memory
+from quantum.parameter_sweep import ParameterSweep, sweep_tasks
+
+HAMILTONIAN = [("ZZI", 1.0), ("IZZ", 1.0), ("ZIZ", 0.5), ("ZII", -0.3)]
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    def test_results_stream_for_every_task(self):
+        tasks = sweep_tasks(depths=(1, 2), seeds=(0, 1))
+        with ParameterSweep(HAMILTONIAN, max_workers=2, maxiter=30) as sweep:
+            results = sweep.run(tasks)
+            self.assertIsInstance(results, types.GeneratorType)
+            first = next(results)
+            results = [first] + list(results)
+        self.assertEqual(len(results), len(tasks))
+        self.assertTrue(all(not r["cancelled"] and r["evaluations"] > 0 for r in results))
+        self.assertCountEqual([r["task"]["seed"] for r in results], [0, 0, 1, 1])
+
+    def test_target_energy_cancels_remaining_tasks(self):
+        tasks = sweep_tasks(depths=(1,), seeds=range(12))
+        with ParameterSweep(HAMILTONIAN, max_workers=1, maxiter=30) as sweep:
+            results = list(sweep.run(tasks, target_energy=10.0))
+            self.assertEqual(len(results), len(tasks))
+            self.assertFalse(results[0]["cancelled"])
+            self.assertTrue(any(r["cancelled"] for r in results))
+            # The stop flag is reset for the next run
+            self.assertFalse(any(r["cancelled"] for r in sweep.run(tasks[:2])))
+
+    def test_one_run_at_a_time(self):
+        tasks = sweep_tasks(depths=(1,), seeds=range(4))
+        with ParameterSweep(HAMILTONIAN, max_workers=1, maxiter=10) as sweep:
+            first = sweep.run(tasks, target_energy=10.0)
+            next(first)
+            with self.assertRaises(RuntimeError):
+                next(sweep.run(tasks))
+            first.close()  # Ends the first run, cancelling what it left queued
+            results = list(sweep.run(tasks[:2]))
+        self.assertFalse(any(r["cancelled"] for r in results))
+
+    def test_close_unlinks_shared_memory(self):
+        sweep = ParameterSweep(HAMILTONIAN, max_workers=1, maxiter=5)
+        name = sweep._shm.name
+        sweep.best(sweep_tasks())
+        sweep.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "needs a /dev/shm listing")
+    def test_failed_pool_start_unlinks_shared_memory(self):
+        before = set(os.listdir("/dev/shm"))
+        with self.assertRaises(ValueError):
+            ParameterSweep(HAMILTONIAN, max_workers=0)
+        self.assertEqual(set(os.listdir("/dev/shm")), before)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import numpy as np
+from quantum.circuit_ops import two_local_ops
+from quantum.hamiltonians import pauli_expectation, pauli_masks
+from quantum.pauli_grouping import GroupedExpectationEstimator, group_qubit_wise_commuting
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+class TestPauliGrouping(unittest.TestCase):
+
+    def setUp(self):
+        self.hamiltonian = [("ZZ", 1.0), ("ZI", 0.5), ("IZ", -0.3), ("XX", 0.7), ("XI", 0.2), ("YY", -0.4), ("II", 1.5)]
+
+    def test_groups_are_qubit_wise_commuting(self):
+        groups = group_qubit_wise_commuting(self.hamiltonian)
+        bases = sorted(g["basis"] for g in groups if g["basis"] is not None)
+        self.assertEqual(bases, ["XX", "YY", "ZZ"])
+        self.assertEqual(sum(len(g["terms"]) for g in groups), len(self.hamiltonian))
+
+    def test_grouped_estimate_matches_exact_expectation(self):
+        backend = NumpyStatevectorBackend(seed=11)
+        estimator = GroupedExpectationEstimator(backend, shots=50000)
+        ops = two_local_ops(2, reps=1)
+        params = np.random.default_rng(5).uniform(-np.pi, np.pi, (1, 8))
+
+        estimate = estimator.estimate_ops(ops, 2, self.hamiltonian, params)
+        state = backend.statevectors(ops, 2, params)[0]
+        self.assertAlmostEqual(estimate, pauli_expectation(state, pauli_masks(self.hamiltonian)), delta=0.05)
+        self.assertEqual(estimator.last_circuits, 3)
+
+        estimator.estimate_ops(ops, 2, self.hamiltonian, params)
+        self.assertEqual(len(estimator._groups), 1)
+        self.assertEqual(estimator.circuits_executed, 6)
+
+if __name__ == '__main__':
+    unittest.main()
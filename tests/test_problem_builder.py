@@ -0,0 +1,63 @@
+import itertools
+import unittest
+import numpy as np
+import scipy.sparse
+from unittest import mock
+from quantum.hamiltonians import canonical_sparse_terms, diagonal_cost_vector, is_diagonal
+from quantum.problem_builder import IsingProblem
+
+class TestIsingProblem(unittest.TestCase):
+
+    def setUp(self):
+        self.qubo = {(0, 0): -1.0, (1, 1): 2.0, (0, 1): 3.0, (1, 0): -0.5, (2, 3): 1.5, (3, 3): -2.0}
+        self.assignments = np.array(list(itertools.product([0, 1], repeat=4)))
+
+    def qubo_energy(self, x):
+        return sum(v * x[i] * x[j] for (i, j), v in self.qubo.items())
+
+    def test_from_qubo_preserves_energies(self):
+        problem = IsingProblem.from_qubo(self.qubo)
+        expected = [self.qubo_energy(x) for x in self.assignments]
+        np.testing.assert_allclose(problem.energy(self.assignments), expected)
+
+    def test_dict_and_sparse_inputs_agree(self):
+        rows, cols = zip(*self.qubo.keys())
+        sparse = scipy.sparse.coo_matrix((list(self.qubo.values()), (rows, cols)), shape=(4, 4))
+        a, b = IsingProblem.from_qubo(self.qubo), IsingProblem.from_qubo(sparse.tocsr())
+        np.testing.assert_allclose(a.linear, b.linear)
+        np.testing.assert_allclose(a.coupling_values, b.coupling_values)
+        self.assertAlmostEqual(a.offset, b.offset)
+
+    def test_cost_vector_matches_pauli_terms(self):
+        problem = IsingProblem.from_ising({0: 0.5, 2: -1.0}, {(0, 1): 1.0, (2, 1): -0.3}, offset=0.25)
+        np.testing.assert_allclose(problem.cost_vector(), diagonal_cost_vector(problem.to_list()))
+
+    def test_cost_vector_indexes_measured_bitstrings(self):
+        problem = IsingProblem.from_qubo(self.qubo)
+        cost = problem.cost_vector()
+        for x in self.assignments:
+            index = int(sum(bit << q for q, bit in enumerate(x)))
+            self.assertAlmostEqual(cost[index], self.qubo_energy(x))
+
+    def test_large_problems_skip_dense_labels(self):
+        n = 2000
+        problem = IsingProblem.from_ising(np.ones(n), {(i, i + 1): -1.0 for i in range(n - 1)})
+        with mock.patch.object(IsingProblem, "to_list", side_effect=AssertionError("dense labels built")):
+            self.assertTrue(is_diagonal(problem))
+            terms = canonical_sparse_terms(problem)
+        self.assertEqual(len(terms), 2 * n - 1)
+        self.assertIn(("Z0 Z1", -1.0), terms)
+
+    def test_sparse_terms_match_dense_labels(self):
+        problem = IsingProblem.from_ising({0: 0.5, 2: -1.0}, {(0, 1): 1.0, (2, 1): -0.3}, offset=0.25)
+        self.assertEqual(canonical_sparse_terms(problem), canonical_sparse_terms(problem.to_list()))
+
+    def test_to_qubo_round_trip(self):
+        problem = IsingProblem.from_ising([0.5, -0.2, 0.0], {(0, 1): 1.0, (1, 2): -2.0}, offset=1.0)
+        qubo, offset = problem.to_qubo()
+        x = np.array(list(itertools.product([0, 1], repeat=3)), dtype=float)
+        energies = np.einsum("bi,ij,bj->b", x, qubo.toarray(), x) + offset
+        np.testing.assert_allclose(energies, problem.energy(x))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from quantum.product_state import ProductStateEvaluator
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+class TestProductStateEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = ProductStateEvaluator(rng=np.random.default_rng(3))
+
+    def test_marginals_match_statevector(self):
+        ops = [("h", (0,), ()), ("rx", (1,), (None,)), ("ry", (2,), (None,)), ("rz", (0,), (0.4,)), ("x", (2,), ())]
+        params = np.random.default_rng(0).uniform(0, np.pi, size=(8, 2))
+        probs = NumpyStatevectorBackend().probabilities(ops, 3, params)
+        basis = np.arange(8)
+        expected = np.stack([probs[:, (basis >> q) & 1 == 1].sum(axis=1) for q in range(3)], axis=1)
+        np.testing.assert_allclose(self.evaluator.marginals(ops, 3, params), expected, atol=1e-12)
+
+    def test_entangled_circuit_not_supported(self):
+        self.assertFalse(ProductStateEvaluator.supports([("h", (0,), ()), ("cx", (0, 1), ())]))
+        self.assertTrue(ProductStateEvaluator.supports([("rx", (0,), (None,)), ("measure", (0,), (0,))]))
+
+    def test_sample_counts(self):
+        shots = 20000
+        ops = [("rx", (0,), (None,)), ("rx", (1,), (None,)), ("measure", (1,), (0,))]
+        counts = self.evaluator.sample_counts(ops, 2, shots, [[np.pi, np.pi / 2], [0.0, np.pi]])
+        self.assertAlmostEqual(counts[0]['1'] / shots, 0.5, delta=0.02)
+        self.assertEqual(counts[1], {'1': shots})
+
+if __name__ == '__main__':
+    unittest.main()
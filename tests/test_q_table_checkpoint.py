@@ -0,0 +1,121 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from agents.q_table import QTable
+from agents.reinforcement_learning_agent import ReinforcementLearningAgent
+
+
+class TestQTableCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "q")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        table = QTable(3, initial_capacity=2)
+        table['a'] = [1.0, 2.0, 3.0]
+        table[('b', 1)] = [4.0, 5.0, 6.0]
+        table.intern('c')
+        self.assertEqual(table.checkpoint(self.path), 3)
+        loaded = QTable.load(self.path)
+        self.assertIsInstance(loaded.values, np.memmap)
+        self.assertEqual(loaded.keys(), ['a', ('b', 1), 'c'])
+        np.testing.assert_array_equal(loaded[('b', 1)], [4.0, 5.0, 6.0])
+        with self.assertRaises(ValueError):
+            loaded.values[0, 0] = 0.0  # Read-only mapping
+
+    def test_incremental_checkpoint_writes_dirty_rows_only(self):
+        table = QTable(2)
+        for state in range(100):
+            table.intern(state)
+        table.checkpoint(self.path)
+        table[5] = [1.0, 1.0]
+        table.intern(100)
+        self.assertEqual(table.checkpoint(self.path), 2)
+        self.assertEqual(table.checkpoint(self.path), 0)
+        loaded = QTable.load(self.path)
+        self.assertEqual(len(loaded), 101)
+        np.testing.assert_array_equal(loaded[5], [1.0, 1.0])
+
+    def test_growth_rewrites_file(self):
+        table = QTable(2, initial_capacity=4)
+        table['a'] = [1.0, 0.0]
+        table.checkpoint(self.path)
+        for state in range(10):
+            table.intern(state)
+        self.assertEqual(table.checkpoint(self.path), 11)
+        self.assertEqual(len(QTable.load(self.path)), 11)
+
+    def test_agent_resumes_from_writable_mapping(self):
+        agent = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.0, action_space=2)
+        agent.update_batch(['s', 't'], [0, 1], [1.0, 2.0], ['t', 's'])
+        agent.save_checkpoint(self.path)
+        resumed = ReinforcementLearningAgent.from_checkpoint(self.path, mmap_mode="r+",
+                                                             learning_rate=0.5, discount_factor=0.0)
+        resumed.update_q_value('s', 0, 1.0, 't')
+        self.assertEqual(resumed.save_checkpoint(self.path), 1)
+        reader = ReinforcementLearningAgent.from_checkpoint(self.path, epsilon=0.0)
+        self.assertAlmostEqual(reader.q_table['s'][0], 0.75)
+        self.assertEqual(reader.choose_action('t'), 1)
+        self.assertEqual(reader.choose_action('unseen'), 0)  # Unseen states get a zero row
+
+    def test_checkpoint_through_equivalent_path_keeps_writable_mapping(self):
+        table = QTable(2, initial_capacity=4)
+        table['a'] = [1.0, 0.0]
+        table.checkpoint(self.path)
+        loaded = QTable.load(self.path + os.sep, mmap_mode="r+")
+        loaded['a'] = [2.0, 0.0]
+        loaded.checkpoint(self.path)
+        loaded['a'] = [3.0, 0.0]
+        loaded.checkpoint(os.path.join(self.tmp.name, ".", "q"))
+        np.testing.assert_array_equal(QTable.load(self.path)['a'], [3.0, 0.0])
+
+    def test_rewrite_remaps_values(self):
+        table = QTable(2, initial_capacity=4)
+        table['a'] = [1.0, 0.0]
+        table.checkpoint(self.path)
+        reader = QTable.load(self.path)
+        self.assertEqual(reader.checkpoint(self.path), 1)  # Not the table's checkpoint: full rewrite
+        self.assertIsInstance(reader.values, np.memmap)
+        self.assertEqual(os.stat(reader.values.filename).st_ino,
+                         os.stat(os.path.join(self.path, "values.npy")).st_ino)
+
+    def test_items_are_read_only(self):
+        table = QTable(2)
+        table['a'] = [1.0, 0.0]
+        with self.assertRaises(ValueError):
+            table['a'][0] = 5.0
+        table.values[table.get_row('a'), 0] = 5.0
+        table.mark_dirty(table.get_row('a'))
+        table.checkpoint(self.path)
+        np.testing.assert_array_equal(QTable.load(self.path)['a'], [5.0, 0.0])
+
+    def test_interrupted_checkpoints_are_ignored(self):
+        table = QTable(2, initial_capacity=4)
+        table['a'] = [1.0, 0.0]
+        table.checkpoint(self.path)
+        with open(os.path.join(self.path, "states.pkl"), "ab") as file:
+            file.write(pickle.dumps(['torn'])[:-3])  # Append cut short by a crash
+        resumed = QTable.load(self.path, mmap_mode="r+")
+        self.assertEqual(resumed.keys(), ['a'])
+        resumed['b'] = [0.0, 1.0]
+        resumed.checkpoint(self.path)
+        self.assertEqual(QTable.load(self.path).keys(), ['a', 'b'])
+
+        # Crash after a rewritten state file was renamed into place but before the metadata was
+        with open(os.path.join(self.path, "states.pkl"), "wb") as file:
+            pickle.dump(['a', 'b', 'c'], file)
+        resumed = QTable.load(self.path, mmap_mode="r+")
+        self.assertEqual(resumed.keys(), ['a', 'b'])
+        resumed.intern('d')
+        resumed.checkpoint(self.path)
+        self.assertEqual(QTable.load(self.path).keys(), ['a', 'b', 'd'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from agents.quantum_agent import QuantumAgent
+
+
+class TestQuantumAgentNumpyBackend(unittest.TestCase):
+
+    def test_numpy_backend_runs_without_qiskit(self):
+        agent = QuantumAgent(circuit_size=3, backend="numpy")
+        decisions = agent.make_decisions([[1, 0, 0], [0, 1, 1]], shots=32)
+        self.assertEqual(decisions.shape, (2,))
+        self.assertIsNone(agent.real_backend)
+
+    def test_decisions_depend_on_input(self):
+        agent = QuantumAgent(circuit_size=3, backend="numpy")
+        decisions = agent.make_decisions([[1, 1, 1], [0, 0, 0], [1, 0, 0], [0.9, 0.8, 0.1]], shots=64)
+        np.testing.assert_allclose(decisions, [1.0, 0.0, 1 / 3, 2 / 3])
+        self.assertAlmostEqual(agent.make_decision([0, 1, 0]), 1 / 3)
+
+    def test_decision_from_counts(self):
+        self.assertAlmostEqual(QuantumAgent._decision_from_counts({'0': 3, '1': 1}), 0.25)
+        self.assertAlmostEqual(QuantumAgent._decision_from_counts({'110': 2, '000': 2}), 1 / 3)
+        self.assertAlmostEqual(QuantumAgent._decision_from_counts({'1 01': 4}), 2 / 3)
+        self.assertEqual(QuantumAgent._decision_from_counts({}), 0.0)
+
+    def test_adaptive_decisions_spend_shots_on_rows_near_threshold(self):
+        agent = QuantumAgent(circuit_size=4, backend="numpy")
+        # Decision values 1.0, 0.0, 0.75 and 0.5 against a threshold of 0.5
+        batch = [[1, 1, 1, 1], [0, 0, 0, 0], [1, 1, 1, 0], [1, 1, 0, 0]]
+        result = agent.make_adaptive_decisions(batch, threshold=0.5, initial_shots=16, max_shots=1024)
+        np.testing.assert_allclose(result.estimates, [1.0, 0.0, 0.75, 0.5])
+        np.testing.assert_array_equal(result.decided, [True, True, True, False])
+        np.testing.assert_array_equal(result.above, [True, False, True, False])
+        self.assertEqual(result.shots[0], 16)
+        self.assertEqual(result.shots[1], 16)
+        self.assertGreater(result.shots[2], 16)
+        self.assertLess(result.shots[2], 1024)
+        self.assertEqual(result.shots[3], 1024)  # Sits on the threshold, so it never clears it
+
+    def test_adaptive_decision_matches_fixed_shot_decision(self):
+        agent = QuantumAgent(circuit_size=3, backend="numpy")
+        decision, shots = agent.make_adaptive_decision([1, 0, 0], threshold=0.8, initial_shots=8)
+        self.assertAlmostEqual(decision, agent.make_decision([1, 0, 0]))
+        self.assertLess(shots, 4096)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import itertools
+import unittest
+import numpy as np
+import optimization_path  # noqa: F401  (registers the optimization package)
+from optimization.qubo_annealer import QUBOAnnealer
+
+
+def brute_force(qubo: np.ndarray) -> tuple:
+    states = np.array(list(itertools.product([0, 1], repeat=len(qubo))), dtype=float)
+    energies = np.einsum("bi,ij,bj->b", states, qubo, states)
+    best = int(np.argmin(energies))
+    return states[best], energies[best]
+
+
+class TestQUBOAnnealer(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.dense = rng.normal(size=(10, 10))
+        # Sparse ring with a few chords, given as a dict with both (i, j) and (j, i) entries
+        n = 12
+        self.sparse = {(i, i): rng.normal() for i in range(n)}
+        for i in range(n):
+            self.sparse[(i, (i + 1) % n)] = rng.normal()
+        self.sparse[(3, 0)] = rng.normal()
+        self.sparse[(8, 2)] = rng.normal()
+        self.sparse_dense = np.zeros((n, n))
+        for (i, j), value in self.sparse.items():
+            self.sparse_dense[i, j] += value
+
+    def test_energy_matches_quadratic_form(self):
+        annealer = QUBOAnnealer(self.dense)
+        x = np.random.default_rng(0).integers(0, 2, size=(20, 10))
+        np.testing.assert_allclose(annealer.energy(x), np.einsum("bi,ij,bj->b", x, self.dense, x))
+
+    def test_flip_deltas_match_energy_differences(self):
+        annealer = QUBOAnnealer(self.sparse)
+        x = np.random.default_rng(1).integers(0, 2, size=12)
+        fields = annealer.local_fields(x)
+        for i in range(12):
+            flipped = x.copy()
+            flipped[i] ^= 1
+            delta = (1 - 2 * x[i]) * (annealer.linear[i] + fields[i])
+            self.assertAlmostEqual(delta, annealer.energy(flipped) - annealer.energy(x))
+
+    def test_color_classes_are_independent_sets(self):
+        annealer = QUBOAnnealer(self.sparse)
+        classes = annealer.color_classes()
+        covered = np.sort(np.concatenate([variables for variables, _ in classes]))
+        np.testing.assert_array_equal(covered, np.arange(12))
+        coupled = self.sparse_dense + self.sparse_dense.T
+        for variables, _ in classes:
+            block = coupled[np.ix_(variables, variables)]
+            self.assertTrue(np.allclose(block - np.diag(np.diag(block)), 0))
+
+    def test_sequential_sweeps_reach_brute_force_minimum(self):
+        annealer = QUBOAnnealer(self.dense)
+        x, energy = annealer.anneal(num_sweeps=300, num_reads=4, seed=0)
+        expected_x, expected_energy = brute_force(self.dense)
+        self.assertAlmostEqual(energy, expected_energy)
+        self.assertAlmostEqual(float(annealer.energy(x)), energy)  # Incremental energy stayed exact
+
+    def test_color_class_sweeps_reach_brute_force_minimum(self):
+        annealer = QUBOAnnealer(self.sparse)
+        annealer.MIN_CLASS_SIZE = 1  # Force the array path on this small problem
+        x, energy = annealer.anneal(num_sweeps=300, num_reads=4, seed=0)
+        _, expected_energy = brute_force(self.sparse_dense)
+        self.assertAlmostEqual(energy, expected_energy)
+        self.assertAlmostEqual(float(annealer.energy(x)), energy)
+
+    def test_initial_state_is_respected(self):
+        annealer = QUBOAnnealer(self.sparse)
+        annealer.MIN_CLASS_SIZE = 1
+        start = np.ones(12, dtype=np.int8)
+        x, energy = annealer.anneal(num_sweeps=1, temp_range=(1e-9, 1e-9), initial_state=start, seed=0)
+        self.assertLessEqual(energy, float(annealer.energy(start)))
+
+
+if __name__ == '__main__':
+    unittest.main()
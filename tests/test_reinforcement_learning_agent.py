@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from agents.reinforcement_learning_agent import ReinforcementLearningAgent
 
 class TestReinforcementLearningAgent(unittest.TestCase):
@@ -13,5 +14,51 @@ class TestReinforcementLearningAgent(unittest.TestCase):
         agent.update_q_value('state1', 0, 1, 'state2')
         self.assertTrue('state1' in agent.q_table)
 
+    def test_update_uses_best_next_value(self):
+        agent = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.9)
+        agent.q_table['state2'] = [0.0, 2.0]
+        agent.update_q_value('state1', 1, 1, 'state2')
+        self.assertAlmostEqual(agent.q_table['state1'][1], 0.5 * (1 + 0.9 * 2.0))
+        self.assertEqual(agent.q_table['state1'][0], 0.0)
+
+    def test_q_table_grows_and_keeps_values(self):
+        agent = ReinforcementLearningAgent(action_space=3, dtype=np.float32)
+        for i in range(5000):
+            agent.update_q_value(i, i % 3, 1.0, i + 1)
+        self.assertEqual(len(agent.q_table), 5001)
+        self.assertEqual(agent.q_table.values.dtype, np.float32)
+        self.assertAlmostEqual(float(agent.q_table[0][0]), 0.1)
+
+    def test_choose_actions_is_greedy_without_exploration(self):
+        agent = ReinforcementLearningAgent(action_space=3, epsilon=0.0)
+        agent.q_table['a'] = [0.0, 0.0, 1.0]
+        agent.q_table['b'] = [0.0, 1.0, 0.0]
+        self.assertEqual(agent.choose_actions(['a', 'b', 'a']).tolist(), [2, 1, 2])
+
+    def test_update_batch_matches_sequential_updates_for_distinct_pairs(self):
+        batch = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.9)
+        single = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.9)
+        for agent in (batch, single):
+            agent.q_table['s3'] = [0.0, 2.0]
+        batch.update_batch(['s1', 's2'], [0, 1], [1.0, -1.0], ['s3', 's3'])
+        single.update_q_value('s1', 0, 1.0, 's3')
+        single.update_q_value('s2', 1, -1.0, 's3')
+        for state in ('s1', 's2'):
+            np.testing.assert_allclose(batch.q_table[state], single.q_table[state])
+
+    def test_update_batch_averages_duplicate_pairs(self):
+        agent = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.0)
+        agent.update_batch(['s', 's', 's'], [1, 1, 0], [1.0, 3.0, 4.0], ['t', 't', 't'])
+        np.testing.assert_allclose(agent.q_table['s'], [2.0, 1.0])
+
+    def test_replay_learns_from_memory(self):
+        agent = ReinforcementLearningAgent(learning_rate=0.5, discount_factor=0.0, replay_capacity=8, seed=0)
+        agent.update_batch(['s'], [0], [1.0], ['t'])
+        self.assertEqual(len(agent.memory), 1)
+        agent.replay(batch_size=4)
+        self.assertAlmostEqual(agent.q_table['s'][0], 0.75)
+        with self.assertRaises(RuntimeError):
+            ReinforcementLearningAgent().replay()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
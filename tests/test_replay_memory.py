@@ -0,0 +1,38 @@
+import unittest
+import numpy as np
+from agents.replay_memory import ReplayMemory
+
+
+class TestReplayMemory(unittest.TestCase):
+
+    def test_wraps_around_and_keeps_newest(self):
+        memory = ReplayMemory(4)
+        memory.add_batch(np.arange(3), [0, 1, 0], [0.0, 1.0, 2.0], np.arange(1, 4))
+        memory.add_batch(np.arange(3, 6), [1, 0, 1], [3.0, 4.0, 5.0], np.arange(4, 7))
+        self.assertEqual(len(memory), 4)
+        self.assertEqual(sorted(memory.state_rows.tolist()), [2, 3, 4, 5])
+        np.testing.assert_array_equal(memory.next_state_rows - memory.state_rows, 1)
+
+    def test_oversized_batch_keeps_last_transitions(self):
+        memory = ReplayMemory(3)
+        memory.add_batch(np.arange(5), np.zeros(5), np.arange(5.0), np.arange(5))
+        self.assertEqual(sorted(memory.rewards.tolist()), [2.0, 3.0, 4.0])
+        memory.add(9, 1, 9.0, 9)
+        self.assertEqual(sorted(memory.rewards.tolist()), [3.0, 4.0, 9.0])
+
+    def test_sample(self):
+        memory = ReplayMemory(10, seed=1)
+        with self.assertRaises(ValueError):
+            memory.sample(2)
+        memory.add(7, 1, 0.5, 8)
+        state_rows, actions, rewards, next_state_rows = memory.sample(5)
+        self.assertEqual(state_rows.tolist(), [7] * 5)
+        self.assertEqual(rewards.tolist(), [0.5] * 5)
+
+    def test_rejects_non_positive_capacity(self):
+        with self.assertRaises(ValueError):
+            ReplayMemory(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from quantum.statevector_backend import NumpyStatevectorBackend
+
+class TestNumpyStatevectorBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = NumpyStatevectorBackend(seed=7)
+
+    def test_bell_state(self):
+        ops = [("h", (0,), ()), ("cx", (0, 1), ())]
+        probs = self.backend.probabilities(ops, 2)
+        np.testing.assert_allclose(probs, [[0.5, 0.0, 0.0, 0.5]], atol=1e-12)
+
+    def test_batched_rx_matches_closed_form(self):
+        thetas = np.linspace(0, np.pi, 16).reshape(-1, 1)
+        ops = [("rx", (1,), (None,))]
+        probs = self.backend.probabilities(ops, 2, thetas)
+        self.assertEqual(probs.shape, (16, 4))
+        np.testing.assert_allclose(probs[:, 2], np.sin(thetas[:, 0] / 2) ** 2, atol=1e-12)
+
+    def test_sample_counts_within_tolerance(self):
+        shots = 20000
+        ops = [("rx", (0,), (None,)), ("x", (1,), ()), ("measure", (0,), (0,))]
+        counts = self.backend.sample_counts(ops, 2, shots, [[np.pi / 3], [np.pi]])
+        self.assertEqual(sum(counts[0].values()), shots)
+        self.assertAlmostEqual(counts[0].get('1', 0) / shots, np.sin(np.pi / 6) ** 2, delta=0.02)
+        self.assertEqual(counts[1], {'1': shots})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import importlib.util
+import unittest
+from quantum.transpile_cache import TranspileCache, _backend_key, _freeze
+
+
+class _Configuration:
+    def __init__(self, basis_gates, coupling_map):
+        self.basis_gates = basis_gates
+        self.coupling_map = coupling_map
+
+
+class _BackendV1:
+    """Minimal stand-in exposing the BackendV1 attributes the cache key reads."""
+
+    def __init__(self, name, basis_gates, coupling_map):
+        self._name = name
+        self._configuration = _Configuration(basis_gates, coupling_map)
+
+    def name(self):
+        return self._name
+
+    def configuration(self):
+        return self._configuration
+
+
+class TestTranspileCacheKeys(unittest.TestCase):
+
+    def test_backend_key_includes_target(self):
+        line = _BackendV1("device", ["cx", "rz", "sx", "x"], [[0, 1], [1, 2]])
+        ring = _BackendV1("device", ["cx", "rz", "sx", "x"], [[0, 1], [1, 2], [2, 0]])
+        other_basis = _BackendV1("device", ["ecr", "rz", "sx", "x"], [[0, 1], [1, 2]])
+        same = _BackendV1("device", ["x", "sx", "rz", "cx"], [[1, 2], [0, 1]])
+        self.assertNotEqual(_backend_key(line), _backend_key(ring))
+        self.assertNotEqual(_backend_key(line), _backend_key(other_basis))
+        self.assertEqual(_backend_key(line), _backend_key(same))
+        hash(_backend_key(line))
+
+    def test_freeze_makes_options_hashable(self):
+        frozen = _freeze({"coupling_map": [[0, 1], [1, 2]], "basis_gates": ["cx", "u"], "seed": 7})
+        hash(frozen)
+        self.assertEqual(frozen, _freeze({"seed": 7, "basis_gates": ["cx", "u"], "coupling_map": [[0, 1], [1, 2]]}))
+        self.assertNotEqual(_freeze([[0, 1]]), _freeze([[1, 0]]))
+
+    @unittest.skipUnless(importlib.util.find_spec("qiskit"), "requires qiskit")
+    def test_cache_hits_with_list_options(self):
+        from qiskit import QuantumCircuit
+        cache = TranspileCache()
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        options = {"basis_gates": ["cx", "u"], "coupling_map": [[0, 1], [1, 0]]}
+        first = cache.transpile(circuit, None, **options)
+        second = cache.transpile(circuit.copy(), None, **options)
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    @unittest.skipUnless(importlib.util.find_spec("qiskit"), "requires qiskit")
+    def test_registers_are_part_of_the_key(self):
+        from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+        from quantum.transpile_cache import structure_key
+        one = QuantumCircuit(QuantumRegister(2, "q"), ClassicalRegister(2, "c"))
+        split = QuantumCircuit(QuantumRegister(1, "a"), QuantumRegister(1, "b"), ClassicalRegister(2, "c"))
+        self.assertNotEqual(structure_key(one), structure_key(split))
+
+    @unittest.skipUnless(importlib.util.find_spec("qiskit"), "requires qiskit")
+    def test_build_results_are_independent(self):
+        from quantum.circuits import QuantumCircuitBuilder
+        builder = QuantumCircuitBuilder(2, backend=None)
+        first = builder.build([])
+        first.measure_all()
+        second = builder.build([])
+        self.assertIsNot(first, second)
+        self.assertEqual(second.num_clbits, 0)
+        self.assertEqual(len(second.data), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
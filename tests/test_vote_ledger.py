@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+from agents.vote_ledger import NO, YES, VoteLedger
+
+
+class TestVoteLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.ledger = VoteLedger(quorum=0.5)
+        self.ledger.add_members([f"m{i}" for i in range(10)])
+        self.proposal = self.ledger.add_proposal("Fund the treasury")
+
+    def test_members_are_unique(self):
+        self.assertFalse(self.ledger.add_member("m3"))
+        self.assertTrue(self.ledger.add_member("m10"))
+        self.assertEqual(len(self.ledger.members), 11)
+        self.assertIn("m10", self.ledger.members)
+
+    def test_cast_and_change_vote(self):
+        self.assertTrue(self.ledger.cast_vote(self.proposal, "m0", True))
+        self.assertTrue(self.ledger.cast_vote(self.proposal, "m1", False))
+        self.assertEqual(self.ledger.tally(self.proposal), (1, 1))
+        self.ledger.cast_vote(self.proposal, "m1", True)
+        self.assertEqual(self.ledger.tally(self.proposal), (2, 0))
+        self.assertTrue(self.ledger.vote_of(self.proposal, "m1"))
+        self.assertIsNone(self.ledger.vote_of(self.proposal, "m2"))
+        self.assertFalse(self.ledger.cast_vote(self.proposal, "stranger", True))
+
+    def test_ingest_votes_keeps_last_vote_and_skips_non_members(self):
+        other = self.ledger.add_proposal("Change the logo")
+        recorded = self.ledger.ingest_votes([self.proposal, self.proposal, other, self.proposal, self.proposal],
+                                            ["m0", "m1", "m0", "m0", "stranger"],
+                                            [True, True, False, False, True])
+        self.assertEqual(recorded, 4)
+        self.assertEqual(self.ledger.tally(self.proposal), (1, 1))
+        self.assertEqual(self.ledger.tally(other), (0, 1))
+
+    def test_ingest_matches_individual_votes(self):
+        keys = [f"m{i % 10}" for i in range(40)]
+        votes = [(i * 7) % 3 == 0 for i in range(40)]
+        self.ledger.ingest_votes(self.proposal, keys, votes)
+        reference = VoteLedger()
+        reference.add_members([f"m{i}" for i in range(10)])
+        proposal = reference.add_proposal("Fund the treasury")
+        for key, vote in zip(keys, votes):
+            reference.cast_vote(proposal, key, vote)
+        self.assertEqual(self.ledger.tally(self.proposal), reference.tally(proposal))
+
+    def test_members_joining_after_proposal_can_vote(self):
+        self.ledger.add_members([f"late{i}" for i in range(100)])
+        self.ledger.ingest_votes(self.proposal, ["late99", "late0"], [True, True])
+        self.assertEqual(self.ledger.tally(self.proposal), (2, 0))
+
+    def test_quorum(self):
+        self.ledger.ingest_votes(self.proposal, [f"m{i}" for i in range(4)], [True] * 4)
+        self.assertFalse(self.ledger.has_quorum(self.proposal))
+        self.ledger.cast_vote(self.proposal, "m4", False)
+        self.assertTrue(self.ledger.has_quorum(self.proposal))
+        self.assertTrue(self.ledger.passed(self.proposal))
+
+    def test_unknown_proposal(self):
+        with self.assertRaises(ValueError):
+            self.ledger.tally(5)
+        with self.assertRaises(ValueError):
+            VoteLedger(quorum=1.5)
+
+    def test_invalid_batch_is_not_partly_applied(self):
+        other = self.ledger.add_proposal("p2")
+        with self.assertRaises(ValueError):
+            self.ledger.apply_votes(np.array([self.proposal, other, 7]), np.array([0, 1, 2]),
+                                    np.array([YES, YES, NO], dtype=np.int8))
+        with self.assertRaises(ValueError):
+            self.ledger.apply_votes(np.array([self.proposal, other]), np.array([0, 99]),
+                                    np.array([YES, YES], dtype=np.int8))
+        self.assertEqual(self.ledger.tally(self.proposal), (0, 0))
+        self.assertEqual(self.ledger.tally(other), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
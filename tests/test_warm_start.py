@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from quantum.problem_builder import IsingProblem
+from quantum.warm_start import WarmStartStore, hamiltonian_fingerprint, interpolate_qaoa_parameters
+
+class TestWarmStartStore(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "warm_start.json")
+        self.hamiltonian = [("ZZI", 1.0), ("IZZ", -0.5)]
+
+    def test_exact_and_near_repeats(self):
+        store = WarmStartStore(self.path, max_distance=0.5)
+        self.assertIsNone(store.lookup(self.hamiltonian, "qaoa", 2))
+        store.record(self.hamiltonian, [0.1, 0.2, 0.3, 0.4], -1.0, "qaoa", 2)
+
+        reloaded = WarmStartStore(self.path, max_distance=0.5)
+        np.testing.assert_allclose(reloaded.lookup([("IZZ", -0.5), ("ZZI", 1.0)], "qaoa", 2), [0.1, 0.2, 0.3, 0.4])
+        np.testing.assert_allclose(reloaded.lookup([("ZZI", 1.1), ("IZZ", -0.5)], "qaoa", 2), [0.1, 0.2, 0.3, 0.4])
+        self.assertIsNone(reloaded.lookup([("ZZI", 3.0), ("IZZ", -0.5)], "qaoa", 2))
+
+    def test_depth_interpolation(self):
+        store = WarmStartStore(self.path)
+        store.record(self.hamiltonian, [0.1, 0.2, 0.3, 0.4], -1.0, "qaoa", 2)
+        np.testing.assert_allclose(store.lookup(self.hamiltonian, "qaoa", 3), [0.1, 0.15, 0.2, 0.3, 0.35, 0.4])
+        betas, gammas = interpolate_qaoa_parameters([1.0], [2.0])
+        np.testing.assert_allclose(betas, [1.0, 1.0])
+        np.testing.assert_allclose(gammas, [2.0, 2.0])
+
+    def test_ising_problems_share_fingerprints_with_their_terms(self):
+        problem = IsingProblem.from_ising({0: 0.5}, {(0, 2): 1.0}, offset=0.25)
+        self.assertEqual(hamiltonian_fingerprint(problem)[0], hamiltonian_fingerprint(problem.to_list())[0])
+        self.assertNotEqual(hamiltonian_fingerprint([("ZI", 1.0)])[0], hamiltonian_fingerprint([("IZ", 1.0)])[0])
+
+    def test_lookups_are_persisted_for_eviction(self):
+        store = WarmStartStore(self.path, max_entries=2)
+        store.record([("Z", 1.0)], [1.0], 0.0, "TwoLocal")
+        store.record([("Z", 2.0)], [2.0], 0.0, "TwoLocal")
+        store.lookup([("Z", 1.0)], "TwoLocal")  # Now the most recently used
+        store.flush()
+        reloaded = WarmStartStore(self.path, max_entries=2)
+        reloaded.record([("Z", 3.0)], [3.0], 0.0, "TwoLocal")
+        self.assertIsNotNone(reloaded.lookup([("Z", 1.0)], "TwoLocal"))
+        self.assertIsNone(WarmStartStore(self.path, max_distance=0.0).lookup([("Z", 2.0)], "TwoLocal"))
+
+    def test_bounded_size(self):
+        store = WarmStartStore(self.path, max_entries=3)
+        for k in range(5):
+            store.record([("Z", float(k))], [k], 0.0, "TwoLocal")
+        self.assertEqual(len(WarmStartStore(self.path)), 3)
+
+if __name__ == '__main__':
+    unittest.main()
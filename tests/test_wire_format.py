@@ -0,0 +1,102 @@
+import mmap
+import pickle
+import struct
+import tempfile
+import unittest
+import numpy as np
+from quantum.circuit_ops import two_local_ops
+from quantum.wire_format import WireDecoder, decode, encode_ops, encode_parameters, template_id
+
+class TestWireFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.ops = [("h", (0,), ()), ("rx", (1,), (0.25,)), ("cx", (0, 1), ()), ("rz", (2,), (None,)),
+                    ("swap", (1, 2), ()), ("measure", (2,), (0,))]
+
+    def test_round_trip(self):
+        parameters = np.array([[0.1], [0.2]])
+        circuit = decode(encode_ops(self.ops, 3, parameters))
+        self.assertEqual(circuit.num_qubits, 3)
+        self.assertEqual(circuit.ops(), self.ops)
+        np.testing.assert_array_equal(circuit.parameters, parameters)
+
+    def test_float32_halves_parameter_block(self):
+        ops = two_local_ops(4, reps=3)
+        parameters = np.random.default_rng(0).uniform(size=(100, 32))
+        small, large = encode_ops(ops, 4, parameters, np.float32), encode_ops(ops, 4, parameters)
+        self.assertLess(len(small), 0.6 * len(large))
+        np.testing.assert_allclose(decode(small).parameters, parameters, rtol=1e-6)
+        self.assertLess(len(large), len(pickle.dumps((ops, parameters))))
+
+    def test_decoding_is_zero_copy(self):
+        buffer = bytearray(encode_ops(self.ops, 3, np.array([[0.5]])))
+        circuit = decode(memoryview(buffer))
+        self.assertFalse(circuit.parameters.flags.owndata)
+        buffer[-8:] = np.float64(1.5).tobytes()
+        self.assertEqual(circuit.parameters[0, 0], 1.5)
+
+    def test_decode_from_mmap(self):
+        message = encode_ops(self.ops, 3, np.array([[0.5]]))
+        with tempfile.TemporaryFile() as handle:
+            handle.write(message)
+            handle.flush()
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                circuit = decode(mapped)
+                self.assertEqual(circuit.ops(), self.ops)
+                del circuit
+
+    def test_template_mode_sends_only_parameters(self):
+        ops = two_local_ops(3, reps=2)
+        decoder = WireDecoder()
+        decoder.decode(encode_ops(ops, 3))
+        parameters = np.arange(18, dtype=float)[None, :]
+        message = encode_parameters(template_id(ops, 3), parameters)
+        circuit = decoder.decode(message)
+        self.assertEqual(circuit.ops(), ops)
+        np.testing.assert_array_equal(circuit.parameters, parameters)
+        self.assertEqual(len(message), 32 + parameters.nbytes)
+
+    def test_colliding_template_ids_are_refused(self):
+        ops = two_local_ops(3, reps=1)
+        identifier = template_id(ops, 3)
+        other = bytearray(encode_ops(self.ops, 3))
+        other[8:12] = struct.pack("<I", identifier)  # Forge a CRC collision with a different structure
+        decoder = WireDecoder()
+        decoder.decode(encode_ops(ops, 3))
+        decoder.decode(encode_ops(ops, 3, dtype=np.float32))  # Same template, other precision
+        self.assertIsNotNone(decoder.templates[identifier])
+        with self.assertLogs("quantum.wire_format", "WARNING"):
+            self.assertEqual(decoder.decode(bytes(other)).ops(), self.ops)
+        with self.assertRaises(ValueError):
+            decoder.decode(encode_parameters(identifier, np.zeros((1, 12))))
+
+    def test_template_cache_is_bounded(self):
+        decoder = WireDecoder(max_templates=2)
+        templates = [[("rx", (0,), (angle,))] for angle in (0.1, 0.2, 0.3)]
+        for ops in templates:
+            decoder.decode(encode_ops(ops, 1))
+        self.assertEqual(len(decoder.templates), 2)
+        with self.assertRaises(ValueError):
+            decoder.decode(encode_parameters(template_id(templates[0], 1), np.zeros((1, 0))))
+        circuit = decoder.decode(encode_parameters(template_id(templates[2], 1), np.zeros((1, 0))))
+        self.assertEqual(circuit.ops(), templates[2])
+
+    def test_rejects_parameter_matrix_of_wrong_width(self):
+        ops = two_local_ops(3, reps=1)
+        decoder = WireDecoder()
+        decoder.decode(encode_ops(ops, 3))
+        with self.assertRaisesRegex(ValueError, "5 columns.*12 free"):
+            decoder.decode(encode_parameters(template_id(ops, 3), np.zeros((2, 5))))
+        with self.assertRaisesRegex(ValueError, "2 columns.*1 free"):
+            decode(encode_ops(self.ops, 3, np.zeros((1, 2))))
+
+    def test_rejects_unknown_template_and_bad_header(self):
+        with self.assertRaises(ValueError):
+            decode(encode_parameters(1234, np.zeros((1, 2))))
+        with self.assertRaises(ValueError):
+            decode(b"NOPE" + bytes(28))
+        with self.assertRaises(ValueError):
+            encode_ops([("u3", (0,), (0.1, 0.2, 0.3))], 1)
+
+if __name__ == '__main__':
+    unittest.main()